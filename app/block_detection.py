@@ -0,0 +1,102 @@
+import re
+from urllib.parse import urlparse
+from app.rate_limiter import record_block
+
+SERVICE_NAMES = {
+    'linkedin': 'LinkedIn',
+    'bing': 'Bing',
+    'brave': 'Brave',
+    'google': 'Google',
+}
+
+# Returns a block reason for the page loaded in the Bing driver, or null.
+# An empty #b_results without Bing's own "no results" notice is a soft block.
+BING_BLOCK_SCRIPT = """
+if (/captcha|challenge/i.test(location.pathname)) return 'captcha';
+if (document.querySelector('#b_captcha, .b_captcha, iframe[src*="captcha"], iframe[src*="challenges.cloudflare.com"]')) return 'captcha';
+const results = document.getElementById('b_results');
+if (results && !results.querySelector('li.b_algo') && !results.querySelector('li.b_no, .b_no')) return 'empty b_results';
+return null;
+"""
+
+# The same checks on raw Bing HTML fetched without a browser
+BING_CAPTCHA_HTML = re.compile(r'id="b_captcha"|class="b_captcha|<iframe[^>]+(captcha|challenges\.cloudflare\.com)', re.IGNORECASE)
+BING_RESULT_HTML = re.compile(r'<li[^>]+class="b_algo\b')
+BING_NO_RESULTS_HTML = re.compile(r'class="b_no\b')
+
+# Returns a block reason for the page loaded in the LinkedIn driver, or null
+LINKEDIN_BLOCK_SCRIPT = """
+const path = location.pathname;
+if (path.startsWith('/authwall')) return 'authwall';
+if (path.startsWith('/checkpoint')) return 'checkpoint';
+if (path.startsWith('/login') || path.startsWith('/uas/login')) return 'logged out';
+if (/\\b429\\b|too many requests/i.test(document.title || '')) return 'HTTP 429';
+if (!document.querySelector('main') && document.body && /HTTP ERROR 429|Too Many Requests/i.test(document.body.innerText)) return 'HTTP 429';
+return null;
+"""
+
+
+class BlockedError(Exception):
+    """Raised when a service answers with a captcha, authwall or HTTP 429 instead of content"""
+
+    def __init__(self, service, reason):
+        self.service = service
+        self.reason = reason
+        super().__init__(f"Blocked by {SERVICE_NAMES.get(service, service)} ({reason})")
+
+
+def _page_block_reason(driver, script):
+    try:
+        return driver.execute_script(script)
+    except Exception:
+        # A page that can't be inspected is not evidence of a block
+        return None
+
+
+def bing_block_reason(driver):
+    """Return why the current Bing page is a block page, or None if it looks healthy"""
+    return _page_block_reason(driver, BING_BLOCK_SCRIPT)
+
+
+def bing_html_block_reason(html, url=""):
+    """Return why Bing HTML fetched over HTTP is a challenge page, or None if it looks healthy"""
+    if re.search(r"captcha|challenge", urlparse(url).path, re.IGNORECASE):
+        return 'captcha'
+    if BING_CAPTCHA_HTML.search(html):
+        return 'captcha'
+    if 'id="b_results"' not in html:
+        return 'no b_results'
+    if not BING_RESULT_HTML.search(html) and not BING_NO_RESULTS_HTML.search(html):
+        return 'empty b_results'
+    return None
+
+
+def linkedin_block_reason(driver):
+    """Return why the current LinkedIn page is a block page, or None if it looks healthy"""
+    return _page_block_reason(driver, LINKEDIN_BLOCK_SCRIPT)
+
+
+def raise_blocked(service, reason):
+    """Slow the service's rate limiter down and raise BlockedError"""
+    record_block(service, reason)
+    raise BlockedError(service, reason)
+
+
+def check_bing_page(driver):
+    """Raise BlockedError if the Bing driver is showing a block page"""
+    reason = bing_block_reason(driver)
+    if reason:
+        raise_blocked('bing', reason)
+
+
+def check_linkedin_page(driver):
+    """Raise BlockedError if the LinkedIn driver is showing a block page"""
+    reason = linkedin_block_reason(driver)
+    if reason:
+        raise_blocked('linkedin', reason)
+
+
+def check_http_response(service, response):
+    """Raise BlockedError if an HTTP API answered 429 Too Many Requests"""
+    if response.status_code == 429:
+        raise_blocked(service, 'HTTP 429')
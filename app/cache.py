@@ -0,0 +1,145 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Create cache directory if it doesn't exist
+cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache')
+os.makedirs(cache_dir, exist_ok=True)
+
+
+def make_cache_key(*parts):
+    """Join key parts into a single cache key string"""
+    return "\x1f".join("" if part is None else str(part) for part in parts)
+
+
+class PersistentCache:
+    """
+    A small on-disk key/value cache with a time-to-live.
+
+    Values are stored as JSON in a SQLite file under the project's cache directory,
+    so they survive restarts. Entries read or written during this run are also kept
+    in memory, so repeat lookups never touch the disk. One instance can be shared by
+    every worker thread.
+    """
+
+    def __init__(self, name, ttl_seconds, path=None):
+        """
+        Args:
+            name: Cache name, used for the SQLite file name and in logs
+            ttl_seconds: How long an entry stays valid. 0 or less disables the cache.
+            path: Optional explicit path for the SQLite file
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.path = path or os.path.join(cache_dir, f"{name}.sqlite3")
+        self.hits = 0
+        self.misses = 0
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @property
+    def enabled(self):
+        return self.ttl_seconds > 0
+
+    def _is_fresh(self, stored_at, now):
+        return now - stored_at < self.ttl_seconds
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if it is missing or expired"""
+        if not self.enabled:
+            return default
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT value, stored_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[1], json.loads(row[0]))
+                    self._memory[key] = entry
+
+            if entry is not None and self._is_fresh(entry[0], now):
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            return default
+
+    def contains(self, key):
+        """True if a fresh entry exists for key (does not count as a hit or miss)"""
+        if not self.enabled:
+            return False
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                return self._is_fresh(entry[0], now)
+            row = self._conn.execute(
+                "SELECT stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            return row is not None and self._is_fresh(row[0], now)
+
+    def set(self, key, value):
+        """Store a JSON-serializable value under key"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now)
+            )
+            self._conn.commit()
+            self._memory[key] = (now, value)
+
+    def delete(self, key):
+        """Remove a single entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+            self._memory.pop(key, None)
+
+    def purge_expired(self):
+        """Delete expired entries from disk and return how many were removed"""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM entries WHERE stored_at < ?", (cutoff,))
+            self._conn.commit()
+            self._memory = {
+                key: entry for key, entry in self._memory.items() if entry[0] >= cutoff
+            }
+            return cursor.rowcount
+
+    def stats(self):
+        """Return hit/miss counts for this run"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'name': self.name,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def reset_stats(self):
+        """Reset the hit/miss counters (called at the start of each run)"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
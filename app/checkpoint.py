@@ -0,0 +1,179 @@
+import os
+import stat
+import tempfile
+import threading
+import time
+from app.config import get_env_bool, get_env_float, get_env_int
+from app.logger import get_logger
+from app.metrics import timed
+
+# When the contacts CSV is written while a run is going; set in .env
+#   CHECKPOINT_EVERY_CONTACTS - after this many finished contacts (0 = never)
+#   CHECKPOINT_EVERY_SECONDS  - once this long has passed since the last write and a
+#                               contact has finished since (0 = never)
+#   CHECKPOINT_ON_STOP        - as soon as a stop is requested, before the contacts
+#                               still in progress wind down
+# The CSV is always written once more when the run ends. Finished contacts are in the
+# results journal (journal.py) in between, so a crash between checkpoints loses nothing.
+DEFAULT_CHECKPOINT_EVERY_CONTACTS = 50
+DEFAULT_CHECKPOINT_EVERY_SECONDS = 300
+DEFAULT_CHECKPOINT_ON_STOP = True
+
+
+def write_csv_atomic(df, path, encoding='utf-8'):
+    """
+    Write df to path as CSV without ever leaving a half-written file behind.
+
+    The CSV is written to a temporary file in the same directory, synced to disk and
+    moved over path with os.replace, so path holds either the previous file or the
+    new one in full, also when the process dies mid-write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            df.to_csv(f, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file readable by the owner only; keep the original's mode
+        if os.path.exists(path):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class Checkpointer:
+    """
+    Writes a shared DataFrame out when a checkpoint trigger fires: every N finished
+    contacts, every T seconds or when a stop is requested (see the settings above).
+
+    Writes run on a background thread from a copy taken under df_lock, so workers are
+    only held up for the copy. Checkpoints requested while a write is running are
+    coalesced: at most one more write follows it, with the latest results.
+    """
+
+    def __init__(self, contacts_df, df_lock, save, every_contacts=None, every_seconds=None, on_stop=None, log=None):
+        """
+        Args:
+            contacts_df: DataFrame the workers write their results into
+            df_lock: Lock guarding contacts_df
+            save: Callable writing a DataFrame out, e.g. lambda df: write_csv_atomic(df, path).
+                It should raise if the write fails.
+            every_contacts: Checkpoint after this many finished contacts, 0 = never
+                (default: CHECKPOINT_EVERY_CONTACTS, else 50)
+            every_seconds: Checkpoint when this many seconds passed since the last one, 0 = never
+                (default: CHECKPOINT_EVERY_SECONDS, else 300)
+            on_stop: Checkpoint as soon as a stop is requested (default: CHECKPOINT_ON_STOP, else True)
+            log: Optional callback for error messages (default: the module logger)
+        """
+        if every_contacts is None:
+            every_contacts = get_env_int('CHECKPOINT_EVERY_CONTACTS', DEFAULT_CHECKPOINT_EVERY_CONTACTS)
+        if every_seconds is None:
+            every_seconds = get_env_float('CHECKPOINT_EVERY_SECONDS', DEFAULT_CHECKPOINT_EVERY_SECONDS)
+        if on_stop is None:
+            on_stop = get_env_bool('CHECKPOINT_ON_STOP', DEFAULT_CHECKPOINT_ON_STOP)
+        self.contacts_df = contacts_df
+        self.df_lock = df_lock
+        self.save = save
+        self.every_contacts = max(0, int(every_contacts))
+        self.every_seconds = max(0.0, float(every_seconds))
+        self.on_stop = on_stop
+        self.log = log or get_logger().info
+        self.writes = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._done = 0
+        self._written_done = None
+        self._unsaved = 0
+        self._last_checkpoint = time.monotonic()
+        self._stop_seen = False
+        self._cond = threading.Condition()
+        self._requested = False
+        self._closed = False
+        self._thread = None
+
+    def contact_done(self):
+        """Count one finished contact and checkpoint if a trigger is due"""
+        self._done += 1
+        self._unsaved += 1
+        if self.every_contacts and self._unsaved >= self.every_contacts:
+            self.request(f"{self._unsaved} contacts")
+        else:
+            self.tick()
+
+    def tick(self):
+        """Checkpoint if the time trigger is due (call this regularly, also when no contact finished)"""
+        if (self.every_seconds and self._unsaved
+                and time.monotonic() - self._last_checkpoint >= self.every_seconds):
+            self.request(f"{self.every_seconds:g}s")
+
+    def stop_requested(self):
+        """Checkpoint once when a stop is first requested"""
+        if self.on_stop and not self._stop_seen and self._unsaved:
+            self.request("stop")
+        self._stop_seen = True
+
+    def request(self, reason="requested"):
+        """Queue a checkpoint on the background thread, coalescing it with one already queued"""
+        get_logger().debug("Checkpoint requested (%s)", reason)
+        self._unsaved = 0
+        self._last_checkpoint = time.monotonic()
+        with self._cond:
+            if self._closed:
+                return
+            if self._requested:
+                self.coalesced += 1
+                return
+            self._requested = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="checkpoint", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._requested and not self._closed:
+                    self._cond.wait()
+                if not self._requested:
+                    return
+                self._requested = False
+            try:
+                self.write()
+            except Exception as e:
+                self.errors += 1
+                self.log(f"Error saving checkpoint: {e}")
+
+    def write(self):
+        """Write a copy of the DataFrame now, on the calling thread; raises if the save fails"""
+        with self.df_lock:
+            snapshot = self.contacts_df.copy()
+            done = self._done
+        with timed('csv_save'):
+            self.save(snapshot)
+        self.writes += 1
+        self._written_done = done
+
+    def close(self):
+        """Finish any queued checkpoint and stop the background thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def finish(self):
+        """
+        Close, then write the final results unless the last checkpoint already holds
+        them; raises if that write fails.
+        """
+        self.close()
+        if self._written_done != self._done:
+            self.write()
+
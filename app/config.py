@@ -0,0 +1,42 @@
+import os
+from dotenv import load_dotenv
+# Load environment variables
+load_dotenv()
+
+
+def get_env_str(name, default=None):
+    """Get a string setting from the environment (or .env file)"""
+    value = os.getenv(name)
+    if value is None or value.strip() == '':
+        return default
+    return value.strip()
+
+
+def get_env_float(name, default):
+    """Get a float setting from the environment, falling back to default if unset or invalid"""
+    value = get_env_str(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def get_env_int(name, default):
+    """Get an integer setting from the environment, falling back to default if unset or invalid"""
+    value = get_env_str(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def get_env_bool(name, default=False):
+    """Get a boolean setting from the environment (true/1/yes/on are True)"""
+    value = get_env_str(name)
+    if value is None:
+        return default
+    return value.lower() in ('true', '1', 'yes', 'on')
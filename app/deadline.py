@@ -0,0 +1,43 @@
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class Deadline:
+    """
+    A point in time by which a whole operation (e.g. loading one profile) must finish.
+
+    Drivers run without implicit waits, so every wait is explicit; giving each step
+    the time that is left on one shared deadline keeps the total bounded, and a probe
+    made after the deadline checks its condition once instead of stalling.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        """Seconds left before the deadline (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def wait(self, driver, condition, timeout=None, message="", poll_frequency=0.1):
+        """
+        Wait for an expected condition within the time left.
+
+        Args:
+            driver: WebDriver to poll
+            condition: A callable taking the driver, e.g. an expected_conditions check
+            timeout: Optional cap (seconds) for this step, below the time left
+            message: Message for the TimeoutException
+            poll_frequency: Seconds between checks
+
+        Returns:
+            The condition's first truthy result
+
+        Raises:
+            TimeoutException: If the condition did not hold in time
+        """
+        seconds = self.remaining() if timeout is None else min(timeout, self.remaining())
+        return WebDriverWait(driver, seconds, poll_frequency=poll_frequency).until(condition, message)
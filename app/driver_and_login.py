@@ -8,14 +8,30 @@ from selenium.common.exceptions import WebDriverException
 import json
 import os
 import gc
+import time
 from app.logger import get_logger
+from app.metrics import record_timing
+from app.resource_policy import apply_resource_policy, resource_policy_suspended
+from app.config import get_env_str
 
+# 'eager' returns from driver.get() once the DOM is ready instead of after every image,
+# font and script has loaded ('normal'); 'none' returns right after navigation starts.
+# Readiness is always checked with explicit waits, never implicit ones.
+PAGE_LOAD_STRATEGY = get_env_str('PAGE_LOAD_STRATEGY', 'eager')
 
-def get_driver(headless=False, keep_open=False):
-    """Initialize and configure Chrome WebDriver with better error handling"""
+
+def get_driver(headless=False, keep_open=False, role=None):
+    """
+    Initialize and configure Chrome WebDriver with better error handling
+
+    role ('linkedin' or 'bing') selects the resource policy: which images, media,
+    fonts and analytics requests the browser blocks (see resource_policy.py).
+    """
     logger = get_logger()
+    started = time.perf_counter()
     try:
         chrome_options = Options()
+        chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
         if headless and not keep_open:
             chrome_options.add_argument("--headless=new")
         else:
@@ -52,7 +68,6 @@ def get_driver(headless=False, keep_open=False):
         # Add options to prevent crashes
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
         chrome_options.add_argument("--disable-web-security")
         chrome_options.add_argument("--allow-running-insecure-content")
 
@@ -63,11 +78,16 @@ def get_driver(headless=False, keep_open=False):
         driver = webdriver.Chrome(options=chrome_options, service=service)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
-        # Set page load timeout
+        # Set page load timeout; no implicit waits, so a missing element is reported at once
         driver.set_page_load_timeout(30)
-        driver.implicitly_wait(10)
-        logger.info("Setting -> page load timeout = 30 seconds; implicit wait for element = 10 seconds")
+        driver.implicitly_wait(0)
+        logger.info(f"Setting -> page load strategy = {PAGE_LOAD_STRATEGY}; page load timeout = 30 seconds; no implicit wait")
+
+        # Block images, media, fonts and trackers for this role (replaces --disable-images,
+        # which Chrome ignores)
+        apply_resource_policy(driver, role)
 
+        record_timing('driver_start', time.perf_counter() - started)
         return driver
 
     except WebDriverException as e:
@@ -111,16 +131,19 @@ def login(driver, login_confirmation_callback=None):
         if not cookies_exist:
             # No cookies exist - require manual login
             logger.info("No cookies found. Please log in manually in the browser window.")
-            driver.get("https://www.linkedin.com/login")
-
-            if login_confirmation_callback:
-                # Use the callback (GUI button) instead of terminal input
-                logger.info("Please log in manually in the browser window, then click 'Confirm Logged In' in the GUI.")
-                login_confirmation_callback()
-            else:
-                # Fallback to terminal input for non-GUI usage
-                logger.info("Press Enter to continue after logging in...")
-                input("After logging in and passing any CAPTCHA, press Enter to continue...")
+
+            # Load everything while a person logs in, so CAPTCHA images work
+            with resource_policy_suspended(driver):
+                driver.get("https://www.linkedin.com/login")
+
+                if login_confirmation_callback:
+                    # Use the callback (GUI button) instead of terminal input
+                    logger.info("Please log in manually in the browser window, then click 'Confirm Logged In' in the GUI.")
+                    login_confirmation_callback()
+                else:
+                    # Fallback to terminal input for non-GUI usage
+                    logger.info("Press Enter to continue after logging in...")
+                    input("After logging in and passing any CAPTCHA, press Enter to continue...")
 
             # Save cookies for future use AFTER manual login is confirmed
             try:
@@ -1,10 +1,66 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from app.parse_profile.get_positions_and_company_match import scrape_positions_and_match_company
 from app.matching import normalize_company_name
+from app.profile_url import canonical_profile_url, dedupe_profile_urls, profile_key
+from app.block_detection import BlockedError
+from app.rate_limiter import RateLimitWaitCancelled
 from .brave_search import BraveSearch
 from .bing_search import BingSearch
+from .serp_evidence import accepts_without_visit, get_snippet_trust, snippet_match
+from .ranking import rank_candidates, record_candidates
+
+# Background threads for Brave API queries fired alongside Bing searches
+_brave_executor = None
+_brave_executor_lock = threading.Lock()
+
+
+def _get_brave_executor():
+    global _brave_executor
+    with _brave_executor_lock:
+        if _brave_executor is None:
+            _brave_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="brave-search")
+        return _brave_executor
+
+
+def candidate_url(candidate):
+    """Return the profile URL of a candidate: a bare URL or a (url, title, similarity, snippet) result"""
+    return candidate if isinstance(candidate, str) else candidate[0]
+
+
+def merge_search_results(*result_lists):
+    """
+    Merge (url, title, similarity, snippet) search results from several engines.
+
+    Results are deduped by canonical profile key, keeping the result with the highest
+    similarity seen for each profile (with the snippets of every engine that found it),
+    and ordered by similarity (highest first). Ties keep the order of the input lists.
+
+    Returns:
+        list[tuple]: Search results with canonical profile URLs
+    """
+    best_results = {}
+    for results in result_lists:
+        for result in results:
+            key = profile_key(result[0])
+            if key is None:
+                continue
+            url, title, similarity = canonical_profile_url(result[0]), result[1], result[2]
+            snippet = result[3] if len(result) > 3 else ""
+            if key in best_results:
+                best = best_results[key]
+                if snippet and snippet not in best[3]:
+                    snippet = f"{best[3]} · {snippet}" if best[3] else snippet
+                else:
+                    snippet = best[3]
+                if similarity <= best[2]:
+                    url, title, similarity = best[:3]
+            best_results[key] = (url, title, similarity, snippet)
+
+    return sorted(best_results.values(), key=lambda result: result[2], reverse=True)
 
 
 def validate_search_results(
@@ -18,17 +74,61 @@ def validate_search_results(
     linkedin_threshold,
     linkedin_timeout,
     early_exit_threshold,
-    search_source="Unknown"
+    search_source="Unknown",
+    refresh_profiles=False,
+    visited_keys=None,
+    snippet_trust=None
 ):
     """
     Validate a list of profile candidates and return the best match and profile URL.
+    Cached profile positions are reused unless refresh_profiles is True.
+
+    Candidates are profile URLs or (url, title, similarity, snippet) search results.
+    They are ranked before any visit by name similarity, company evidence in the
+    title/snippet, slug similarity and whether the profile is cached (see ranking.py),
+    and with snippet_trust 'accept' a result naming the company as the current
+    employer is accepted without loading the profile (see serp_evidence.py).
+
+    Candidates are canonicalized first, so the same profile is never visited twice.
+    Pass the same visited_keys set to every pass for a contact to skip profiles an
+    earlier pass already checked; the keys of profiles checked here are added to it.
     """
     best_match = None
     best_score = 0
     best_profile_url = None
     found_good_match = False
 
+    if visited_keys is None:
+        visited_keys = set()
+
+    snippet_trust = get_snippet_trust(snippet_trust)
+    ranked = rank_candidates(url_candidates, full_name, company_name, linkedin_threshold, use_snippets=snippet_trust != 'off')
+    pass_visits = []
+
+    for candidate, features in ranked:
+        if features['key'] is None or features['key'] in visited_keys:
+            continue
+        if accepts_without_visit(features['evidence'], snippet_trust):
+            evidence = features['evidence']
+            visited_keys.add(features['key'])
+            profile_url = canonical_profile_url(candidate_url(candidate))
+            log(f"Search #{search_count} (Row {idx+1}): {search_source} result names '{evidence['phrase']}' as current employer (score {evidence['score']:.0f}) - accepting {profile_url} without opening the profile")
+            record_candidates(full_name, company_name, search_source, ranked, pass_visits, profile_url, evidence['score'])
+            return snippet_match(candidate[1], evidence), profile_url
+
+    if [features['search_rank'] for _, features in ranked] != list(range(len(ranked))):
+        log(f"Search #{search_count} (Row {idx+1}): Ranked {search_source} candidates: " + ", ".join(
+            f"{features['key']} (search #{features['search_rank'] + 1})" for _, features in ranked))
+
+    url_candidates = [candidate_url(candidate) for candidate, _ in ranked]
+    unique_candidates = dedupe_profile_urls(url_candidates, visited_keys)
+    if len(unique_candidates) < len(url_candidates):
+        log(f"Search #{search_count} (Row {idx+1}): Skipping {len(url_candidates) - len(unique_candidates)} duplicate or already checked {search_source} candidates")
+    url_candidates = unique_candidates
+
     for i, profile_url in enumerate(url_candidates):
+        visited_keys.add(profile_key(profile_url))
+        pass_visits.append(profile_key(profile_url))
         try:
             log(f"Search #{search_count} (Row {idx+1}): Checking {search_source} candidate {i+1}/{len(url_candidates)}: {profile_url}")
 
@@ -39,7 +139,8 @@ def validate_search_results(
                 target_company=company_name,
                 threshold=linkedin_threshold,
                 verbose=False,
-                timeout=linkedin_timeout
+                timeout=linkedin_timeout,
+                force_refresh=refresh_profiles
             )
 
             # Check if this profile has a company match (current or historical)
@@ -69,6 +170,10 @@ def validate_search_results(
             else:
                 log(f"Search #{search_count} (Row {idx+1}): {search_source} candidate {i+1} has no company match in any position")
 
+        except (BlockedError, RateLimitWaitCancelled):
+            # Checking the remaining candidates would only hit the same block page,
+            # or processing is stopping
+            raise
         except Exception as e:
             log(f"Search #{search_count} (Row {idx+1}): Error checking {search_source} candidate {i+1}: {e}")
             continue
@@ -77,10 +182,123 @@ def validate_search_results(
     if not found_good_match and len(url_candidates) > 1:
         log(f"Search #{search_count} (Row {idx+1}): Checked all {len(url_candidates)} {search_source} candidates")
 
+    record_candidates(full_name, company_name, search_source, ranked, pass_visits, best_profile_url, best_score)
+
     # Return both the best match and the profile URL
     return best_match, best_profile_url
 
 
+def get_bing_search(bing, bing_timeout=20):
+    """Use a worker's BingSearch as is, or wrap a bare Selenium driver in one"""
+    if isinstance(bing, BingSearch):
+        return bing
+    return BingSearch(bing, timeout=bing_timeout)
+
+
+def search_bing_candidates(
+    full_name: str,
+    company_name: str,
+    bing_driver,
+    search_count: int,
+    idx: int,
+    log,
+    max_candidates: int = 3,
+    search_threshold: float = 0.6,
+    bing_timeout: int = 20
+) -> list[tuple]:
+    """
+    Run the Bing stage of the search and return the candidate (url, title, similarity,
+    snippet) results.
+
+    This only touches Bing (bing_driver is a BingSearch or a Selenium driver), so it
+    can run for the next contacts while LinkedIn profiles for earlier contacts are
+    still being validated.
+    """
+    log(f"Search #{search_count} (Row {idx+1}): Starting Bing search for {full_name} at {company_name}")
+    clean_company = normalize_company_name(company_name)
+    log(f"Using 'cleaned' company of of: {clean_company}")
+
+    bing_search = get_bing_search(bing_driver, bing_timeout)
+    return bing_search.run_bing_search_validated(
+        name=full_name,
+        company=clean_company,
+        limit=max_candidates,
+        threshold=search_threshold
+    )
+
+
+def search_candidates(
+    full_name: str,
+    company_name: str,
+    bing_driver,
+    search_count: int,
+    idx: int,
+    log,
+    max_candidates: int = 3,
+    search_threshold: float = 0.6,
+    bing_timeout: int = 20,
+    speculative_brave: bool = False
+) -> list[tuple]:
+    """
+    Run the search stage for one contact and return the candidate search results.
+
+    By default only Bing is searched (Brave stays a fallback after validation). With
+    speculative_brave the Brave API query is fired at the same time as the Bing
+    search, and both candidate lists are merged, deduped and ranked by
+    similarity, so the search costs the slower of the two instead of their sum.
+    """
+    if not speculative_brave:
+        return search_bing_candidates(
+            full_name,
+            company_name,
+            bing_driver,
+            search_count,
+            idx,
+            log,
+            max_candidates=max_candidates,
+            search_threshold=search_threshold,
+            bing_timeout=bing_timeout
+        )
+
+    log(f"Search #{search_count} (Row {idx+1}): Starting Bing and Brave searches for {full_name} at {company_name}")
+    clean_company = normalize_company_name(company_name)
+    log(f"Using 'cleaned' company of of: {clean_company}")
+
+    brave_future = _get_brave_executor().submit(
+        BraveSearch().run_brave_search,
+        full_name,
+        clean_company,
+        limit=max_candidates,
+        threshold=search_threshold
+    )
+
+    bing_results = []
+    bing_error = None
+    try:
+        bing_search = get_bing_search(bing_driver, bing_timeout)
+        bing_results = bing_search.run_bing_search_validated(
+            name=full_name,
+            company=clean_company,
+            limit=max_candidates,
+            threshold=search_threshold
+        )
+    except RateLimitWaitCancelled:
+        raise
+    except Exception as e:
+        bing_error = e
+        log(f"Search #{search_count} (Row {idx+1}): Bing search failed ({e}), using Brave results only")
+
+    # A BlockedError from Brave propagates, so the row is retried rather than judged
+    # on Bing's candidates alone
+    brave_results = brave_future.result()
+    if bing_error is not None and not brave_results:
+        raise bing_error
+
+    url_candidates = merge_search_results(bing_results, brave_results)
+    log(f"Search #{search_count} (Row {idx+1}): Bing found {len(bing_results)} and Brave found {len(brave_results)} results - {len(url_candidates)} unique candidates")
+    return url_candidates
+
+
 def find_profile_urls_and_validate(
     full_name: str,
     company_name: str,
@@ -94,7 +312,12 @@ def find_profile_urls_and_validate(
     linkedin_threshold: int = 75,
     linkedin_timeout: int = 15,
     bing_timeout: int = 20,
-    early_exit_threshold: int = 85
+    early_exit_threshold: int = 85,
+    bing_candidates: list[tuple] | None = None,
+    refresh_profiles: bool = False,
+    speculative_brave: bool = False,
+    snippet_trust: str | None = None,
+    visited_keys: set | None = None
 ) -> tuple[dict | None, str | None]:
     """
     Search for LinkedIn profiles using Bing first, then Brave if no valid matches found.
@@ -108,7 +331,7 @@ def find_profile_urls_and_validate(
         full_name (str): The full name of the person to search for
         company_name (str): The company name to search within
         linkedin_driver: Selenium WebDriver instance for LinkedIn
-        bing_driver: Selenium WebDriver instance for Bing
+        bing_driver: BingSearch instance (or Selenium WebDriver) for Bing
         search_count (int): Current search iteration number for logging
         idx (int): Row index in the source data for logging
         log: Logging function to use for output
@@ -118,6 +341,16 @@ def find_profile_urls_and_validate(
         linkedin_timeout (int, optional): Timeout in seconds for LinkedIn page loads. Defaults to 15.
         bing_timeout (int, optional): Timeout in seconds for Bing searches. Defaults to 20.
         early_exit_threshold (int, optional): Score threshold for early exit on validation. Defaults to 85.
+        bing_candidates (list[tuple] | None, optional): Bing search results already found by a search stage.
+            When given, the Bing search is skipped. Defaults to None.
+        refresh_profiles (bool, optional): Scrape candidate profiles again instead of using
+            cached positions. Defaults to False.
+        speculative_brave (bool, optional): Query Brave at the same time as Bing and validate the
+            merged candidates in one pass instead of using Brave as a fallback. Defaults to False.
+        snippet_trust (str | None, optional): How far search titles/snippets are trusted:
+            'off', 'order' or 'accept'. Defaults to SNIPPET_TRUST from .env, else 'order'.
+        visited_keys (set | None, optional): Collects the keys of the profiles checked for this
+            contact, e.g. to count visits. Defaults to a new set.
 
     Returns:
         tuple[dict | None, str | None]: A tuple containing:
@@ -131,21 +364,30 @@ def find_profile_urls_and_validate(
                         - 'match_result' (dict): Fuzzy matching details (score, match type, normalized names)
             - str | None: LinkedIn profile URL if found, None otherwise
     """
-    # Step 1: Try Bing search first
-    log(f"Search #{search_count} (Row {idx+1}): Starting Bing search for {full_name} at {company_name}")
-    clean_company = normalize_company_name(company_name)
-    log(f"Using 'cleaned' company of of: {clean_company}")
+    # Canonical keys of the profiles already checked for this contact
+    if visited_keys is None:
+        visited_keys = set()
 
-    bing_search = BingSearch(bing_driver, timeout=bing_timeout)
-    url_candidates = bing_search.run_bing_search(
-        name=full_name,
-        company=clean_company,
-        limit=max_candidates,
-        threshold=search_threshold
-    )
+    # Step 1: Try Bing search first (unless a search stage already ran it)
+    search_source = "Bing+Brave" if speculative_brave else "Bing"
+    if bing_candidates is None:
+        url_candidates = search_candidates(
+            full_name,
+            company_name,
+            bing_driver,
+            search_count,
+            idx,
+            log,
+            max_candidates=max_candidates,
+            search_threshold=search_threshold,
+            bing_timeout=bing_timeout,
+            speculative_brave=speculative_brave
+        )
+    else:
+        url_candidates = bing_candidates
 
     if url_candidates:
-        log(f"Search #{search_count} (Row {idx+1}): Bing found {len(url_candidates)} results")
+        log(f"Search #{search_count} (Row {idx+1}): {search_source} found {len(url_candidates)} results")
 
         # Validate Bing candidates
         best_match, best_profile_url = validate_search_results(
@@ -159,17 +401,25 @@ def find_profile_urls_and_validate(
             linkedin_threshold,
             linkedin_timeout,
             early_exit_threshold,
-            search_source="Bing"
+            search_source=search_source,
+            refresh_profiles=refresh_profiles,
+            visited_keys=visited_keys,
+            snippet_trust=snippet_trust
         )
 
         if best_match:
-            log(f"Search #{search_count} (Row {idx+1}): Valid match found from Bing search")
+            log(f"Search #{search_count} (Row {idx+1}): Valid match found from {search_source} search")
             return best_match, best_profile_url
-        else:
+        elif not speculative_brave:
             log(f"Search #{search_count} (Row {idx+1}): No valid matches from Bing candidates, trying Brave search")
-    else:
+    elif not speculative_brave:
         log(f"Search #{search_count} (Row {idx+1}): Bing search returned no candidates, trying Brave search")
 
+    if speculative_brave:
+        # Brave was already searched alongside Bing
+        log(f"Search #{search_count} (Row {idx+1}): No valid matches found from either Bing or Brave search")
+        return None, None
+
     # Step 2: Try Brave search if Bing failed or returned no valid matches
     log(f"Search #{search_count} (Row {idx+1}): Starting Brave search for {full_name} at {company_name}")
 
@@ -182,14 +432,19 @@ def find_profile_urls_and_validate(
         threshold=search_threshold
     )
 
-    if brave_results:
-        # Extract URLs from Brave results
-        brave_urls = [result[0] for result in brave_results]
-        log(f"Search #{search_count} (Row {idx+1}): Brave found {len(brave_urls)} candidates")
+    # Skip profiles the Bing pass already checked
+    brave_candidates = [result for result in brave_results if profile_key(result[0]) not in visited_keys]
+    if brave_results and not brave_candidates:
+        log(f"Search #{search_count} (Row {idx+1}): All {len(brave_results)} Brave candidates were already checked in the Bing pass")
+    elif len(brave_candidates) < len(brave_results):
+        log(f"Search #{search_count} (Row {idx+1}): Skipping {len(brave_results) - len(brave_candidates)} Brave candidates already checked in the Bing pass")
+
+    if brave_candidates:
+        log(f"Search #{search_count} (Row {idx+1}): Brave found {len(brave_candidates)} candidates")
 
         # Validate Brave candidates
         best_match, best_profile_url = validate_search_results(
-            brave_urls,
+            brave_candidates,
             full_name,
             company_name,
             linkedin_driver,
@@ -199,7 +454,10 @@ def find_profile_urls_and_validate(
             linkedin_threshold,
             linkedin_timeout,
             early_exit_threshold,
-            search_source="Brave"
+            search_source="Brave",
+            refresh_profiles=refresh_profiles,
+            visited_keys=visited_keys,
+            snippet_trust=snippet_trust
         )
 
         if best_match:
@@ -207,7 +465,7 @@ def find_profile_urls_and_validate(
             return best_match, best_profile_url
         else:
             log(f"Search #{search_count} (Row {idx+1}): No valid matches from Brave candidates either")
-    else:
+    elif not brave_results:
         log(f"Search #{search_count} (Row {idx+1}): Brave search returned no candidates")
 
     # No valid matches found from either search
@@ -2,104 +2,253 @@
 # from pathlib import Path
 # sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from app.driver_and_login import get_driver, cleanup_driver
-from bs4 import BeautifulSoup
+from app.driver_and_login import get_driver, cleanup_driver, health_check_driver
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from app.logger import get_logger
 from app.matching import score_fuzzy_match
-import base64
+from app.find_profile_urls.search_cache import get_search_cache, search_cache_key
+from app.profile_url import decode_bing_redirect, is_bing_redirect
+from app.rate_limiter import RateLimitWaitCancelled, record_block, record_success, wait_for_rate_limit
+from app.block_detection import bing_html_block_reason, check_bing_page
+from app.deadline import Deadline
+from app.metrics import timed
+from app.http_session import CONNECT_TIMEOUT, get_http_session, resolve_redirect
+from app.config import get_env_str
+import logging
+import requests
+import threading
 import time
-from urllib.parse import urlparse, parse_qs, unquote
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only the results list is fetched from the browser and parsed
+BING_RESULTS_SCRIPT = "const results = document.getElementById('b_results'); return results ? results.outerHTML : '';"
+BING_RESULTS_ONLY = SoupStrainer(id="b_results")
+
+# How results pages are fetched: 'http' (pooled HTTP session, browser only when Bing
+# answers with a challenge) or 'browser' (always Selenium); set BING_BACKEND in .env
+BING_BACKENDS = ('http', 'browser')
+DEFAULT_BING_BACKEND = 'http'
+
+# After a challenge page over HTTP, all searches use the browser for this many seconds
+HTTP_CHALLENGE_COOLDOWN_SECONDS = 600
+
+_http_paused_until = 0.0
+_http_pause_lock = threading.Lock()
+
+PROFILE_TITLE_SUFFIXES = [
+    " | Professional Profile",
+    " | LinkedIn",
+    " - Professional Profile",
+    " - LinkedIn",
+    " | Business Profile",
+    " - Business Profile"
+]
+
+
+def parse_bing_serp(html):
+    """
+    Parse a Bing results page into one record per organic result.
+
+    Args:
+        html: The page source of a Bing results page, or just its #b_results element
+
+    Returns:
+        list[dict]: {'title', 'url', 'snippet'} per li.b_algo result, in page order.
+            'url' is the raw href, which may be a Bing redirect.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=BING_RESULTS_ONLY)
+    results = []
+    for item in soup.select("li.b_algo"):
+        h2 = item.find("h2")
+        a = h2.find("a", href=True) if h2 else None
+        snippet = item.select_one("div.b_caption p, p[class^='b_lineclamp'], .b_algoSlug")
+        results.append({
+            'title': h2.get_text().strip() if h2 else "",
+            'url': a["href"] if a else "",
+            'snippet': snippet.get_text().strip() if snippet else ""
+        })
+    return results
+
+
+def strip_profile_title_suffix(title):
+    """Remove a trailing ' | LinkedIn'-style suffix from a result title"""
+    title = title.strip()
+    for suffix in PROFILE_TITLE_SUFFIXES:
+        if title.endswith(suffix):
+            return title[:-len(suffix)].strip()
+    return title
+
+
+def get_bing_backend():
+    """Return the configured Bing backend ('http' or 'browser')"""
+    backend = (get_env_str('BING_BACKEND', DEFAULT_BING_BACKEND) or DEFAULT_BING_BACKEND).lower()
+    if backend not in BING_BACKENDS:
+        get_logger().warning(f"Unknown BING_BACKEND '{backend}' - using '{DEFAULT_BING_BACKEND}'")
+        return DEFAULT_BING_BACKEND
+    return backend
+
+
+def pause_http_backend(reason, seconds=HTTP_CHALLENGE_COOLDOWN_SECONDS):
+    """Send every Bing search through the browser for a while after a challenge page"""
+    global _http_paused_until
+    with _http_pause_lock:
+        _http_paused_until = max(_http_paused_until, time.monotonic() + seconds)
+    get_logger().warning(f"Bing challenged the HTTP backend ({reason}) - using the browser for the next {seconds // 60} minutes")
+
+
+def http_backend_paused():
+    return time.monotonic() < _http_paused_until
 
 
 class BingSearch:
-    def __init__(self, driver=None, timeout=20):
+    def __init__(self, driver=None, timeout=20, backend=None):
+        """
+        Args:
+            driver: Selenium driver for browser searches; started on first use if None
+            timeout: Seconds allowed for one results page
+            backend: 'http' or 'browser' (default: BING_BACKEND from .env, else 'http')
+        """
         self.logger = get_logger()
         self.timeout = timeout
-        if driver is None:
-            self.bing_driver = get_driver(headless=True)
-        else:
-            self.bing_driver = driver
+        self.backend = backend or get_bing_backend()
+        self._driver = driver
+
+    @property
+    def bing_driver(self):
+        """The Selenium driver, started the first time a search needs the browser"""
+        if self._driver is None:
+            self.logger.info("Starting Bing browser...")
+            self._driver = get_driver(headless=True, role='bing')
+        return self._driver
+
+    @property
+    def has_driver(self):
+        return self._driver is not None
+
+    def ensure_driver_healthy(self):
+        """
+        Drop the browser if it is no longer responding, so the next browser search
+        starts a new one. Nothing is started if the browser has not been needed yet.
+
+        Returns:
+            bool: True if an unresponsive browser was dropped
+        """
+        if self._driver is not None and not health_check_driver(self._driver, "Bing"):
+            self.cleanup()
+            return True
+        return False
 
     def extract_real_url_from_bing_redirect(self, bing_url):
         """
-        Extract the real URL from a Bing redirect URL
+        Extract the real URL from a Bing redirect URL.
+
+        The target is decoded from the redirect's parameters; only when that fails is
+        the redirect followed, with a HEAD request - never by navigating the browser,
+        which would throw away the results page being read.
+
+        Returns:
+            str: The target URL, or "" if it could not be resolved
         """
+        if not is_bing_redirect(bing_url):
+            return bing_url
         try:
-            # Parse the Bing URL to extract the real URL
-            parsed = urlparse(bing_url)
-
-            if 'bing.com' in parsed.netloc and ('/ck/' in parsed.path or 'u=' in parsed.query):
-                query_params = parse_qs(parsed.query)
-
-                for param_name in ['u', 'url', 'r', 'redirect']:
-                    if param_name in query_params:
-                        encoded_url = query_params[param_name][0]
-                        try:
-                            decoded_url = unquote(encoded_url)
-                            if decoded_url.startswith("a1"):
-                                decoded_url = decoded_url[2:] + "=="
-
-                            # Ensure proper base64 padding
-                            if decoded_url.startswith('aHR0c') or len(decoded_url) > 50:
-                                # Add padding if needed
-                                padding_needed = len(decoded_url) % 4
-                                if padding_needed:
-                                    decoded_url += '=' * (4 - padding_needed)
-                                return base64.b64decode(decoded_url).decode('utf-8')
-
-                            # Check if the URL decoded version is valid
-                            # if 'linkedin.com/in/' in decoded_url:
-                            return decoded_url
-                            # else:
-                            #     self.logger.debug(f"Skipping non-LinkedIn URL from URL decode: {decoded_url}")
-
-                        except Exception as e:
-                            self.logger.warning(f"Error decoding URL from parameter '{param_name}': {e}")
-                            return ""
-
-                # If we can't extract it from parameters, try to follow the redirect
-                self.logger.info("Attempting to follow redirect...")
-                try:
-                    # Get the current page URL before following redirect
-                    current_url = self.bing_driver.current_url
-                    self.logger.info(f"Current URL before redirect: {current_url}")
-
-                    # Navigate to the Bing redirect URL
-                    self.bing_driver.get(bing_url)
-
-                    # Wait a moment for redirect
-                    time.sleep(2)
-
-                    # Get the final URL after redirect
-                    final_url = self.bing_driver.current_url
-                    self.logger.info(f"Final URL after redirect: {final_url}")
-
-                    if 'linkedin.com/in/' in final_url:
-                        return final_url
-                    else:
-                        self.logger.warning(f"Redirect did not lead to LinkedIn URL: {final_url}")
-
-                except Exception as e:
-                    self.logger.warning(f"Error following redirect: {e}")
+            decoded_url = decode_bing_redirect(bing_url)
+            if decoded_url is not None:
+                return decoded_url
+        except ValueError as e:
+            self.logger.warning(str(e))
 
-            return bing_url
-        except Exception as e:
-            self.logger.warning(f"Error extracting real URL from Bing redirect: {e}")
-            return bing_url
+        self.logger.info("Resolving Bing redirect with a HEAD request...")
+        try:
+            wait_for_rate_limit('bing')
+            final_url = resolve_redirect(bing_url, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.logger.warning(f"Error following redirect: {e}")
+            return ""
+        self.logger.info(f"Final URL after redirect: {final_url}")
+        if is_bing_redirect(final_url):
+            # Bing answered with its interstitial page instead of an HTTP redirect
+            self.logger.warning(f"Redirect did not resolve: {bing_url}")
+            return ""
+        return final_url
 
     def run_bing_search(self, name, company, limit=5, threshold=0.6, quoted_query=True):
+        validated_results = self.run_bing_search_validated(name, company, limit, threshold, quoted_query)
+
+        # Extract just the URLs for backward compatibility
+        links = [result[0] for result in validated_results]
+
+        for l in links:
+            self.logger.debug("\t- %s", l)
+
+        return links
+
+    def run_bing_search_validated(self, name, company, limit=5, threshold=0.6, quoted_query=True):
+        """
+        Search Bing and return validated (url, title, similarity, snippet) tuples in SERP order.
+        A quoted query with no valid results is retried without quotes.
+        """
+        # Ensure name and company are strings
+        if not isinstance(name, str):
+            name = str(name) if name is not None else ""
+        if not company or not isinstance(company, str):
+            self.logger.warning("Missing company for %s", name)
+            return []
+
+        validated_results = self.search_validated(name, company, limit, threshold, quoted_query)
+
+        # Sort by similarity score (highest first)
+        # validated_results.sort(key=lambda x: x[2], reverse=True)
+
+        # If no results found and this was a quoted query, retry without quotes
+        if not validated_results and quoted_query:
+            self.logger.info("No results found with quoted query, retrying without quotes...")
+            return self.run_bing_search_validated(name, company, limit, threshold, quoted_query=False)
+
+        return validated_results
+
+    def search_validated(self, name, company, limit=5, threshold=0.6, quoted_query=True):
+        """
+        Run one Bing query variant and return validated (url, title, similarity, snippet) tuples.
+
+        Results are served from the persistent search cache when a fresh entry exists
+        for this name, company and query variant. Empty results and results missing a
+        redirect that could not be resolved (usually a passing network error) are not
+        cached, so the next search tries again.
+        """
+        cache = get_search_cache()
+        variant = f"{'quoted' if quoted_query else 'unquoted'}|threshold={threshold}|limit={limit}"
+        key = search_cache_key(name, company, "bing", variant)
+        cached = cache.get(key)
+        if cached is not None:
+            self.logger.info("Bing: Search cache hit for '%s' at '%s' (%s) - %s results", name, company, variant, len(cached))
+            return [tuple(result) for result in cached]
+
+        validated_results, unresolved = self._query_bing(name, company, limit, threshold, quoted_query)
+        if validated_results and not unresolved:
+            cache.set(key, validated_results)
+        elif unresolved:
+            self.logger.info("Bing: Not caching results for '%s' at '%s' - %s redirects did not resolve", name, company, unresolved)
+        return validated_results
+
+    def _query_bing(self, name, company, limit, threshold, quoted_query):
+        """
+        Load the Bing results page for one query variant and validate its results.
+
+        Returns:
+            tuple[list, int]: Validated results and the number of unresolved redirects
+                (see _validate_serp_results)
+        """
         try:
-            # Ensure name and company are strings
-            if not isinstance(name, str):
-                name = str(name) if name is not None else ""
-            if not company or not isinstance(company, str):
-                self.logger.warning(f"Missing company for {name}")
-                return []
-
-            # Store original name and company for comparison and potential retry
+            # Store original name and company for comparison
             original_name = name
             original_company = company
 
@@ -132,196 +281,179 @@ class BingSearch:
 
             url = "https://www.bing.com/search?" + params + "&q=" + query + "&pq=" + pq
 
-            self.logger.info(f"Raw Bing Search URL: {url}")
-            self.bing_driver.get(url)
+            self.logger.info("Raw Bing Search URL: %s", url)
+            result_items = None
+            if self.backend == 'http' and not http_backend_paused():
+                result_items = self._fetch_serp_http(url)
+            if result_items is None:
+                result_items = self._fetch_serp_browser(url)
+            self.logger.info("Found %s search results", len(result_items))
+            return self._validate_serp_results(result_items, original_name, limit, threshold)
+        except Exception as e:
+            self.logger.error("Error running Bing search: %s", e)
+            self.cleanup()
+            raise e
 
-            WebDriverWait(self.bing_driver, self.timeout).until(
-                EC.presence_of_element_located((By.ID, "b_results"))
-            )
+    def _fetch_serp_http(self, url):
+        """
+        Fetch and parse a results page over the shared HTTP session.
 
-            result_container = self.bing_driver.find_element(By.ID, "b_results")
-            self.logger.debug("Search results container found")
+        Returns:
+            list[dict]: Parsed results (see parse_bing_serp), or None if Bing answered
+                with a challenge page and the browser should be used instead
+        """
+        wait_for_rate_limit('bing')
+        try:
+            with timed('bing_serp'):
+                response = get_http_session().get(url, timeout=(CONNECT_TIMEOUT, self.timeout))
+        except requests.RequestException as e:
+            self.logger.warning("Bing HTTP request failed (%s) - retrying in the browser", e)
+            return None
+
+        if response.status_code == 429:
+            record_block('bing', 'HTTP 429')
+            reason = 'HTTP 429'
+        elif response.status_code != 200:
+            reason = f"HTTP {response.status_code}"
+        else:
+            reason = bing_html_block_reason(response.text, response.url)
+        if reason:
+            pause_http_backend(reason)
+            return None
+
+        record_success('bing')
+        return parse_bing_serp(response.text)
+
+    def _fetch_serp_browser(self, url):
+        """Load a results page in the Selenium driver and parse its results list"""
+        wait_for_rate_limit('bing')
+        # Started here on first use (timed as driver_start, not as part of the page load)
+        driver = self.bing_driver
+        with timed('bing_serp'):
+            deadline = Deadline(self.timeout)
+            driver.get(url)
+
+            try:
+                deadline.wait(driver, EC.presence_of_element_located((By.ID, "b_results")))
+            except TimeoutException:
+                # No results container - a captcha page is the usual cause
+                check_bing_page(driver)
+                raise
 
             self.logger.debug("Waiting for individual result items to load...")
-            WebDriverWait(self.bing_driver, self.timeout * 2).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.b_algo"))
-            )
-
-            result_items = result_container.find_elements(By.CSS_SELECTOR, "li.b_algo")
-            self.logger.debug(f"Found {len(result_items)} result items with CSS selector 'li.b_algo'")
-
-            WebDriverWait(self.bing_driver, self.timeout).until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, "h2"))
-            )
-
-            self.logger.info(f"Found {len(result_items)} search results")
-
-            validated_results = []
-            for i, item in enumerate(result_items):
-                if len(validated_results) >= limit:
-                    break
-                try:
-                    self.logger.debug(f"Processing result item {i+1}/{len(result_items)}")
-
-                    html = item.get_attribute("outerHTML")
-                    soup = BeautifulSoup(html, 'html.parser')
-                    h2 = soup.find("h2")
-
-                    title = ""
-                    if h2 and h2.text.strip():
-                        title = h2.text.strip()
-                        # Remove common LinkedIn profile suffixes
-                        suffixes_to_remove = [
-                            " | Professional Profile",
-                            " | LinkedIn",
-                            " - Professional Profile",
-                            " - LinkedIn",
-                            " | Business Profile",
-                            " - Business Profile"
-                        ]
-                        for suffix in suffixes_to_remove:
-                            if title.endswith(suffix):
-                                title = title[:-len(suffix)].strip()
-                                break
-                    else:
-                        self.logger.debug(f"Bing: Item {i+1} - No h2 tag or empty title found")
-                        # Log the HTML structure to understand what we're dealing with
-                        self.logger.debug(f"Bing: Item {i+1} - HTML structure: {html[:200]}...")
+            try:
+                deadline.wait(driver, EC.presence_of_all_elements_located((By.CSS_SELECTOR, "#b_results li.b_algo")))
+            except TimeoutException:
+                # An empty container without Bing's "no results" notice means we are being throttled
+                check_bing_page(driver)
+                raise
+            record_success('bing')
+
+            # One snapshot of the results list, parsed once - no WebDriver calls per result
+            return parse_bing_serp(driver.execute_script(BING_RESULTS_SCRIPT))
+
+    def _validate_serp_results(self, result_items, original_name, limit, threshold):
+        """
+        Keep the LinkedIn profile results whose title (or URL) matches the contact's name.
+
+        Returns:
+            tuple[list, int]: (url, title, similarity, snippet) tuples, and how many Bing
+                redirects could not be resolved - those results may be missing from the list
+        """
+        validated_results = []
+        unresolved = 0
+        # Checked once per page: the per-item debug lines below are skipped outright when DEBUG is off
+        verbose = self.logger.isEnabledFor(logging.DEBUG)
+        for i, item in enumerate(result_items):
+            if len(validated_results) >= limit:
+                break
+            try:
+                title = strip_profile_title_suffix(item['title'])
+                if not title:
+                    if verbose:
+                        self.logger.debug("Bing: Item %s/%s - No h2 tag or empty title found", i+1, len(result_items))
+                    continue
+
+                link = item['url']
+                if not link:
+                    self.logger.warning("Bing: Item %s - No href attribute found in anchor tag", i+1)
+                    continue
+                if verbose:
+                    self.logger.debug("Bing: Item %s/%s - Title: '%s' - Raw URL: %s", i+1, len(result_items), title, link)
+
+                # Handle Bing redirect URLs
+                if is_bing_redirect(link):
+                    real_url = self.extract_real_url_from_bing_redirect(link)
+                    if not real_url:
+                        unresolved += 1
                         continue
-                    self.logger.info(f"Bing: Item {i+1} - Title: '{title}'")
-
-                    link = ""
-                    a = h2.find("a")
-                    if a and a.has_attr("href"):
-                        link = a["href"]
-                        self.logger.debug(f"Bing: Item {i+1} - Raw URL: {link}")
-                    else:
-                        self.logger.warning(f"Bing: Item {i+1} - No href attribute found in anchor tag")
-                        if a:
-                            self.logger.debug(f"Bing: Item {i+1} - Anchor tag attributes: {a.attrs}")
-
-                    if link:
-                        self.logger.debug(f"Bing: Item {i+1} - Processing link: {link}")
-
-                        # Handle Bing redirect URLs
-                        if "bing.com" in link and ("/ck/" in link or "u=" in link):
-                            real_url = self.extract_real_url_from_bing_redirect(link)
-                            self.logger.info(f"Bing: Item {i+1} - URL: {real_url}")
-                            if real_url and "linkedin.com/in/" in real_url:
-                                if title and title.strip():
-                                    # Clean title for comparison - remove location info
-                                    clean_title = title
-                                    # Remove location patterns like " - City, State, Country"
-                                    if " - " in clean_title:
-                                        clean_title = clean_title.split(" - ")[0].strip()
-
-                                    # Use your custom fuzzy matching function
-                                    match_result = score_fuzzy_match(original_name, clean_title, "person", threshold * 100)
-                                    similarity = match_result['score'] / 100  # Convert to 0-1 scale for consistency
-                                    self.logger.info(f"Bing: Item {i+1} - Comparing '{original_name}' with '{clean_title}' (similarity: {similarity:.2f})")
-
-                                    if match_result['is_match']:
-                                        validated_results.append((real_url, title, similarity))
-                                        self.logger.info(f"Bing: Item {i+1} - Valid LinkedIn match found - {title} (similarity: {similarity:.2f})")
-                                    else:
-                                        self.logger.debug(f"Bing: Item {i+1} - Skipping low similarity match - {title} (similarity: {similarity:.2f})")
-                                        self.logger.debug(f"Bing: Item {i+1} - URL was: {real_url}")
-                                else:
-                                    # Title is empty, extract name from LinkedIn URL for validation
-                                    url_parts = real_url.split('/')
-                                    if len(url_parts) >= 5:
-                                        profile_name = url_parts[4].replace('-', ' ').replace('_', ' ')
-                                        # Use your custom fuzzy matching function
-                                        match_result = score_fuzzy_match(original_name, profile_name, "person", threshold * 100)
-                                        similarity = match_result['score'] / 100  # Convert to 0-1 scale for consistency
-                                        self.logger.debug(f"Bing: Item {i+1} - Comparing '{original_name}' with '{profile_name}' from URL (similarity: {similarity:.2f})")
-
-                                        if match_result['is_match']:
-                                            validated_results.append((real_url, profile_name, similarity))
-                                            self.logger.info(f"Bing: Item {i+1} - Valid LinkedIn match found (from URL) - {profile_name} (similarity: {similarity:.2f})")
-                                        else:
-                                            self.logger.debug(f"Bing: Item {i+1} - Skipping low similarity match (from URL) - {profile_name} (similarity: {similarity:.2f})")
-                                    else:
-                                        # If we can't extract name from URL, include with lower confidence
-                                        validated_results.append((real_url, "Unknown", 0.5))
-                                        self.logger.info(f"Bing: Item {i+1} - Including LinkedIn URL with unknown name: {real_url}")
-                            else:
-                                self.logger.debug(f"Bing: Item {i+1} - Skipping non-LinkedIn redirect result: {real_url}")
-                                self.logger.debug(f"Bing: Item {i+1} - Title was: '{title}'")
-                        elif "linkedin.com/in/" in link:
-                            # Direct LinkedIn URL
-                            self.logger.info(f"Bing: Item {i+1} - URL: {link}")
-                            # Validate the title against the name
-                            if title and title.strip():
-                                # Clean title for comparison - remove location info
-                                clean_title = title
-                                # Remove location patterns like " - City, State, Country"
-                                if " - " in clean_title:
-                                    clean_title = clean_title.split(" - ")[0].strip()
-
-                                # Use your custom fuzzy matching function
-                                match_result = score_fuzzy_match(original_name, clean_title, "person", threshold * 100)
-                                similarity = match_result['score'] / 100  # Convert to 0-1 scale for consistency
-                                self.logger.debug(f"Bing: Item {i+1} - Comparing '{original_name}' with '{clean_title}' (similarity: {similarity:.2f})")
-
-                                if match_result['is_match']:
-                                    validated_results.append((link, title, similarity))
-                                    self.logger.info(f"Bing: Item {i+1} - Valid LinkedIn match found - {title} (similarity: {similarity:.2f})")
-                                else:
-                                    self.logger.debug(f"Bing: Item {i+1} - Skipping low similarity match - {title} (similarity: {similarity:.2f})")
-                                    self.logger.debug(f"Bing: Item {i+1} - URL was: {link}")
-                            else:
-                                # Title is empty, extract name from LinkedIn URL for validation
-                                url_parts = link.split('/')
-                                if len(url_parts) >= 5:
-                                    profile_name = url_parts[4].replace('-', ' ').replace('_', ' ')
-                                    # Use your custom fuzzy matching function
-                                    match_result = score_fuzzy_match(original_name, profile_name, "person", threshold * 100)
-                                    similarity = match_result['score'] / 100  # Convert to 0-1 scale for consistency
-                                    self.logger.debug(f"Bing: Item {i+1} - Comparing '{original_name}' with '{profile_name}' from URL (similarity: {similarity:.2f})")
-
-                                    if match_result['is_match']:
-                                        validated_results.append((link, profile_name, similarity))
-                                        self.logger.info(f"Bing: Item {i+1} - Valid LinkedIn match found (from URL) - {profile_name} (similarity: {similarity:.2f})")
-                                    else:
-                                        self.logger.debug(f"Bing: Item {i+1} - Skipping low similarity match (from URL) - {profile_name} (similarity: {similarity:.2f})")
-                                else:
-                                    # If we can't extract name from URL, include with lower confidence
-                                    validated_results.append((link, "Unknown", 0.5))
-                                    self.logger.info(f"Bing: Item {i+1} - Including LinkedIn URL with unknown name: {link}")
-                        else:
-                            self.logger.debug(f"Bing: Item {i+1} - Skipping non-LinkedIn URL: {link}")
-                            self.logger.debug(f"Bing: Item {i+1} - Title was: '{title}'")
-                    else:
-                        self.logger.debug(f"Bing: Item {i+1} - Skipping result with no link")
-                except Exception as e:
-                    self.logger.warning(f"Bing: Item {i+1} - Error processing search result item: {e}")
-                    continue  # skip malformed items
-
-            self.logger.info(f"Bing search processed {len(result_items)} results, found {len(validated_results)} valid LinkedIn URLs")
-
-            # Sort by similarity score (highest first)
-            # validated_results.sort(key=lambda x: x[2], reverse=True)
-
-            # Extract just the URLs for backward compatibility
-            links = [result[0] for result in validated_results]
-
-            for l in links:
-                self.logger.debug(f"\t- {l}")
-
-            # If no results found and this was a quoted query, retry without quotes
-            if not links and quoted_query:
-                self.logger.info("No results found with quoted query, retrying without quotes...")
-                return self.run_bing_search(original_name, original_company, limit, threshold, quoted_query=False)
-
-            return links
-        except Exception as e:
-            self.logger.error(f"Error running Bing search: {e}")
-            cleanup_driver(self.bing_driver)
-            raise e
+                    if "linkedin.com/in/" not in real_url:
+                        if verbose:
+                            self.logger.debug("Bing: Item %s - Skipping non-LinkedIn redirect result: %s", i+1, real_url)
+                        continue
+                    if verbose:
+                        self.logger.debug("Bing: Item %s - URL: %s", i+1, real_url)
+                elif "linkedin.com/in/" in link:
+                    # Direct LinkedIn URL
+                    real_url = link
+                else:
+                    if verbose:
+                        self.logger.debug("Bing: Item %s - Skipping non-LinkedIn URL: %s", i+1, link)
+                    continue
+
+                validated = self._validate_profile_result(i, original_name, real_url, title, threshold, item['snippet'])
+                if validated is not None:
+                    validated_results.append(validated)
+            except RateLimitWaitCancelled:
+                raise
+            except Exception as e:
+                self.logger.warning("Bing: Item %s - Error processing search result item: %s", i+1, e)
+                continue  # skip malformed items
+
+        self.logger.info(
+            "Bing search processed %s results, found %s valid LinkedIn URLs%s",
+            len(result_items), len(validated_results),
+            "".join(f"\n  - {title} (similarity: {similarity:.2f})" for _, title, similarity, _ in validated_results)
+        )
+        return validated_results, unresolved
+
+    def _validate_profile_result(self, i, original_name, url, title, threshold, snippet=""):
+        """
+        Fuzzy-match one LinkedIn result against the contact's name, using the title
+        (without location) or, when there is no title, the name in the profile URL.
+
+        Returns:
+            tuple: (url, title, similarity, snippet) if the result matches, otherwise None
+        """
+        if title and title.strip():
+            # Clean title for comparison - remove location patterns like " - City, State, Country"
+            candidate_name = title.split(" - ")[0].strip() if " - " in title else title
+            source = ""
+        else:
+            url_parts = url.split('/')
+            if len(url_parts) < 5:
+                # If we can't extract name from URL, include with lower confidence
+                self.logger.info("Bing: Item %s - Including LinkedIn URL with unknown name: %s", i+1, url)
+                return (url, "Unknown", 0.5, snippet)
+            candidate_name = url_parts[4].replace('-', ' ').replace('_', ' ')
+            title = candidate_name
+            source = " (from URL)"
+
+        match_result = score_fuzzy_match(original_name, candidate_name, "person", threshold * 100)
+        similarity = match_result['score'] / 100  # Convert to 0-1 scale for consistency
+        self.logger.debug("Bing: Item %s - Comparing '%s' with '%s'%s (similarity: %.2f)", i+1, original_name, candidate_name, source, similarity)
+
+        if match_result['is_match']:
+            self.logger.debug("Bing: Item %s - Valid LinkedIn match found%s - %s (similarity: %.2f)", i+1, source, title, similarity)
+            return (url, title, similarity, snippet)
+        self.logger.debug("Bing: Item %s - Skipping low similarity match%s - %s (similarity: %.2f) - %s", i+1, source, title, similarity, url)
+        return None
 
     def cleanup(self):
-        cleanup_driver(self.bing_driver)
+        """Close the browser if one was started"""
+        if self._driver is not None:
+            cleanup_driver(self._driver, "Bing")
+            self._driver = None
 
 
 if __name__ == "__main__":
@@ -66,15 +66,289 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from typing import List, Literal, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import os
 import json
+import random
+import re
+import threading
+import time
 
+from app.config import get_env_float, get_env_int, get_env_str
 from app.matching import normalize_company_name, score_fuzzy_match
 from app.logger import get_logger
+from app.metrics import timed
+from app.find_profile_urls.search_cache import get_search_cache, search_cache_key
+from app.http_session import new_pooled_session
+from app.rate_limiter import RateLimitWaitCancelled, get_rate_limiter, record_block, record_success, wait_for_rate_limit
+from app.block_detection import BlockedError, check_http_response
+
+# Client settings; each can be overridden in .env (BRAVE_API_URL, BRAVE_CONNECT_TIMEOUT, ...)
+DEFAULT_BRAVE_API_URL = "https://api.search.brave.com/res/v1/web/search"
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 15
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Responses worth retrying, and the backoff between attempts: a random delay of up to
+# BACKOFF_BASE_SECONDS * 2**attempt ("full jitter"), never more than BACKOFF_MAX_SECONDS
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+
+def parse_rate_limit_headers(headers):
+    """
+    Parse Brave's X-RateLimit-* headers into one entry per quota window.
 
+    Brave sends comma separated values, one per window, e.g. a per-second and a
+    per-month quota: X-RateLimit-Limit: 1, 15000 / X-RateLimit-Remaining: 0, 14321 /
+    X-RateLimit-Reset: 1, 1419704 / X-RateLimit-Policy: 1;w=1, 15000;w=2592000
 
+    Returns:
+        list[dict]: {'limit', 'remaining', 'reset', 'window'} per window (window and
+            reset in seconds; window is None if no policy header was sent)
+    """
+    def values(name):
+        raw = headers.get(name)
+        if not raw:
+            return []
+        parsed = []
+        for part in raw.split(','):
+            try:
+                parsed.append(int(part.strip()))
+            except ValueError:
+                parsed.append(None)
+        return parsed
+
+    limits = values('X-RateLimit-Limit')
+    remaining = values('X-RateLimit-Remaining')
+    resets = values('X-RateLimit-Reset')
+    windows = []
+    for policy in (headers.get('X-RateLimit-Policy') or "").split(','):
+        window = None
+        for field in policy.split(';')[1:]:
+            key, _, value = field.strip().partition('=')
+            if key == 'w' and value.isdigit():
+                window = int(value)
+        windows.append(window)
+
+    quota = []
+    for i, limit in enumerate(limits):
+        quota.append({
+            'limit': limit,
+            'remaining': remaining[i] if i < len(remaining) else None,
+            'reset': resets[i] if i < len(resets) else None,
+            'window': windows[i] if i < len(windows) else None,
+        })
+    return quota
+
+
+class BraveClient:
+    """
+    Brave Search API client shared by every worker.
+
+    Requests go through one keep-alive connection pool with explicit connect/read
+    timeouts and are paced by the 'brave' rate limiter. HTTP 429 and 5xx answers (and
+    connection errors) are retried with jittered exponential backoff, honouring
+    Retry-After. The quota reported in the X-RateLimit-* headers is tracked: the rate
+    limiter is lowered to the plan's queries per second, and once a longer quota
+    (e.g. the monthly one) is used up, requests fail fast until it resets.
+    """
+
+    def __init__(self, api_key=None, base_url=None, connect_timeout=None, read_timeout=None,
+                 max_retries=None, max_concurrency=None):
+        self.logger = get_logger()
+        self.api_key = api_key or get_env_str('BRAVE_API_KEY')
+        self.base_url = base_url or get_env_str('BRAVE_API_URL', DEFAULT_BRAVE_API_URL)
+        self.connect_timeout = connect_timeout or get_env_float('BRAVE_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT)
+        self.read_timeout = read_timeout or get_env_float('BRAVE_READ_TIMEOUT', DEFAULT_READ_TIMEOUT)
+        self.max_retries = max_retries if max_retries is not None else get_env_int('BRAVE_MAX_RETRIES', DEFAULT_MAX_RETRIES)
+        self.max_concurrency = max(1, max_concurrency or get_env_int('BRAVE_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY))
+        self.session = new_pooled_session(self.max_concurrency, {
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        })
+        self._quota_lock = threading.Lock()
+        self.quota = []
+        self.quota_exhausted_until = 0.0
+        self._plan_rate_applied = False
+
+    def search(self, params):
+        """
+        Run one API query.
+
+        Args:
+            params: Query parameters (q, count, result_filter, ...)
+
+        Returns:
+            dict: The decoded JSON response
+
+        Raises:
+            BlockedError: If the quota is used up or Brave still answers 429 after the retries
+            requests.RequestException: If the request keeps failing
+            RateLimitWaitCancelled: If processing stopped while the request waited for its turn
+        """
+        with self._quota_lock:
+            exhausted_for = self.quota_exhausted_until - time.monotonic()
+        if exhausted_for > 0:
+            raise BlockedError('brave', f"quota exhausted, resets in {exhausted_for / 3600:.1f} hours")
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            wait_for_rate_limit('brave')
+            try:
+                with timed('brave_api'):
+                    response = self.session.get(
+                        self.base_url,
+                        headers={"x-subscription-token": self.api_key or ""},
+                        params=params,
+                        timeout=(self.connect_timeout, self.read_timeout)
+                    )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last_attempt:
+                    raise
+                delay = self._backoff(attempt)
+                self.logger.warning(f"Brave request failed ({e}) - retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            self._update_quota(response.headers)
+            if response.status_code in RETRY_STATUS_CODES and not last_attempt:
+                if response.status_code == 429:
+                    record_block('brave', 'HTTP 429')
+                delay = self._retry_after(response) or self._backoff(attempt)
+                self.logger.warning(f"Brave answered HTTP {response.status_code} - retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+                continue
+
+            check_http_response('brave', response)
+            response.raise_for_status()
+            record_success('brave')
+            return response.json()
+
+    def search_many(self, params_list, max_workers=None):
+        """
+        Run many API queries concurrently.
+
+        The queries share the 'brave' rate limiter, so they never exceed the plan's
+        queries per second however many run at once; concurrency only hides latency.
+
+        Args:
+            params_list: Query parameters per query
+            max_workers: Queries in flight at once (default: BRAVE_MAX_CONCURRENCY)
+
+        Returns:
+            list: The JSON response per query, in input order, or the exception
+                that query raised
+        """
+        def run(params):
+            try:
+                return self.search(params)
+            except Exception as e:
+                return e
+
+        params_list = list(params_list)
+        if not params_list:
+            return []
+        workers = min(max_workers or self.max_concurrency, len(params_list))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="brave-batch") as executor:
+            return list(executor.map(run, params_list))
 
+    def _backoff(self, attempt):
+        return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+    def _retry_after(self, response):
+        try:
+            return min(BACKOFF_MAX_SECONDS, max(0.0, float(response.headers.get('Retry-After'))))
+        except (TypeError, ValueError):
+            return None
+
+    def _update_quota(self, headers):
+        quota = parse_rate_limit_headers(headers)
+        if not quota:
+            return
+        # Without a policy header, go by Brave's documented order: the per-second
+        # window first, then the longer (e.g. monthly) quotas
+        has_policy = any(window['window'] is not None for window in quota)
+        with self._quota_lock:
+            self.quota = quota
+            for i, window in enumerate(quota):
+                length = window['window'] if has_policy else (1 if i == 0 else None)
+                if length is not None and length <= 1:
+                    if not self._plan_rate_applied and window['limit']:
+                        self._apply_plan_rate(window['limit'] * 60 / max(1, length))
+                # Only a window longer than a second (by its policy or its position) can run out
+                elif (length is not None or not has_policy) and window['remaining'] == 0 and window['reset']:
+                    self.quota_exhausted_until = time.monotonic() + window['reset']
+                    self.logger.error(f"Brave API quota of {window['limit']} queries used up - resets in {window['reset'] / 3600:.1f} hours")
+
+    def _apply_plan_rate(self, plan_requests_per_minute):
+        self._plan_rate_applied = True
+        limiter = get_rate_limiter('brave')
+        if plan_requests_per_minute < limiter.max_requests_per_minute:
+            self.logger.info(f"Brave plan allows {plan_requests_per_minute:g} queries/minute - lowering the Brave rate limit to match")
+            limiter.set_rate(plan_requests_per_minute)
+
+    def quota_stats(self):
+        """Return the quota windows from the last response"""
+        with self._quota_lock:
+            return [dict(window) for window in self.quota]
+
+
+_brave_client = None
+_brave_client_lock = threading.Lock()
+
+
+def get_brave_client():
+    """Get the Brave client shared by all workers (one connection pool per process)"""
+    global _brave_client
+    with _brave_client_lock:
+        if _brave_client is None:
+            _brave_client = BraveClient()
+        return _brave_client
+
+
+def brave_search_params(
+    query: str,
+    country: Optional[str] = "US",
+    search_lang: Optional[str] = "en",
+    ui_lang: Optional[str] = "en-US",
+    count: Optional[int] = 20,
+    offset: Optional[int] = 0,
+    safesearch: Optional[Literal["off", "moderate", "strict"]] = "moderate",
+    spellcheck: Optional[bool] = True,
+    freshness: Optional[str] = None,
+    text_decorations: Optional[bool] = True,
+    result_filter: Optional[Literal["discussions", "faq", "infobox", "news", "query", "summarizer", "videos", "web", "locations"]] = "web",
+):
+    """Build the API query parameters for brave_search (see there for the arguments)"""
+    # Build params dict, only including non-default values
+    params = {"q": query}  # query is always required
+
+    # Only add parameters if they differ from defaults
+    if country != "US":
+        params["country"] = country
+    if search_lang != "en":
+        params["search_lang"] = search_lang
+    if ui_lang != "en-US":
+        params["ui_lang"] = ui_lang
+    if count != 20:
+        params["count"] = count
+    if offset != 0:
+        params["offset"] = offset
+    if safesearch != "moderate":
+        params["safesearch"] = safesearch
+    if spellcheck != True:
+        params["spellcheck"] = spellcheck
+    if freshness is not None:
+        params["freshness"] = freshness
+    if text_decorations != True:
+        params["text_decorations"] = text_decorations
+    if result_filter is not None:
+        params["result_filter"] = result_filter
+
+    return params
 
 
 def brave_search(
@@ -148,45 +422,42 @@ def brave_search(
         - extra_snippets: Extra snippets in results. The default is False.
         - summary: Enable summary for query. The default is False.
     """
-    # Build params dict, only including non-default values
-    params = {"q": query}  # query is always required
-
-    # Only add parameters if they differ from defaults
-    if country != "US":
-        params["country"] = country
-    if search_lang != "en":
-        params["search_lang"] = search_lang
-    if ui_lang != "en-US":
-        params["ui_lang"] = ui_lang
-    if count != 20:
-        params["count"] = count
-    if offset != 0:
-        params["offset"] = offset
-    if safesearch != "moderate":
-        params["safesearch"] = safesearch
-    if spellcheck != True:
-        params["spellcheck"] = spellcheck
-    if freshness is not None:
-        params["freshness"] = freshness
-    if text_decorations != True:
-        params["text_decorations"] = text_decorations
-    if result_filter is not None:
-        params["result_filter"] = result_filter
-
-    response = requests.get(
-        "https://api.search.brave.com/res/v1/web/search",
-        headers={
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "x-subscription-token": os.getenv("BRAVE_API_KEY")
-        },
-        params=params
-    ).json()
+    params = brave_search_params(
+        query, country, search_lang, ui_lang, count, offset, safesearch,
+        spellcheck, freshness, text_decorations, result_filter
+    )
+    return parse_brave_response(get_brave_client().search(params))
 
 
+def brave_search_many(queries, max_workers=None, **options):
+    """
+    Run brave_search for many queries concurrently, within the Brave rate limit.
 
-    response_query = response["query"]
+    Args:
+        queries: Query strings
+        max_workers: Queries in flight at once (default: BRAVE_MAX_CONCURRENCY)
+        **options: brave_search arguments applied to every query
 
+    Returns:
+        list[list[dict]]: The results per query, in input order ([] for a failed query)
+    """
+    logger = get_logger()
+    responses = get_brave_client().search_many(
+        [brave_search_params(query, **options) for query in queries],
+        max_workers=max_workers
+    )
+    results = []
+    for query, response in zip(queries, responses):
+        if isinstance(response, Exception):
+            logger.warning(f"Brave search failed for '{query}': {response}")
+            results.append([])
+        else:
+            results.append(parse_brave_response(response))
+    return results
+
+
+def parse_brave_response(response):
+    """Flatten a Brave API response into {'title', 'url', 'description', 'site'} records"""
     response_results = []
     for t in ["discussions", "faq", "infobox", "news", "summarizer", "videos",
               "web", "locations"]:
@@ -209,7 +480,7 @@ class BraveSearch:
     def __init__(self):
         self.logger = get_logger()
 
-    def run_brave_search(self, name: str, company: str, limit: int = 5, threshold: float = 0.6) -> List[Tuple[str, str, float]]:
+    def run_brave_search(self, name: str, company: str, limit: int = 5, threshold: float = 0.6) -> List[Tuple[str, str, float, str]]:
         """
         Search Brave for LinkedIn profiles with fuzzy validation
 
@@ -220,8 +491,22 @@ class BraveSearch:
             threshold (float): Minimum fuzzy match threshold
 
         Returns:
-            List[Tuple[str, str, float]]: List of (url, title, similarity_score) tuples
+            List[Tuple[str, str, float, str]]: List of (url, title, similarity_score, description) tuples
+
+        Raises:
+            BlockedError: If the API quota is used up or Brave keeps answering 429
+            RateLimitWaitCancelled: If processing stopped while the query waited for its turn
         """
+        # Serve repeat searches from the persistent search cache (as for Bing, empty results
+        # are not cached, so the next search tries again)
+        cache = get_search_cache()
+        variant = f"quoted|threshold={threshold}|limit={limit}"
+        cache_key = search_cache_key(name, company, "brave", variant)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Brave: Search cache hit for '{name}' at '{company}' ({variant}) - {len(cached)} results")
+            return [tuple(result) for result in cached]
+
         try:
             self.logger.info(f"Starting Brave search for '{name}' at '{company}' with threshold {threshold}")
 
@@ -229,22 +514,24 @@ class BraveSearch:
             search_query = f'site:linkedin.com/in "{name}" "{company}"'
 
             # Perform Brave search
-            self.logger.debug(f"Brave search query: {search_query}")
+            self.logger.debug("Brave search query: %s", search_query)
             results = brave_search(
                 query=search_query,
                 count=limit,
                 result_filter="web"
             )
 
-            self.logger.debug(f"Brave search returned {len(results)} raw results")
+            self.logger.debug("Brave search returned %s raw results", len(results))
             for i, result in enumerate(results):
-                self.logger.debug(f"Raw result {i+1}: {result}")
+                self.logger.debug("Raw result %s: %s", i+1, result)
 
             validated_results = []
             for result in results:
-                self.logger.debug(f"Processing result: {result.get('title', 'No title')} - {result.get('url', 'No URL')}")
+                self.logger.debug("Processing result: %s - %s", result.get('title', 'No title'), result.get('url', 'No URL'))
                 if "linkedin.com/in/" in result.get("url", ""):
                     title = result.get("title", "")
+                    # Descriptions carry <strong> hit highlighting
+                    description = re.sub(r"<[^>]+>", "", result.get("description") or "")
 
                     # Clean up the title - remove common LinkedIn suffixes
                     if title:
@@ -272,13 +559,13 @@ class BraveSearch:
                         # Use your custom fuzzy matching function
                         match_result = score_fuzzy_match(name, clean_title, "person", threshold * 100)
                         similarity = match_result['score'] / 100  # Convert to 0-1 scale for consistency
-                        self.logger.debug(f"Comparing '{name}' with '{clean_title}' (similarity: {similarity:.2f})")
+                        self.logger.debug("Comparing '%s' with '%s' (similarity: %.2f)", name, clean_title, similarity)
 
                         if match_result['is_match']:
-                            validated_results.append((result["url"], title, similarity))
-                            self.logger.info(f"Brave: Valid match found - {title} (similarity: {similarity:.2f})")
+                            validated_results.append((result["url"], title, similarity, description))
+                            self.logger.info("Brave: Valid match found - %s (similarity: %.2f)", title, similarity)
                         else:
-                            self.logger.debug(f"Brave: Skipping low similarity match - {title} (similarity: {similarity:.2f})")
+                            self.logger.debug("Brave: Skipping low similarity match - %s (similarity: %.2f)", title, similarity)
                     else:
                         # Title is empty, extract name from LinkedIn URL for validation
                         url_parts = result["url"].split('/')
@@ -287,44 +574,42 @@ class BraveSearch:
                             # Use your custom fuzzy matching function
                             match_result = score_fuzzy_match(name, profile_name, "person", threshold * 100)
                             similarity = match_result['score'] / 100  # Convert to 0-1 scale for consistency
-                            self.logger.debug(f"Comparing '{name}' with '{profile_name}' from URL (similarity: {similarity:.2f})")
+                            self.logger.debug("Comparing '%s' with '%s' from URL (similarity: %.2f)", name, profile_name, similarity)
 
                             if match_result['is_match']:
-                                validated_results.append((result["url"], profile_name, similarity))
-                                self.logger.info(f"Brave: Valid match found (from URL) - {profile_name} (similarity: {similarity:.2f})")
+                                validated_results.append((result["url"], profile_name, similarity, description))
+                                self.logger.info("Brave: Valid match found (from URL) - %s (similarity: %.2f)", profile_name, similarity)
                             else:
-                                self.logger.debug(f"Brave: Skipping low similarity match (from URL) - {profile_name} (similarity: {similarity:.2f})")
+                                self.logger.debug("Brave: Skipping low similarity match (from URL) - %s (similarity: %.2f)", profile_name, similarity)
                         else:
                             # If we can't extract name from URL, include with lower confidence
-                            validated_results.append((result["url"], "Unknown", 0.5))
-                            self.logger.debug(f"Brave: Including URL with unknown name: {result['url']}")
+                            validated_results.append((result["url"], "Unknown", 0.5, description))
+                            self.logger.debug("Brave: Including URL with unknown name: %s", result['url'])
 
             # Sort by similarity score (highest first)
             validated_results.sort(key=lambda x: x[2], reverse=True)
 
-            self.logger.info(f"Brave search completed. Found {len(validated_results)} validated results")
+            self.logger.info("Brave search completed. Found %s validated results", len(validated_results))
+            # An empty answer may be a passing API hiccup; only results are kept for the TTL
+            if validated_results:
+                cache.set(cache_key, validated_results)
             return validated_results
 
+        except (BlockedError, RateLimitWaitCancelled):
+            # Out of quota, still rate limited or stopping: let the caller leave the row for a retry
+            raise
         except Exception as e:
             self.logger.error(f"Error in Brave search: {e}")
             return []
 
 
 if __name__ == "__main__":
-    # Example usage:
+    # Example usage against the live API (needs BRAVE_API_KEY); the client is covered by
+    # tests/test_brave_search.py
     NAME = "Anas Hayajneh"
 
     COMPANY = "aq network"
 
-    query = f'site:linkedin.com/in "{NAME}" {COMPANY}'
-    # results = brave_search(
-    #     query,
-    #     # spellcheck=False,
-    #     result_filter="web"
-    #     # country="mx",
-    # )
-    # print(json.dumps(results, indent=4))
-
     normalized_company_name = normalize_company_name(COMPANY)
 
     brave_search_instance = BraveSearch()
@@ -19,13 +19,13 @@ def fuzzy_match(name1: str, name2: str, threshold: float) -> bool:
     name1_clean = re.sub(r'[^\w\s]', '', name1.lower().strip())
     name2_clean = re.sub(r'[^\w\s]', '', name2.lower().strip())
 
-    print(f"name1_clean: {name1_clean}")
-    print(f"name2_clean: {name2_clean}")
+    logger = get_logger()
+    logger.debug("name1_clean: %s", name1_clean)
+    logger.debug("name2_clean: %s", name2_clean)
 
     # Calculate similarity ratio
-    similarity = SequenceMatcher(None, name1_clean, name2_clean).ratio()
     similarity = fuzz.token_set_ratio(name1_clean, name2_clean)
-    print(similarity)
+    logger.debug("similarity: %s", similarity)
 
     return similarity >= threshold
 
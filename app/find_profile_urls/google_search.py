@@ -1,6 +1,7 @@
 from googlesearch import search
 from typing import List, Tuple
 from app.logger import get_logger
+from app.rate_limiter import get_rate_limiter
 import time
 import random
 from difflib import SequenceMatcher
@@ -9,8 +10,8 @@ from difflib import SequenceMatcher
 class GoogleSearch:
     def __init__(self):
         self.logger = get_logger()
-        self.last_request_time = 0
-        self.min_delay_between_requests = 3  # Minimum 3 seconds between requests
+        # Shared with every other GoogleSearch instance and thread
+        self.rate_limiter = get_rate_limiter('google')
 
     def run_google_search(self, name: str, company: str, limit: int = 5, threshold: float = 0.6, max_retries: int = 3) -> List[Tuple[str, str, float]]:
         """
@@ -28,13 +29,8 @@ class GoogleSearch:
         """
         for attempt in range(max_retries):
             try:
-                # Rate limiting - ensure minimum delay between requests
-                current_time = time.time()
-                time_since_last_request = current_time - self.last_request_time
-                if time_since_last_request < self.min_delay_between_requests:
-                    sleep_time = self.min_delay_between_requests - time_since_last_request
-                    self.logger.info(f"Rate limiting: waiting {sleep_time:.1f} seconds before Google search")
-                    time.sleep(sleep_time)
+                # Rate limiting - wait for the shared Google budget
+                self.rate_limiter.acquire()
 
                 self.logger.info(f"Starting Google search for '{name}' at '{company}' (attempt {attempt + 1}/{max_retries})")
 
@@ -42,9 +38,6 @@ class GoogleSearch:
                 search_query = f'site:linkedin.com/in "{name}" "{company}"'
                 results = search(search_query, num_results=limit)
 
-                # Update last request time
-                self.last_request_time = time.time()
-
                 validated_results = []
                 for url in results:
                     if "linkedin.com/in/" in url:
@@ -66,6 +59,7 @@ class GoogleSearch:
                             validated_results.append((url, "Unknown", 0.5))
                             self.logger.info(f"Google: Including URL with unknown name: {url}")
 
+                self.rate_limiter.record_success()
                 self.logger.info(f"Google search completed. Found {len(validated_results)} validated results")
                 return validated_results
 
@@ -75,6 +69,7 @@ class GoogleSearch:
 
                 # Check if it's a rate limit error
                 if "429" in error_msg or "Too Many Requests" in error_msg:
+                    self.rate_limiter.record_block("HTTP 429")
                     if attempt < max_retries - 1:
                         # Exponential backoff: wait longer for each retry
                         wait_time = (2 ** attempt) + random.uniform(2, 5)
@@ -0,0 +1,225 @@
+import json
+import os
+import re
+import threading
+import time
+from rapidfuzz import fuzz
+from app.config import get_env_bool
+from app.logger import get_logger, logs_dir
+from app.matching import normalize_person_name
+from app.parse_profile.profile_cache import get_profile_cache, profile_cache_key
+from app.profile_url import profile_key
+from .serp_evidence import score_snippet_evidence
+
+# Weight of each signal in a candidate's ranking score (all signals are 0-1):
+#   name    - name similarity from the search stage
+#   company - company evidence in the result title/snippet (past employers count 0.8)
+#   slug    - name similarity of the /in/ slug (catches results with a generic title)
+#   seen    - positions already cached, so checking it costs no page load
+RANKING_WEIGHTS = {'name': 0.35, 'company': 0.4, 'slug': 0.15, 'seen': 0.1}
+PAST_EMPLOYER_FACTOR = 0.8
+
+# Similarity assumed for a bare URL candidate that carries no search result
+UNKNOWN_NAME_SIMILARITY = 0.5
+
+# Every validation pass is appended here (one JSON object per line) when
+# RECORD_CANDIDATES=true (off by default: it holds contact names and companies and
+# grows with every run), for the offline benchmark in this module's __main__
+CANDIDATE_LOG = os.path.join(logs_dir, 'candidate_rankings.jsonl')
+
+# LinkedIn appends an id to slugs that are taken (jane-doe-1a2b3c, jane-doe-48213)
+SLUG_ID = re.compile(r"^(?=.*\d)[0-9a-z]{3,}$")
+
+_record_lock = threading.Lock()
+_visit_lock = threading.Lock()
+_visits_per_contact = []
+
+
+def slug_similarity(full_name, url):
+    """Similarity (0-1) of a contact's name and the words of a profile URL's slug"""
+    key = profile_key(url)
+    if not key:
+        return 0.0
+    words = [word for word in re.split(r"[-_.]+", key) if word]
+    while len(words) > 1 and SLUG_ID.match(words[-1]):
+        words.pop()
+    return fuzz.token_set_ratio(normalize_person_name(full_name), normalize_person_name(" ".join(words))) / 100
+
+
+def candidate_features(candidate, position, full_name, company_name, threshold=75, use_snippets=True):
+    """
+    Collect the ranking signals for one candidate.
+
+    Args:
+        candidate: A profile URL or a (url, title, similarity, snippet) search result
+        position: The candidate's place in search order (0-based)
+
+    Returns:
+        dict: The signals (see RANKING_WEIGHTS) plus 'key', 'search_rank' and 'evidence'
+    """
+    is_result = not isinstance(candidate, str)
+    url = candidate[0] if is_result else candidate
+    evidence = None
+    if use_snippets and is_result and len(candidate) >= 4:
+        evidence = score_snippet_evidence(candidate[1], candidate[3], company_name, threshold)
+
+    company = 0.0
+    if evidence and evidence['is_match']:
+        company = evidence['score'] / 100 * (1.0 if evidence['is_current'] else PAST_EMPLOYER_FACTOR)
+
+    return {
+        'key': profile_key(url),
+        'search_rank': position,
+        'name': float(candidate[2]) if is_result else UNKNOWN_NAME_SIMILARITY,
+        'company': company,
+        'slug': slug_similarity(full_name, url),
+        'seen': 1.0 if get_profile_cache().contains(profile_cache_key(url)) else 0.0,
+        'evidence': evidence
+    }
+
+
+def ranking_score(features, weights=None):
+    """Weighted sum of a candidate's signals - a relative estimate of the chance it matches"""
+    weights = weights or RANKING_WEIGHTS
+    return sum(weight * features[signal] for signal, weight in weights.items())
+
+
+def rank_candidates(candidates, full_name, company_name, threshold=75, use_snippets=True, enabled=None):
+    """
+    Order candidates by how likely they are to be the contact, before any profile visit.
+
+    Args:
+        candidates: Profile URLs or (url, title, similarity, snippet) search results, in search order
+        full_name: The contact's name
+        company_name: The contact's company
+        threshold: Company match threshold (0-100)
+        use_snippets: Use company evidence from titles/snippets
+        enabled: Rank at all (default: CANDIDATE_RANKING from .env, else True);
+            when False the search order is kept
+
+    Returns:
+        list[tuple]: (candidate, features) pairs, most likely first. Ties keep search order.
+    """
+    if enabled is None:
+        enabled = get_env_bool('CANDIDATE_RANKING', True)
+    ranked = [
+        (candidate, candidate_features(candidate, position, full_name, company_name, threshold, use_snippets))
+        for position, candidate in enumerate(candidates)
+    ]
+    if enabled:
+        ranked.sort(key=lambda entry: ranking_score(entry[1]), reverse=True)
+    return ranked
+
+
+def record_candidates(full_name, company_name, source, ranked, visited_keys, matched_url, match_score):
+    """
+    Append one validation pass to the candidate log for the offline benchmark.
+
+    Args:
+        ranked: rank_candidates output for the pass
+        visited_keys: Profile keys visited in this pass, in visit order
+        matched_url: The profile accepted for the contact, or None
+        match_score: Its company match score
+    """
+    if not get_env_bool('RECORD_CANDIDATES', False):
+        return
+    record = {
+        'time': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'name': full_name,
+        'company': company_name,
+        'source': source,
+        'candidates': [
+            {signal: features[signal] for signal in ('key', 'search_rank', 'name', 'company', 'slug', 'seen')}
+            for _, features in ranked
+        ],
+        'visited': list(visited_keys),
+        'matched': profile_key(matched_url) if matched_url else None,
+        'match_score': match_score
+    }
+    try:
+        with _record_lock, open(CANDIDATE_LOG, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        get_logger().warning(f"Could not record candidates: {e}")
+
+
+def record_contact_visits(visits):
+    """Count the profiles checked for one contact"""
+    with _visit_lock:
+        _visits_per_contact.append(visits)
+
+
+def visit_stats():
+    """Return profile visits for this run: totals, the average per contact and a histogram"""
+    with _visit_lock:
+        visits = list(_visits_per_contact)
+    histogram = {}
+    for count in visits:
+        histogram[count] = histogram.get(count, 0) + 1
+    return {
+        'contacts': len(visits),
+        'visits': sum(visits),
+        'average': sum(visits) / len(visits) if visits else 0.0,
+        'max': max(visits) if visits else 0,
+        'histogram': dict(sorted(histogram.items()))
+    }
+
+
+def reset_visit_stats():
+    with _visit_lock:
+        _visits_per_contact.clear()
+
+
+def benchmark(records, weights=None):
+    """
+    Replay recorded passes: how many visits would each order need to reach the match?
+
+    Only passes that found a match count; candidates after the match were never
+    visited, so the matched profile is assumed to be the only one that matches.
+
+    Returns:
+        dict: Passes replayed and mean visits / first-visit hit rate for search order and ranking
+    """
+    search_visits, ranked_visits = [], []
+    for record in records:
+        matched = record.get('matched')
+        candidates = record.get('candidates') or []
+        keys = [candidate['key'] for candidate in candidates]
+        if not matched or matched not in keys:
+            continue
+        by_search = sorted(candidates, key=lambda candidate: candidate['search_rank'])
+        by_ranking = sorted(by_search, key=lambda candidate: ranking_score(candidate, weights), reverse=True)
+        search_visits.append([candidate['key'] for candidate in by_search].index(matched) + 1)
+        ranked_visits.append([candidate['key'] for candidate in by_ranking].index(matched) + 1)
+
+    def summary(visits):
+        if not visits:
+            return {'mean_visits': 0.0, 'first_visit': 0.0}
+        return {
+            'mean_visits': sum(visits) / len(visits),
+            'first_visit': sum(1 for count in visits if count == 1) / len(visits)
+        }
+
+    return {'passes': len(search_visits), 'search_order': summary(search_visits), 'ranked': summary(ranked_visits)}
+
+
+if __name__ == "__main__":
+    # Offline benchmark: replay the recorded runs with the current weights
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else CANDIDATE_LOG
+    if not os.path.exists(path):
+        print(f"No recorded runs at {path} - process some contacts first (RECORD_CANDIDATES=true)")
+        raise SystemExit(1)
+    with open(path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    result = benchmark(records)
+    print(f"{len(records)} recorded passes, {result['passes']} with a match")
+    for label, key in (("Search order", 'search_order'), ("Ranked", 'ranked')):
+        stats = result[key]
+        print(f"{label:13} {stats['mean_visits']:.2f} visits to the match, first visit right {stats['first_visit']:.0%}")
+    for signal in RANKING_WEIGHTS:
+        # Leave-one-out: how much does each signal contribute?
+        weights = {name: weight for name, weight in RANKING_WEIGHTS.items() if name != signal}
+        print(f"  without {signal:8} {benchmark(records, weights)['ranked']['mean_visits']:.2f} visits")
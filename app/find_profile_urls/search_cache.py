@@ -0,0 +1,39 @@
+import threading
+from app.cache import PersistentCache, make_cache_key
+from app.config import get_env_float
+from app.matching import normalize_company_name, normalize_person_name
+
+# Bump when the shape of cached search results changes, so old entries are not reused
+# (2: results carry their snippet as a fourth element)
+SEARCH_CACHE_VERSION = 2
+
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """
+    Get the shared search-result cache.
+
+    The TTL is read from SEARCH_CACHE_TTL_DAYS (default 30 days; 0 disables the cache).
+    """
+    global _search_cache
+    with _search_cache_lock:
+        if _search_cache is None:
+            ttl_days = get_env_float('SEARCH_CACHE_TTL_DAYS', 30)
+            _search_cache = PersistentCache('search_results', ttl_seconds=ttl_days * 24 * 60 * 60)
+        return _search_cache
+
+
+def search_cache_key(name, company, engine, variant):
+    """
+    Build the cache key for one search: normalized name and company, the search
+    engine and the query variant (quoting, threshold and limit all change the results).
+    """
+    return make_cache_key(
+        f"v{SEARCH_CACHE_VERSION}",
+        normalize_person_name(name),
+        normalize_company_name(company),
+        engine,
+        variant
+    )
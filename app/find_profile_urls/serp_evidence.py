@@ -0,0 +1,156 @@
+import re
+from app.config import get_env_float, get_env_str
+from app.logger import get_logger
+from app.matching import score_fuzzy_match
+
+# How far search snippets are trusted before a profile is opened; set SNIPPET_TRUST in .env
+#   off    - ignore snippets when ranking candidates (see ranking.py)
+#   order  - rank candidates whose snippet names the company first
+#   accept - also accept a candidate whose title/snippet names the company as their
+#            current employer, without loading the profile at all
+SNIPPET_TRUST_LEVELS = ('off', 'order', 'accept')
+DEFAULT_SNIPPET_TRUST = 'order'
+
+# Company score (0-100) snippet evidence needs before a candidate is accepted unseen
+DEFAULT_SNIPPET_ACCEPT_SCORE = 95
+
+# Phrases in LinkedIn result titles and snippets that name an employer, and whether
+# they describe the current one (None: current unless the clause marks it as past,
+# see PAST_MARKER). Phrases end at the separators LinkedIn uses between fields
+# (·, |, ;) or at the end of a sentence.
+_PHRASE_END = r"[^·|;\n]+?(?=\s*(?:[·|;\n]|\.\s|\.$|$))"
+EVIDENCE_PATTERNS = [
+    (re.compile(r"\bExperience:\s*(" + _PHRASE_END + ")", re.IGNORECASE), True),
+    (re.compile(r"\bCurrent(?:ly)?(?:\s+company)?:\s*(" + _PHRASE_END + ")", re.IGNORECASE), True),
+    (re.compile(r"\b(?:Previous|Past):\s*(" + _PHRASE_END + ")", re.IGNORECASE), False),
+    (re.compile(r"(?:\bat|@)\s+([A-Z0-9&][^·|;,\n.]*)"), None),
+]
+TAGS = re.compile(r"<[^>]+>")
+
+# 'Former engineer at Acme', 'previously @ Acme', 'Ex-CTO at Acme': a past-tense word
+# in the same clause, before 'at'
+PAST_MARKER = re.compile(r"\b(?:former(?:ly)?|previous(?:ly)?|past|retired|was|used to)\b|\bex[-\s]", re.IGNORECASE)
+CLAUSE_START = re.compile(r"[·|;\n]|\.\s")
+
+
+def _is_past_clause(text, position):
+    """True if the clause that ends at position carries a past-tense marker"""
+    clause_start = 0
+    for separator in CLAUSE_START.finditer(text, 0, position):
+        clause_start = separator.end()
+    return bool(PAST_MARKER.search(text, clause_start, position))
+
+
+def get_snippet_trust(trust=None):
+    """Return a valid snippet trust level, defaulting to SNIPPET_TRUST from .env"""
+    trust = (trust or get_env_str('SNIPPET_TRUST', DEFAULT_SNIPPET_TRUST) or DEFAULT_SNIPPET_TRUST).lower()
+    if trust not in SNIPPET_TRUST_LEVELS:
+        get_logger().warning(f"Unknown snippet trust '{trust}' - using '{DEFAULT_SNIPPET_TRUST}'")
+        return DEFAULT_SNIPPET_TRUST
+    return trust
+
+
+def company_phrases(title, snippet):
+    """
+    Pull the employer names a search result mentions.
+
+    Args:
+        title: Result title without the ' | LinkedIn' suffix, e.g. 'Jane Doe - Engineer - Acme'
+        snippet: Result snippet/description
+
+    Returns:
+        list[tuple[str, bool]]: (phrase, is_current) pairs
+    """
+    phrases = []
+    # LinkedIn titles read 'Name - Headline - Current company'. With only two segments
+    # the second is as often a headline as a company, so it is not current evidence.
+    segments = [segment.strip() for segment in (title or "").split(" - ")]
+    if len(segments) >= 3:
+        phrases.append((segments[-1], True))
+    elif len(segments) == 2:
+        phrases.append((segments[1], False))
+
+    text = TAGS.sub("", f"{title or ''} · {snippet or ''}")
+    for pattern, is_current in EVIDENCE_PATTERNS:
+        for match in pattern.finditer(text):
+            if is_current is None:
+                is_current_match = not _is_past_clause(text, match.start())
+            else:
+                is_current_match = is_current
+            for phrase in match.group(1).split(",") if not is_current_match else [match.group(1)]:
+                phrase = phrase.strip(" .")
+                if phrase:
+                    phrases.append((phrase, is_current_match))
+    return phrases
+
+
+def score_snippet_evidence(title, snippet, company_name, threshold=75):
+    """
+    Score how strongly a search result ties the candidate to the company, using the
+    same company-name normalization as the profile check.
+
+    Returns:
+        dict: {'score', 'is_match', 'is_current', 'phrase'} for the best-scoring phrase
+            (score 0 and phrase None when the result names no employer)
+    """
+    best = {'score': 0, 'is_match': False, 'is_current': False, 'phrase': None}
+    if not company_name:
+        return best
+    for phrase, is_current in company_phrases(title, snippet):
+        result = score_fuzzy_match(company_name, phrase, "company", threshold)
+        # Prefer current-employer evidence when two phrases score the same
+        if (result['score'], is_current) > (best['score'], best['is_current']):
+            best = {
+                'score': result['score'],
+                'is_match': result['is_match'],
+                'is_current': is_current,
+                'phrase': phrase
+            }
+    return best
+
+
+def snippet_match(title, evidence):
+    """
+    Build a validate_search_results-style best match from snippet evidence alone.
+    'all_positions' is empty because the profile was never loaded.
+    """
+    return {
+        'all_positions': [],
+        'evidence': 'snippet',
+        'company_match': {
+            'has_current_match': evidence['is_current'],
+            'has_any_match': True,
+            'any_match': {
+                'position': {'company': evidence['phrase'], 'job_title': title, 'is_current': evidence['is_current']},
+                'match_result': {'score': evidence['score'], 'is_match': True, 'match_type': 'search_snippet'}
+            }
+        }
+    }
+
+
+def accepts_without_visit(evidence, trust=None, accept_score=None):
+    """
+    True if snippet evidence alone is enough to accept a candidate: trust is 'accept'
+    and the result names the company as the current employer with a high score.
+
+    Args:
+        evidence: score_snippet_evidence output, or None
+        trust: 'off', 'order' or 'accept' (default: SNIPPET_TRUST from .env)
+        accept_score: Minimum score (default: SNIPPET_ACCEPT_SCORE, else 95)
+    """
+    if not evidence or get_snippet_trust(trust) != 'accept':
+        return False
+    if accept_score is None:
+        accept_score = get_env_float('SNIPPET_ACCEPT_SCORE', DEFAULT_SNIPPET_ACCEPT_SCORE)
+    return evidence['is_match'] and evidence['is_current'] and evidence['score'] >= accept_score
+
+
+if __name__ == "__main__":
+    examples = [
+        ("Jane Doe - Senior Engineer - Acme Corp", "Senior Engineer at Acme Corp · Experience: Acme Corp · Education: MIT · Location: Austin"),
+        ("John Doe - Sales", "View John Doe's profile on LinkedIn. Current: Globex; Previous: Acme Corporation, Initech."),
+        ("Jim Doe", "Jim Doe. Marketing lead @ Initech. Location: Boston."),
+        ("Jake Doe - Acme", ""),
+    ]
+    for title, snippet in examples:
+        print(f"{title!r}: {score_snippet_evidence(title, snippet, 'Acme Corp')}")
@@ -0,0 +1,72 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from app.config import get_env_int
+
+# Requests made without a browser still look like the browser they stand in for
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
+    ),
+    'Accept': "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    'Accept-Language': "en-US,en;q=0.9",
+}
+
+# Connections kept open per host; set HTTP_POOL_SIZE in .env to match the worker count
+DEFAULT_POOL_SIZE = 16
+
+# Seconds to wait for a connection before giving up (read timeouts are set per request)
+CONNECT_TIMEOUT = 5
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def new_pooled_session(pool_size=DEFAULT_POOL_SIZE, headers=None):
+    """Make a requests session that keeps up to pool_size connections per host alive"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def get_http_session():
+    """
+    Get the shared requests session used for HTML fetches.
+
+    One session for the whole process keeps TCP/TLS connections alive between
+    requests, and its connection pool is sized for the worker threads using it.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = new_pooled_session(get_env_int('HTTP_POOL_SIZE', DEFAULT_POOL_SIZE), DEFAULT_HEADERS)
+        return _session
+
+
+def close_http_session():
+    """Close the shared session's connections (a new session is made on next use)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def resolve_redirect(url, timeout=10):
+    """
+    Follow a redirect chain with HEAD requests on the shared session (no body is
+    downloaded and no browser is involved).
+
+    Returns:
+        str: The final URL
+
+    Raises:
+        requests.RequestException: If the request fails
+    """
+    response = get_http_session().head(url, allow_redirects=True, timeout=(CONNECT_TIMEOUT, timeout))
+    return response.url
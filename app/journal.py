@@ -0,0 +1,151 @@
+import json
+import os
+import threading
+from datetime import datetime
+from app.checkpoint import write_csv_atomic
+from app.logger import get_logger
+
+
+def journal_path_for(csv_path):
+    """Path of the results journal that belongs to a contacts CSV"""
+    return f"{csv_path}.journal.jsonl"
+
+
+# Journal of the default contacts.csv
+DEFAULT_JOURNAL_PATH = journal_path_for('contacts.csv')
+
+
+def _json_value(value):
+    """json.dumps fallback: numpy scalars (DataFrame index labels, cell values) as Python values"""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+class ResultsJournal:
+    """
+    Append-only record of finished contacts, one JSON object per line.
+
+    Appending a contact costs the same however long the contact list is, and an
+    interrupted write can only cut off the last line, which replay skips. The CSV is
+    written from the journal when a run ends (or with `python -m app.journal`), and
+    the journal is cleared once the CSV holds every journaled result.
+
+    Each record holds the row key (DataFrame index), the contact's name and company
+    (checked on replay, so a journal is never applied to a different list), the
+    column updates and how long the contact took.
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def append(self, key, full_name, company_name, updates, seconds=None):
+        """Journal one finished contact and flush it to disk"""
+        record = {
+            'key': key,
+            'name': full_name,
+            'company': company_name,
+            'updates': updates,
+            'seconds': round(seconds, 3) if seconds is not None else None,
+            'time': datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        }
+        line = json.dumps(record, default=_json_value) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+
+    def records(self):
+        """Yield every complete record in the journal, oldest first"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A write cut off by a crash; the contact is simply processed again
+                    get_logger().warning("Skipping unreadable journal line %s in %s", line_number, self.path)
+
+    def replay(self, contacts_df):
+        """
+        Apply every journaled result to contacts_df (later records win).
+
+        Returns:
+            tuple[int, int]: (records applied, records skipped because their row is
+                missing or holds a different contact)
+        """
+        applied = skipped = 0
+        for record in self.records():
+            key = record.get('key')
+            if key not in contacts_df.index or not self._matches(contacts_df, key, record):
+                skipped += 1
+                continue
+            for column, value in (record.get('updates') or {}).items():
+                if column not in contacts_df.columns:
+                    contacts_df[column] = ''
+                contacts_df.at[key, column] = value
+            applied += 1
+        return applied, skipped
+
+    @staticmethod
+    def _matches(contacts_df, key, record):
+        row = contacts_df.loc[key]
+        return (
+            f"{row['First Name']} {row['Last Name']}" == record.get('name')
+            and str(row['Account Name']) == str(record.get('company'))
+        )
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self):
+        """Delete the journal (call once its results are saved in the CSV)"""
+        self.close()
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def materialize(csv_path, journal_path=None):
+    """
+    Write a journal's results into its CSV and clear the journal. A journal with
+    records that match no row of the CSV is kept, so those results are not lost.
+
+    Returns:
+        int: Number of journaled contacts written
+    """
+    import pandas as pd
+
+    journal = ResultsJournal(journal_path or journal_path_for(csv_path))
+    contacts_df = pd.read_csv(csv_path, encoding='utf-8')
+    for column in ('Valid', 'Note', 'Profile URL'):
+        if column in contacts_df.columns:
+            contacts_df[column] = contacts_df[column].astype('object')
+    applied, skipped = journal.replay(contacts_df)
+    write_csv_atomic(contacts_df, csv_path)
+    if skipped:
+        get_logger().warning("%s journal records did not match a row of %s - keeping %s", skipped, csv_path, journal.path)
+        journal.close()
+    else:
+        journal.clear()
+    return applied
+
+
+if __name__ == "__main__":
+    # Write the results of an interrupted run into its CSV:
+    #     python -m app.journal [contacts.csv]
+    import sys
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else 'contacts.csv'
+    journal_path = journal_path_for(csv_path)
+    if not os.path.exists(journal_path):
+        print(f"No journal at {journal_path} - nothing to write")
+        raise SystemExit(0)
+    print(f"Wrote {materialize(csv_path, journal_path)} journaled contacts to {csv_path}")
@@ -1,8 +1,12 @@
+import atexit
 import logging
 import os
+import queue
+import sys
+import threading
 from datetime import datetime
 from functools import wraps
-import inspect
+from logging.handlers import QueueHandler, QueueListener
 
 # Configure logging format
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -21,6 +25,18 @@ os.makedirs(logs_dir, exist_ok=True)
 # Global variable to store the current session log file
 _current_session_log_file = None
 
+# Logger instances by name: each is built (and given its handler) once per process
+_loggers = {}
+_loggers_lock = threading.RLock()
+
+# Records are put on a queue by the logging thread and written by a QueueListener
+# thread, so a log call never waits for the disk or the console
+_log_queue = queue.SimpleQueue()
+_listener = None
+_file_handler = None
+_console_handler = None
+
+
 def get_session_log_file():
     """Get the current session log file path"""
     global _current_session_log_file
@@ -33,35 +49,118 @@ def get_session_log_file():
 def reset_session_log_file():
     """Reset the session log file to create a new one for the next run"""
     global _current_session_log_file
-    _current_session_log_file = None
+    with _loggers_lock:
+        _current_session_log_file = None
+        # Switch the file sink over; logger instances and their queue handler stay as they are
+        if _listener is not None:
+            _stop_listener()
+            _start_listener()
+
+class _DeferredFlush:
+    """Handler mixin: records are written without a flush each; the listener flushes once the queue is drained"""
+
+    def flush(self):
+        pass
+
+    def flush_now(self):
+        super().flush()
+
+
+class _FileHandler(_DeferredFlush, logging.FileHandler):
+    pass
+
+
+class _StreamHandler(_DeferredFlush, logging.StreamHandler):
+    pass
+
+
+# Arguments that cannot change between the log call and the listener thread formatting them
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue records whose %-args are all immutable primitives as they are: the listener
+    thread merges them into the message when it writes the record, so callers only pay
+    for creating it. Records with other args (lists, dicts, objects that may change
+    before the listener gets to them) are formatted and copied by the stock
+    QueueHandler.prepare, as it does for every record.
+    """
+
+    def prepare(self, record):
+        args = record.args
+        if not args or (isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)):
+            return record
+        return super().prepare(record)
+
+
+class _BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers when it runs out of records, not after each one"""
+
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush_now()
+        return super().dequeue(block)
+
+
+_queue_handler = _DeferredQueueHandler(_log_queue)
 
-    # Clear all existing loggers to force them to recreate with new handlers
-    for logger_name in logging.root.manager.loggerDict:
-        logger = logging.getLogger(logger_name)
-        logger.handlers.clear()
 
 def get_handlers():
     """Get configured handlers with current log level"""
     log_level = get_log_level()
 
-    # Configure file handler with session-specific filename
+    # Configure file handler with session-specific filename (opened on the first record)
     log_file = get_session_log_file()
-    file_handler = logging.FileHandler(log_file)
+    file_handler = _FileHandler(log_file, delay=True)
     file_handler.setLevel(log_level)
     file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 
     # Configure console handler
-    console_handler = logging.StreamHandler()
+    console_handler = _StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 
     return file_handler, console_handler
 
 
+def _start_listener():
+    global _listener, _file_handler, _console_handler
+    _file_handler, _console_handler = get_handlers()
+    _listener = _BatchingQueueListener(_log_queue, _file_handler, _console_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener():
+    """Write out queued records and close the file sink"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        try:
+            _console_handler.flush_now()
+        except (OSError, ValueError):
+            pass  # the console stream was already closed (e.g. by a test runner at exit)
+        _file_handler.close()
+
+
+def shutdown_logging():
+    """Flush every queued record to the log file (registered to run at exit)"""
+    with _loggers_lock:
+        _stop_listener()
+
+
+atexit.register(shutdown_logging)
+
+
 class Logger:
     """
     A wrapper class for Python's logging module that provides a simple interface
     with automatic module name detection and consistent formatting.
+
+    Use get_logger() rather than creating instances: it returns the one instance
+    per name, whose records go through the shared queue to the file and console.
     """
 
     def __init__(self, name=None):
@@ -72,58 +171,86 @@ class Logger:
             name: Optional logger name. If None, uses the calling module's name.
         """
         if name is None:
-            # Get the calling module's name by looking at the frame that called get_logger
-            frame = inspect.currentframe()
-            # Go up the call stack to find the frame that called get_logger
-            while frame:
-                frame = frame.f_back
-                if frame and frame.f_globals.get('__name__') != 'app.logger':
-                    name = frame.f_globals.get('__name__', 'unknown')
-                    break
-            if not name:
-                name = 'unknown'
+            name = _caller_module_name()
 
+        self.name = name
         self._logger = logging.getLogger(name)
+        self._logger.setLevel(get_log_level())
+        if _queue_handler not in self._logger.handlers:
+            self._logger.addHandler(_queue_handler)
 
-        # Clear existing handlers to ensure we get fresh ones for the new session
-        self._logger.handlers.clear()
+    def isEnabledFor(self, level):
+        """
+        True if a message at this level would be written. Guard blocks that do extra
+        work only to build log messages with it:
 
-        # Set up handlers for this logger
-        self._logger.setLevel(get_log_level())
-        file_handler, console_handler = get_handlers()
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Positions: %s", json.dumps(positions))
+        """
+        return self._logger.isEnabledFor(level)
 
-    def info(self, message):
+    # Messages take %-style args, which are only formatted if the level is enabled:
+    #     logger.debug("Found %d results for %s", len(results), query)
+    # Keyword args (exc_info, extra, ...) are passed on to logging.
+
+    def _log(self, level, message, args, kwargs):
+        if self._logger.isEnabledFor(level):
+            # stacklevel=3 attributes the record to the code that called info()/debug()/...
+            kwargs.setdefault('stacklevel', 3)
+            self._logger.log(level, message, *args, **kwargs)
+
+    def info(self, message, *args, **kwargs):
         """Log an info message."""
-        self._logger.info(message)
+        self._log(logging.INFO, message, args, kwargs)
 
-    def warning(self, message):
+    def warning(self, message, *args, **kwargs):
         """Log a warning message."""
-        self._logger.warning(message)
+        self._log(logging.WARNING, message, args, kwargs)
 
-    def error(self, message):
+    def error(self, message, *args, **kwargs):
         """Log an error message."""
-        self._logger.error(message)
+        self._log(logging.ERROR, message, args, kwargs)
 
-    def debug(self, message):
+    def debug(self, message, *args, **kwargs):
         """Log a debug message."""
-        self._logger.debug(message)
+        self._log(logging.DEBUG, message, args, kwargs)
 
-    def critical(self, message):
+    def critical(self, message, *args, **kwargs):
         """Log a critical message."""
-        self._logger.critical(message)
+        self._log(logging.CRITICAL, message, args, kwargs)
+
+
+def _caller_module_name():
+    """Name of the first module up the stack that is not this one"""
+    frame = sys._getframe(1)
+    while frame and frame.f_globals.get('__name__') == __name__:
+        frame = frame.f_back
+    return frame.f_globals.get('__name__', 'unknown') if frame else 'unknown'
 
 
 def get_logger(name=None):
     """
-    Get a Logger instance with the specified name.
+    Get the Logger instance with the specified name.
     If no name is provided, uses the calling module's name.
 
+    Instances are cached per name, so this is cheap enough for hot paths.
+
     Returns:
         Logger: A Logger instance
     """
-    return Logger(name)
+    if name is None:
+        # The caller's module (one frame lookup; this runs on every get_logger() call)
+        name = sys._getframe(1).f_globals.get('__name__', 'unknown')
+    logger = _loggers.get(name)
+    if logger is None:
+        with _loggers_lock:
+            logger = _loggers.get(name)
+            if logger is None:
+                if _listener is None:
+                    _start_listener()
+                logger = Logger(name)
+                _loggers[name] = logger
+    return logger
 
 def refresh_logger_levels():
     """
@@ -132,14 +259,14 @@ def refresh_logger_levels():
     """
     new_level = get_log_level()
 
-    # Get all existing loggers
-    for logger_name in logging.root.manager.loggerDict:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(new_level)
+    with _loggers_lock:
+        for logger in _loggers.values():
+            logger._logger.setLevel(new_level)
 
-        # Update handlers for this logger
-        for handler in logger.handlers:
-            handler.setLevel(new_level)
+        # Update the handlers that write the records
+        for handler in (_file_handler, _console_handler):
+            if handler is not None:
+                handler.setLevel(new_level)
 
 
 def log_function_call(func):
@@ -152,13 +279,13 @@ def log_function_call(func):
         func_name = func.__name__
         module_name = func.__module__
 
-        logger.info(f"Entering {module_name}.{func_name}")
+        logger.info("Entering %s.%s", module_name, func_name)
         try:
             result = func(*args, **kwargs)
-            logger.info(f"Exiting {module_name}.{func_name}")
+            logger.info("Exiting %s.%s", module_name, func_name)
             return result
         except Exception as e:
-            logger.error(f"Error in {module_name}.{func_name}: {e}")
+            logger.error("Error in %s.%s: %s", module_name, func_name, e)
             raise
 
     return wrapper
@@ -175,34 +302,34 @@ def log_method_call(method):
         method_name = method.__name__
         module_name = self.__class__.__module__
 
-        logger.info(f"Entering {module_name}.{class_name}.{method_name}")
+        logger.info("Entering %s.%s.%s", module_name, class_name, method_name)
         try:
             result = method(self, *args, **kwargs)
-            logger.info(f"Exiting {module_name}.{class_name}.{method_name}")
+            logger.info("Exiting %s.%s.%s", module_name, class_name, method_name)
             return result
         except Exception as e:
-            logger.error(f"Error in {module_name}.{class_name}.{method_name}: {e}")
+            logger.error("Error in %s.%s.%s: %s", module_name, class_name, method_name, e)
             raise
 
     return wrapper
 
 # Convenience functions for common log levels
-def info(message, name=None):
+def info(message, *args, name=None):
     """Log an info message."""
-    get_logger(name).info(message)
+    get_logger(name or _caller_module_name()).info(message, *args)
 
-def warning(message, name=None):
+def warning(message, *args, name=None):
     """Log a warning message."""
-    get_logger(name).warning(message)
+    get_logger(name or _caller_module_name()).warning(message, *args)
 
-def error(message, name=None):
+def error(message, *args, name=None):
     """Log an error message."""
-    get_logger(name).error(message)
+    get_logger(name or _caller_module_name()).error(message, *args)
 
-def debug(message, name=None):
+def debug(message, *args, name=None):
     """Log a debug message."""
-    get_logger(name).debug(message)
+    get_logger(name or _caller_module_name()).debug(message, *args)
 
-def critical(message, name=None):
+def critical(message, *args, name=None):
     """Log a critical message."""
-    get_logger(name).critical(message)
\ No newline at end of file
+    get_logger(name or _caller_module_name()).critical(message, *args)
\ No newline at end of file
@@ -2,17 +2,67 @@
 import os
 import time
 import gc
+import queue
+import threading
 from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
 
 from app.driver_and_login import get_driver, login, cleanup_driver, health_check_driver
-from app.find_profile_urls import find_profile_urls_and_validate
+from app.find_profile_urls import find_profile_urls_and_validate, search_candidates
+from app.find_profile_urls.bing_search import BingSearch
+from app.find_profile_urls.ranking import record_contact_visits, reset_visit_stats, visit_stats
+from app.find_profile_urls.search_cache import get_search_cache
+from app.journal import DEFAULT_JOURNAL_PATH, ResultsJournal
+from app.checkpoint import Checkpointer, write_csv_atomic
+from app.metrics import format_metrics, metrics_summary, record_contact, reset_metrics, timed, write_run_summary
+from app.parse_profile.profile_cache import get_profile_cache
+from app.rate_limiter import RateLimitWaitCancelled, allow_rate_limit_waits, cancel_rate_limit_waits, configure_rate_limits, format_rate_limits, rate_limit_stats, reset_rate_limit_stats
+from app.block_detection import BlockedError
 import pandas as pd
 from app.logger import get_logger
 
 
+def _apply_contact_updates(contacts_df, idx, updates, df_lock=None):
+    """
+    Write the column updates for one contact into the DataFrame.
+
+    Workers share one DataFrame, so the writes for a contact are applied together
+    under df_lock (when given) instead of one cell at a time.
+    """
+    if df_lock is None:
+        for column, value in updates.items():
+            contacts_df.at[idx, column] = value
+        return
+    with df_lock:
+        for column, value in updates.items():
+            contacts_df.at[idx, column] = value
+
+
+def pending_contact_rows(contacts_df):
+    """
+    Return the index labels of the contacts that still need a search, in file order.
+
+    A contact is done once Valid holds True/False or its Note is 'Profile not found'.
+    Computed with column-wide masks, so resuming a mostly finished list costs the same
+    as starting a new one.
+    """
+    valid = contacts_df['Valid']
+    if pd.api.types.is_bool_dtype(valid):
+        done = valid.notna()
+    elif valid.dtype == object:
+        # CSV values read back as True/False, results written this run as Python bools.
+        # Not isin([True, False]): that also matches a stray 1/0 or 1.0/0.0, since True == 1
+        done = valid.map(pd.api.types.is_bool).astype(bool)
+    else:
+        # A float/int column (e.g. all empty) holds no results yet
+        done = pd.Series(False, index=contacts_df.index)
+    if 'Note' in contacts_df.columns:
+        done |= contacts_df['Note'].astype(str).str.strip().eq('Profile not found')
+    return contacts_df.index[~done.to_numpy()]
+
+
 def process_one_contact(
     full_name,
     company_name,
@@ -28,7 +78,13 @@ def process_one_contact(
     linkedin_timeout=15,
     linkedin_threshold=75,
     max_candidates=3,
-    early_exit_threshold=85
+    early_exit_threshold=85,
+    df_lock=None,
+    bing_candidates=None,
+    search_error=None,
+    refresh_profiles=False,
+    speculative_brave=False,
+    snippet_trust=None
 ):
     """
     Process one contact, checking employment status and updating the CSV.
@@ -43,7 +99,7 @@ def process_one_contact(
         full_name: Person's full name
         company_name: Company name to search for
         linkedin_driver: Selenium driver for LinkedIn
-        bing_driver: Selenium driver for Bing search
+        bing_driver: BingSearch (or Selenium driver) for Bing search
         idx: DataFrame index for updating results
         contacts_df: DataFrame to update with results
         search_count: Current search count for logging
@@ -55,8 +111,25 @@ def process_one_contact(
         linkedin_threshold: Company name match threshold percentage (0-100)
         max_candidates: Maximum number of profile candidates to check
         early_exit_threshold: Score threshold for early exit (0-100)
+        df_lock: Optional lock guarding contacts_df when several workers share it
+        bing_candidates: Bing candidate URLs already found by a pipelined search stage
+        search_error: Exception raised by the pipelined search stage for this contact
+        refresh_profiles: Scrape candidate profiles again instead of using cached positions
+        speculative_brave: Query Brave alongside Bing instead of only after Bing fails
+        snippet_trust: How far search titles/snippets are trusted ('off', 'order', 'accept')
+
+    Returns:
+        dict: The column updates that were written for this contact (empty if processing
+            stopped before the contact was checked)
     """
+    started = time.perf_counter()
+    updates = {}
+    visited_keys = set()
     try:
+        # Surface a failed pipelined search the same way as an inline one
+        if search_error is not None:
+            raise search_error
+
         # Search and validate profiles with fallback logic
         best_match, best_profile_url = find_profile_urls_and_validate(
             full_name=full_name,
@@ -71,7 +144,12 @@ def process_one_contact(
             linkedin_threshold=linkedin_threshold,
             linkedin_timeout=linkedin_timeout,
             bing_timeout=bing_timeout,
-            early_exit_threshold=early_exit_threshold
+            early_exit_threshold=early_exit_threshold,
+            bing_candidates=bing_candidates,
+            refresh_profiles=refresh_profiles,
+            speculative_brave=speculative_brave,
+            snippet_trust=snippet_trust,
+            visited_keys=visited_keys
         )
 
         if best_match:
@@ -85,52 +163,328 @@ def process_one_contact(
             log(f"Search #{search_count} (Row {idx+1}): Result: {is_currently_employed}")
 
             # Update the Valid column - True if they currently work there, False if they worked there in the past
-            contacts_df.at[idx, 'Valid'] = is_currently_employed
+            updates['Valid'] = is_currently_employed
 
             # Add the Profile URL to the DataFrame
             if best_profile_url:
-                contacts_df.at[idx, 'Profile URL'] = best_profile_url
+                updates['Profile URL'] = best_profile_url
                 log(f"Search #{search_count} (Row {idx+1}): Profile URL recorded: {best_profile_url}")
 
             # Add note about historical match if applicable
             if not is_currently_employed and company_match['has_any_match']:
-                contacts_df.at[idx, 'Note'] = 'Historical match found'
+                updates['Note'] = 'Historical match found'
+            elif best_match.get('evidence') == 'snippet':
+                updates['Note'] = 'Matched from search snippet (profile not opened)'
         else:
             log(f"Search #{search_count} (Row {idx+1}): No valid company matches found in any candidate profiles from either search")
-            contacts_df.at[idx, 'Valid'] = False
-            contacts_df.at[idx, 'Note'] = 'No company match found in any profile'
+            updates['Valid'] = False
+            updates['Note'] = 'No company match found in any profile'
             # Clear Profile URL if no match found
             if 'Profile URL' in contacts_df.columns:
-                contacts_df.at[idx, 'Profile URL'] = ''
+                updates['Profile URL'] = ''
 
     except IndexError as e:
         log(f"Search #{search_count} (Row {idx+1}): Error: No LinkedIn profiles found for {full_name} at {company_name} (likely rate limited)")
-        contacts_df.at[idx, 'Note'] = 'Profile not found - Maybe rate limited?'
+        updates['Note'] = 'Profile not found - Maybe rate limited?'
         # Clear Profile URL if there's an error
         if 'Profile URL' in contacts_df.columns:
-            contacts_df.at[idx, 'Profile URL'] = ''
+            updates['Profile URL'] = ''
         # Force garbage collection after error
         gc.collect()
+    except RateLimitWaitCancelled:
+        # Stopped while waiting for a request: nothing is written, so the row is checked next run
+        log(f"Search #{search_count} (Row {idx+1}): Stopped before {full_name} could be checked")
+        return updates
+    except BlockedError as e:
+        # The rate limiter has already been slowed down; Valid stays empty so the row is retried next run
+        log(f"Search #{search_count} (Row {idx+1}): WARNING - {e} while checking {full_name}. Slowing down to {format_rate_limits()}")
+        updates['Note'] = str(e)
+        if 'Profile URL' in contacts_df.columns:
+            updates['Profile URL'] = ''
     except Exception as e:
         log(f"Search #{search_count} (Row {idx+1}): Error processing {full_name}: {str(e)}")
         log(f"Search #{search_count} (Row {idx+1}): Error type: {type(e).__name__}")
         # Mark as False if there's an error
-        contacts_df.at[idx, 'Note'] = str(e)
+        updates['Note'] = str(e)
         # Clear Profile URL if there's an error
         if 'Profile URL' in contacts_df.columns:
-            contacts_df.at[idx, 'Profile URL'] = ''
+            updates['Profile URL'] = ''
         # Force garbage collection after error
         gc.collect()
 
-        # Check if we're around the 50 mark and log it
-        if 45 <= search_count <= 55:
-            log(f"Search #{search_count} (Row {idx+1}): WARNING - Error occurred around the 50-contact mark. This might indicate rate limiting or resource issues.")
+    record_contact_visits(len(visited_keys))
+    _apply_contact_updates(contacts_df, idx, updates, df_lock)
+    record_contact(time.perf_counter() - started)
+    return updates
+
+
+def start_linkedin_driver(keep_linkedin_open=False, login_confirmation_callback=None, log=None):
+    """
+    Start a LinkedIn driver and log it in.
+
+    The first session to log in saves linkedin_cookies.json; every later session
+    (other workers, restarts) reuses those cookies and runs headless.
+    """
+    if os.path.exists("linkedin_cookies.json") and not keep_linkedin_open:
+        linkedin_driver = get_driver(headless=True, role='linkedin')
+    else:
+        linkedin_driver = get_driver(headless=False, role='linkedin')
+        if log:
+            if keep_linkedin_open:
+                log("NOTE: Keep LinkedIn Browser Open is enabled - browser window will be visible")
+            else:
+                log("NOTE: A browser window will open. Please log in.")
+    try:
+        with timed('login'):
+            login(linkedin_driver, login_confirmation_callback)
+    except Exception:
+        cleanup_driver(linkedin_driver, "LinkedIn")
+        raise
+    return linkedin_driver
+
+
+def _prefixed_log(log, prefix):
+    """Wrap a log function so every message from one worker carries its prefix"""
+    def prefixed(message):
+        log(prefix + message)
+    return prefixed
+
+
+class ContactWorker(threading.Thread):
+    """
+    A worker session with its own LinkedIn and Bing browsers.
+
+    Workers pull (search_count, idx, full_name, company_name) items from a shared
+    queue, write results into the shared DataFrame under df_lock and report each
+    finished contact on done_queue as (contact, updates, seconds) so the coordinating
+    thread can journal it.
+
+    With pipeline_depth > 0 the worker splits into two stages: a search thread runs
+    Bing searches for upcoming contacts on the Bing driver while this thread
+    validates earlier contacts on the LinkedIn driver. At most pipeline_depth
+    searched contacts wait between the stages.
+    """
+
+    def __init__(
+        self,
+        worker_id,
+        contact_queue,
+        done_queue,
+        contacts_df,
+        df_lock,
+        stop_flag,
+        abort_event,
+        log,
+        batch_size=1,
+        delay_between_batches=0,
+        login_confirmation_callback=None,
+        keep_linkedin_open=False,
+        pipeline_depth=0,
+        contact_kwargs=None
+    ):
+        super().__init__(name=f"ContactWorker-{worker_id}", daemon=True)
+        self.worker_id = worker_id
+        self.contact_queue = contact_queue
+        self.done_queue = done_queue
+        self.contacts_df = contacts_df
+        self.df_lock = df_lock
+        self.stop_flag = stop_flag
+        self.abort_event = abort_event
+        self.log = log
+        self.batch_size = batch_size
+        self.delay_between_batches = delay_between_batches
+        self.login_confirmation_callback = login_confirmation_callback
+        self.keep_linkedin_open = keep_linkedin_open
+        self.pipeline_depth = pipeline_depth
+        self.contact_kwargs = contact_kwargs or {}
+        self.linkedin_driver = None
+        self.bing_search = None
+        self.search_queue = None
+        self.search_thread = None
+        self.error = None
+
+    def should_stop(self):
+        return self.stop_flag.is_set() or self.abort_event.is_set()
+
+    def start_session(self):
+        """Start this worker's browsers and log in (called before the thread starts)"""
+        self.log("Initializing browser session...")
+        # The Bing browser starts on first use - with the HTTP backend only if Bing shows a challenge
+        self.bing_search = BingSearch(timeout=self.contact_kwargs.get('bing_timeout', 20))
+        self.log("Logging into LinkedIn...")
+        self.linkedin_driver = start_linkedin_driver(
+            self.keep_linkedin_open,
+            self.login_confirmation_callback,
+            self.log
+        )
+        self.log("Login successful!")
+
+    def ensure_linkedin_driver(self, search_count, idx):
+        """Restart the LinkedIn driver if it failed its health check"""
+        if not health_check_driver(self.linkedin_driver, "LinkedIn"):
+            self.log(f"Search #{search_count} (Row {idx+1}): Restarting LinkedIn driver...")
+            self.linkedin_driver = start_linkedin_driver(
+                self.keep_linkedin_open,
+                self.login_confirmation_callback
+            )
+            self.log("LinkedIn driver restarted successfully")
+
+    def ensure_bing_driver(self, search_count, idx):
+        """Drop the Bing driver if it failed its health check (it restarts when next needed)"""
+        if self.bing_search.ensure_driver_healthy():
+            self.log(f"Search #{search_count} (Row {idx+1}): Bing driver was unresponsive and will be restarted")
+
+    def next_contact(self):
+        """Return the next contact from the shared queue, or None when it is empty"""
+        try:
+            return self.contact_queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def search_stage(self):
+        """Pipelined search stage: run Bing searches ahead of validation"""
+        try:
+            while not self.should_stop():
+                contact = self.next_contact()
+                if contact is None:
+                    break
+                search_count, idx, full_name, company_name = contact
+                self.log(f"Search #{search_count} (Row {idx+1}): Checking {full_name} at {company_name}")
+
+                self.ensure_bing_driver(search_count, idx)
+                bing_candidates, search_error = None, None
+                try:
+                    bing_candidates = search_candidates(
+                        full_name,
+                        company_name,
+                        self.bing_search,
+                        search_count,
+                        idx,
+                        self.log,
+                        max_candidates=self.contact_kwargs.get('max_candidates', 3),
+                        search_threshold=self.contact_kwargs.get('search_threshold', 0.6),
+                        bing_timeout=self.contact_kwargs.get('bing_timeout', 20),
+                        speculative_brave=self.contact_kwargs.get('speculative_brave', False)
+                    )
+                except Exception as e:
+                    search_error = e
+
+                # Bounded hand-off: block while validation is pipeline_depth contacts behind
+                self.hand_off((contact, bing_candidates, search_error))
+        except Exception as e:
+            self.error = e
+            self.abort_event.set()
+        finally:
+            # Tell the validation stage there is nothing more to come
+            self.hand_off(None)
+
+    def hand_off(self, item):
+        """Put an item on the bounded search queue, giving up once the worker is stopping"""
+        while not self.should_stop():
+            try:
+                self.search_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def searched_contacts(self):
+        """Yield (contact, bing_candidates, search_error) for each contact to validate"""
+        if self.pipeline_depth <= 0:
+            while not self.should_stop():
+                contact = self.next_contact()
+                if contact is None:
+                    return
+                search_count, idx, full_name, company_name = contact
+                self.log(f"Search #{search_count} (Row {idx+1}): Checking {full_name} at {company_name}")
+                # Health check before processing each contact
+                self.ensure_bing_driver(search_count, idx)
+                yield contact, None, None
+            return
+
+        self.search_queue = queue.Queue(maxsize=self.pipeline_depth)
+        self.search_thread = threading.Thread(
+            target=self.search_stage,
+            name=f"{self.name}-search",
+            daemon=True
+        )
+        self.search_thread.start()
+        while not self.should_stop():
+            try:
+                item = self.search_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if item is None:
+                return
+            yield item
+
+    def has_pending_contacts(self):
+        """True while contacts are still queued or searched and awaiting validation"""
+        if not self.contact_queue.empty():
+            return True
+        return self.search_queue is not None and not self.search_queue.empty()
+
+    def run(self):
+        processed_in_batch = 0
+        try:
+            for contact, bing_candidates, search_error in self.searched_contacts():
+                search_count, idx, full_name, company_name = contact
+
+                # Health check before processing each contact
+                self.ensure_linkedin_driver(search_count, idx)
+
+                started = time.perf_counter()
+                updates = process_one_contact(
+                    full_name,
+                    company_name,
+                    self.linkedin_driver,
+                    self.bing_search,
+                    idx,
+                    self.contacts_df,
+                    search_count,
+                    self.log,
+                    self.login_confirmation_callback,
+                    df_lock=self.df_lock,
+                    bing_candidates=bing_candidates,
+                    search_error=search_error,
+                    **self.contact_kwargs
+                )
+                if not updates:
+                    # Stopped part-way through this contact
+                    continue
+                self.done_queue.put((contact, updates, time.perf_counter() - started))
+
+                # Optional extra pause between batches (requests are already paced by the rate limiters)
+                processed_in_batch += 1
+                if processed_in_batch >= self.batch_size:
+                    processed_in_batch = 0
+                    if self.delay_between_batches and self.has_pending_contacts():
+                        self.log(f"Waiting {self.delay_between_batches} seconds before next batch...")
+                        self.stop_flag.wait(self.delay_between_batches)
+                    gc.collect()
+        except Exception as e:
+            # Stop the other workers too; process_contacts_batch re-raises this error
+            self.error = e
+            self.abort_event.set()
+        finally:
+            if self.search_thread:
+                self.search_thread.join()
+
+    def cleanup(self):
+        """Close this worker's browsers"""
+        if self.linkedin_driver:
+            self.log("Closing LinkedIn browser...")
+            cleanup_driver(self.linkedin_driver, "LinkedIn")
+            self.linkedin_driver = None
+        if self.bing_search and self.bing_search.has_driver:
+            self.log("Closing Bing browser...")
+            self.bing_search.cleanup()
 
 
 def process_contacts_batch(
         contacts_df,
         batch_size=1,
-        delay_between_batches=10,
+        delay_between_batches=0,
         log_callback=None,
         save_callback=None,
         stop_flag=None,
@@ -139,17 +493,36 @@ def process_contacts_batch(
         search_threshold=0.6,
         linkedin_timeout=15,
         linkedin_threshold=75,
-        keep_linkedin_open=False
+        keep_linkedin_open=False,
+        num_workers=1,
+        pipeline_depth=2,
+        refresh_profiles=False,
+        speculative_brave=False,
+        snippet_trust=None,
+        rate_limits=None,
+        status_callback=None,
+        journal_path=None,
+        checkpoint=None
     ):
     """
     Process contacts in batches, checking employment status and updating the CSV
 
+    Contacts are handed out from a shared queue to num_workers worker sessions, each
+    with its own LinkedIn and Bing browsers. Every finished contact is appended to a
+    results journal (see journal.py) and the CSV is written at checkpoints (see
+    checkpoint.py) and when the run ends. Results journaled by an interrupted run are
+    replayed into contacts_df first, so those contacts are not searched again. Outbound requests are paced by the shared
+    rate limiters in rate_limiter.py rather than by fixed sleeps.
+
     Args:
         contacts_df: DataFrame with contact information
-        batch_size: Number of contacts to process before saving
-        delay_between_batches: Seconds to wait between batches to avoid rate limiting
+        batch_size: Number of contacts each worker processes before its optional pause
+        delay_between_batches: Optional extra pause (seconds) each worker takes between batches
         log_callback: Optional callback function for logging messages
-        save_callback: Optional callback function for saving progress
+        save_callback: Optional callback function that writes a copy of contacts_df out at
+            each checkpoint and when the run ends (default: contacts.csv, written with
+            checkpoint.write_csv_atomic); it should raise if the write fails, so the
+            journal is kept. It is called from the checkpoint thread.
         stop_flag: Optional threading.Event or similar to check for stop signal
         login_confirmation_callback: Optional callback function for login confirmation (GUI button)
         bing_timeout: Timeout in seconds for Bing search operations
@@ -157,14 +530,67 @@ def process_contacts_batch(
         linkedin_timeout: Timeout in seconds for LinkedIn page loading
         linkedin_threshold: Company name match threshold percentage (0-100)
         keep_linkedin_open: If True, keep LinkedIn browser visible even when cookies exist
+        num_workers: Number of parallel worker sessions (each opens two browsers)
+        pipeline_depth: Contacts each worker may search ahead of LinkedIn validation (0 = no pipelining)
+        refresh_profiles: If True, re-scrape every candidate profile instead of using cached positions
+        speculative_brave: If True, fire the Brave API query at the same time as the Bing search
+        snippet_trust: How far search result titles/snippets are trusted before a profile is
+            opened: 'off', 'order' (check candidates naming the company first) or 'accept'
+            (also accept a current-employer snippet without opening the profile).
+            Defaults to SNIPPET_TRUST in .env, else 'order'.
+        rate_limits: Optional dict of service ('linkedin', 'bing', 'brave', 'google') ->
+            requests per minute or (requests per minute, burst), overriding the defaults.
+            These are ceilings: rates are cut when a block is detected and recover while
+            responses stay healthy.
+        status_callback: Optional callback receiving a dict of live run status; the
+            'rate_limits' key holds the rate limiter stats per service and the 'metrics'
+            key the stage timings and throughput so far (see metrics.metrics_summary).
+            Stage timings and throughput are also written to logs/run_summary_<timestamp>.json
+            when the run ends.
+        journal_path: Results journal of the CSV being processed (default: contacts.csv's,
+            see journal.journal_path_for)
+        checkpoint: Optional dict overriding the checkpoint triggers from .env: 'every_contacts',
+            'every_seconds' and/or 'on_stop' (see checkpoint.Checkpointer)
     """
     logger = get_logger()
+    log_lock = threading.Lock()
 
     def log(message):
-        if log_callback:
-            log_callback(message)
+        with log_lock:
+            if log_callback:
+                log_callback(message)
+            else:
+                logger.info(message)
+
+    last_rate_stats = {}
+
+    def report_rate_limits():
+        """Log blocks and recoveries since the last call and pass changed rates to status_callback"""
+        nonlocal last_rate_stats
+        stats = rate_limit_stats()
+        changed = False
+        for name, current in stats.items():
+            previous = last_rate_stats.get(name)
+            if previous is None:
+                changed = True
+                continue
+            if current['blocks'] > previous['blocks']:
+                log(f"Rate limiter: {name} blocked ({current['last_block_reason']}) - now {current['requests_per_minute']:.1f} requests/minute")
+            elif (current['requests_per_minute'] >= current['max_requests_per_minute']
+                  and previous['requests_per_minute'] < previous['max_requests_per_minute']):
+                log(f"Rate limiter: {name} back to {current['max_requests_per_minute']:g} requests/minute")
+            if round(current['requests_per_minute'], 1) != round(previous['requests_per_minute'], 1):
+                changed = True
+        last_rate_stats = stats
+        if changed and status_callback:
+            status_callback({'rate_limits': stats})
+
+    def save_contacts(df):
+        if save_callback:
+            save_callback(df)
         else:
-            logger.info(message)
+            # Default behavior: save to contacts.csv
+            write_csv_atomic(df, 'contacts.csv')
 
     # Add Note column if it doesn't exist
     if 'Note' not in contacts_df.columns:
@@ -174,131 +600,148 @@ def process_contacts_batch(
     if 'Profile URL' not in contacts_df.columns:
         contacts_df['Profile URL'] = ''
 
-    total_rows = len(contacts_df)
-    log(f"Processing {total_rows} contacts in batches of {batch_size}")
+    if stop_flag is None:
+        stop_flag = threading.Event()
+
+    configure_rate_limits(rate_limits)
+    reset_rate_limit_stats()
+    allow_rate_limit_waits()
+    report_rate_limits()
+
+    search_cache = get_search_cache()
+    search_cache.reset_stats()
+    profile_cache = get_profile_cache()
+    profile_cache.reset_stats()
+    reset_visit_stats()
+    reset_metrics()
+
+    df_lock = threading.RLock()
+    checkpointer = Checkpointer(contacts_df, df_lock, save_contacts, log=log, **(checkpoint or {}))
+
+    # Results of an interrupted run count as processed
+    journal = ResultsJournal(journal_path or DEFAULT_JOURNAL_PATH)
+    replayed, unmatched = journal.replay(contacts_df)
+    if replayed:
+        log(f"Resuming: {replayed} contacts restored from {journal.path}")
+    if unmatched:
+        log(f"WARNING: {unmatched} journal records in {journal.path} do not match a row of this list and were ignored")
+
+    def save_results():
+        """Write the final contacts_df out and clear the journal once the write succeeded"""
+        try:
+            checkpointer.finish()
+        except Exception as e:
+            log(f"Error saving results - they are kept in {journal.path}: {e}")
+            return
+        if unmatched:
+            # Records for rows outside this run (e.g. another start row) are still needed
+            log(f"Results saved; {journal.path} is kept for the {unmatched} records of other rows")
+            journal.close()
+            return
+        journal.clear()
+        log("Results saved")
 
-    # Track search statistics
-    search_count = 0
+    total_rows = len(contacts_df)
+    num_workers = max(1, int(num_workers))
+    log(f"Processing {total_rows} contacts in batches of {batch_size} with {num_workers} worker(s)")
+
+    # Queue every contact that still needs a search
+    pending = pending_contact_rows(contacts_df)
+    pending_count = len(pending)
+    if pending_count < total_rows:
+        log(f"Skipping {total_rows - pending_count} contacts already processed or marked as 'Profile not found'")
+    full_names = contacts_df.loc[pending, 'First Name'].astype(str) + " " + contacts_df.loc[pending, 'Last Name'].astype(str)
+    contact_queue = queue.Queue()
+    for search_count, (idx, full_name, company_name) in enumerate(
+            zip(pending, full_names, contacts_df.loc[pending, 'Account Name']), 1):
+        contact_queue.put((search_count, idx, full_name, company_name))
+
+    if pending_count:
+        log(f"{pending_count} contacts left to process, starting at row {contacts_df.index.get_loc(pending[0]) + 1}")
+    else:
+        log("0 contacts left to process")
+    if pending_count == 0:
+        if replayed:
+            save_results()
+        log(f"\nAll {total_rows} contacts processed successfully!")
+        return contacts_df
 
-    # Initialize a single browser session for all processing
-    log("Initializing browser session...")
-    linkedin_driver = None
-    bing_driver = None
+    done_queue = queue.Queue()
+    abort_event = threading.Event()
+    workers = []
+    contact_kwargs = {
+        'bing_timeout': bing_timeout,
+        'search_threshold': search_threshold,
+        'linkedin_timeout': linkedin_timeout,
+        'linkedin_threshold': linkedin_threshold,
+        'max_candidates': 5,
+        'early_exit_threshold': 85,
+        'refresh_profiles': refresh_profiles,
+        'speculative_brave': speculative_brave,
+        'snippet_trust': snippet_trust
+    }
+    processed_count = 0
 
     try:
-        if os.path.exists("linkedin_cookies.json") and not keep_linkedin_open:
-            linkedin_driver = get_driver(headless=True)
-        else:
-            linkedin_driver = get_driver(headless=False)
-            if keep_linkedin_open:
-                log("NOTE: Keep LinkedIn Browser Open is enabled - browser window will be visible")
-            else:
-                log("NOTE: A browser window will open. Please log in.")
-
-        bing_driver = get_driver(headless=True)
-
-
-        # Login once at the beginning
-        log("Logging into LinkedIn...")
-        login(linkedin_driver, login_confirmation_callback)
-        log("Login successful!")
-
-        for i in range(0, total_rows, batch_size):
-            # Check stop flag before processing each batch
-            if stop_flag and stop_flag.is_set():
+        # Start sessions one at a time so the first login can save the cookies
+        # that every later worker reuses
+        for worker_id in range(min(num_workers, pending_count)):
+            if stop_flag.is_set():
                 log("Stop signal received. Stopping processing.")
                 return contacts_df
 
-            batch_end = min(i + batch_size, total_rows)
-            batch = contacts_df.iloc[i:batch_end]
-
-            log(f"\n--- Processing batch {i//batch_size + 1} (rows {i+1}-{batch_end}) ---")
-            log(f"Progress: {i+1}/{total_rows} contacts processed so far")
-
-            # Track if any contacts in this batch were actually processed (not skipped)
-            batch_processed = False
-
-            for idx, row in batch.iterrows():
-                # Check stop flag before processing each contact
-                if stop_flag and stop_flag.is_set():
-                    log("Stop signal received. Stopping processing.")
-                    return contacts_df
-
-                # Skip if already processed (Valid column has a boolean value)
-                skip_valid = pd.notna(row['Valid']) and isinstance(row['Valid'], bool)
-                skip_note = 'Note' in row and str(row['Note']).strip() == 'Profile not found'
-                if skip_valid or skip_note:
-                    log(f"Skipping {row['First Name']} {row['Last Name']} - already processed or marked as 'Profile not found'")
-                    continue
-
-                # Mark that we're processing at least one contact in this batch
-                batch_processed = True
-
-                # Join first and last name
-                full_name = f"{row['First Name']} {row['Last Name']}"
-                company_name = row['Account Name']
-
-                search_count += 1
-                log(f"Search #{search_count} (Row {idx+1}): Checking {full_name} at {company_name}")
-
-                # Health check before processing each contact
-                if not health_check_driver(linkedin_driver, "LinkedIn"):
-                    log(f"Search #{search_count} (Row {idx+1}): Restarting LinkedIn driver...")
-
-                    if os.path.exists("linkedin_cookies.json") and not keep_linkedin_open:
-                        linkedin_driver = get_driver(headless=True)
-                    else:
-                        linkedin_driver = get_driver(headless=False)
-                    login(linkedin_driver, login_confirmation_callback)
-                    log("LinkedIn driver restarted successfully")
-
-                if not health_check_driver(bing_driver, "Bing"):
-                    log(f"Search #{search_count} (Row {idx+1}): Restarting Bing driver...")
-                    bing_driver = get_driver(headless=True)
-                    log("Bing driver restarted successfully")
-
-                process_one_contact(
-                    full_name,
-                    company_name,
-                    linkedin_driver,
-                    bing_driver,
-                    idx,
-                    contacts_df,
-                    search_count,
-                    log,
-                    login_confirmation_callback,
-                    bing_timeout,
-                    search_threshold,
-                    linkedin_timeout,
-                    linkedin_threshold,
-                    max_candidates=5,
-                    early_exit_threshold=85
-                )
-
-            # Only save and delay if contacts were actually processed in this batch
-            if batch_processed:
-                # Save progress after each batch
-                if save_callback:
-                    save_callback(contacts_df)
-                else:
-                    # Default behavior: save to contacts.csv
-                    contacts_df.to_csv('contacts.csv', index=False, encoding='utf-8')
-
-                log(f"Batch {i//batch_size + 1} completed and saved")
-
-                gc.collect()
-
-                # Delay between batches (except for the last batch) to avoid rate limiting
-                if batch_end < total_rows:
-                    log(f"Waiting {delay_between_batches} seconds before next batch...")
-                    time.sleep(delay_between_batches)
-            else:
-                log(f"Batch {i//batch_size + 1} completed (all contacts already processed - no save/delay needed)")
-
-            # Check stop flag
-            if stop_flag and stop_flag.is_set():
-                log("Stop signal received. Stopping processing.")
-                break
+            worker_log = _prefixed_log(log, f"[Worker {worker_id + 1}] ") if num_workers > 1 else log
+
+            worker = ContactWorker(
+                worker_id,
+                contact_queue,
+                done_queue,
+                contacts_df,
+                df_lock,
+                stop_flag,
+                abort_event,
+                worker_log,
+                batch_size=batch_size,
+                delay_between_batches=delay_between_batches,
+                login_confirmation_callback=login_confirmation_callback,
+                keep_linkedin_open=keep_linkedin_open,
+                pipeline_depth=pipeline_depth,
+                contact_kwargs=contact_kwargs
+            )
+            workers.append(worker)
+            worker.start_session()
+
+        for worker in workers:
+            worker.start()
+
+        while any(worker.is_alive() for worker in workers) or not done_queue.empty():
+            report_rate_limits()
+            if stop_flag.is_set() or abort_event.is_set():
+                # Workers waiting for a request slot (up to a minute after a rate cut) stop now
+                cancel_rate_limit_waits()
+            if stop_flag.is_set():
+                checkpointer.stop_requested()
+            try:
+                (_, idx, full_name, company_name), updates, seconds = done_queue.get(timeout=0.5)
+            except queue.Empty:
+                checkpointer.tick()
+                continue
+
+            # One appended line per contact; the CSV is only rewritten at checkpoints
+            journal.append(idx, full_name, company_name, updates, seconds)
+            processed_count += 1
+            checkpointer.contact_done()
+            log(f"Progress: {processed_count}/{pending_count} contacts processed so far")
+            if status_callback:
+                status_callback({'metrics': metrics_summary()})
+
+        worker_errors = [worker.error for worker in workers if worker.error]
+        if worker_errors:
+            raise worker_errors[0]
+
+        if stop_flag.is_set():
+            log("Stop signal received. Stopping processing.")
+            return contacts_df
 
         log(f"\nAll {total_rows} contacts processed successfully!")
         return contacts_df
@@ -308,15 +751,50 @@ def process_contacts_batch(
         raise
 
     finally:
-        # Always close the browser when done
-        if linkedin_driver:
-            log("Closing LinkedIn browser...")
-            cleanup_driver(linkedin_driver)
-        if bing_driver:
-            log("Closing Bing browser...")
-            cleanup_driver(bing_driver)
+        # Stop any worker still running and always close the browsers when done
+        abort_event.set()
+        cancel_rate_limit_waits()
+        for worker in workers:
+            if worker.is_alive():
+                worker.join()
+            worker.cleanup()
+        allow_rate_limit_waits()
+
+        # Journal contacts that finished after the loop above stopped reading, then
+        # write everything journaled (this run's and any replayed results) to the CSV
+        checkpointer.close()
+        while not done_queue.empty():
+            (_, idx, full_name, company_name), updates, seconds = done_queue.get_nowait()
+            journal.append(idx, full_name, company_name, updates, seconds)
+            processed_count += 1
+            checkpointer.contact_done()
+        if replayed or processed_count:
+            save_results()
+
+        search_cache_stats = search_cache.stats()
+        log(f"Search cache: {search_cache_stats['hits']} hits, {search_cache_stats['misses']} misses ({search_cache_stats['hit_rate']:.0%} hit rate)")
+        profile_cache_stats = profile_cache.stats()
+        log(f"Profile cache: {profile_cache_stats['hits']} hits, {profile_cache_stats['misses']} misses ({profile_cache_stats['hit_rate']:.0%} hit rate)")
+        visits = visit_stats()
+        if visits['contacts']:
+            log(f"Profile visits: {visits['visits']} for {visits['contacts']} contacts ({visits['average']:.2f} per contact, at most {visits['max']})")
+        report_rate_limits()
+        block_count = sum(stats['blocks'] for stats in last_rate_stats.values())
+        log(f"Rate limits: {format_rate_limits(last_rate_stats)} ({block_count} blocks detected)")
+
+        # Machine-readable run summary: where the time went, throughput and rate limit events
+        summary = metrics_summary()
+        log(f"Stage timings: {format_metrics(summary)}")
+        summary.update({
+            'search_cache': search_cache_stats,
+            'profile_cache': profile_cache_stats,
+            'profile_visits': visits,
+            'rate_limits': last_rate_stats
+        })
+        summary_path = write_run_summary(summary)
+        if summary_path:
+            log(f"Run summary written to {summary_path}")
+        if status_callback:
+            status_callback({'metrics': summary})
         # Force garbage collection after cleanup
         gc.collect()
-
-
-
@@ -10,12 +10,12 @@ from rapidfuzz import fuzz, process
 from app.logger import get_logger
 
 def normalize_person_name(name: str) -> str:
-    logger = get_logger()
     if not name:
+        logger = get_logger()
         if name is None:
             logger.warning("Cannot normalize person name: No name arg provided...")
         else:
-            logger.warning(f"Cannot normalize person name: name arg provided is empty: '{name}'")
+            logger.warning("Cannot normalize person name: name arg provided is empty: '%s'", name)
         return ""
     name = unidecode.unidecode(name.lower())
     name = re.sub(r"[.,\-]", " ", name)
@@ -23,12 +23,12 @@ def normalize_person_name(name: str) -> str:
     return name
 
 def normalize_company_name(company_name: str) -> str:
-    logger = get_logger()
     if not company_name:
+        logger = get_logger()
         if company_name is None:
             logger.warning("Cannot normalize company name: No company_name arg provided...")
         else:
-            logger.warning(f"Cannot normalize company name: company_name arg provided is empty: '{company_name}'")
+            logger.warning("Cannot normalize company name: company_name arg provided is empty: '%s'", company_name)
         return ""
     name = unidecode.unidecode(company_name.lower())
     name = re.sub(r'[.,&()\-]', ' ', name)
@@ -115,10 +115,8 @@ def score_fuzzy_match(
     type: Literal["company", "person"] | str,
     threshold: float
 ) -> bool:
-    logger = get_logger()
-
     if not actual_name or not test_name:
-        print(f"Error in score_fuzzy_match - Empty input: actual_name: {actual_name}, test_name: {test_name}")
+        get_logger().warning("Error in score_fuzzy_match - Empty input: actual_name: %s, test_name: %s", actual_name, test_name)
         return {
             'is_match': False,
             'score': 0,
@@ -203,7 +201,7 @@ def _validate_person_name_match(tokens1: list, tokens2: list, score: float, thre
 
     # If last names are very different (< 60% similar), be more strict
     if last_name_score < 60:
-        logger.debug(f"Last names '{last1}' vs '{last2}' are too different (score: {last_name_score})")
+        logger.debug("Last names '%s' vs '%s' are too different (score: %s)", last1, last2, last_name_score)
 
         # Check if first names are exact or very similar
         first_name_score = fuzz.ratio(first1, first2)
@@ -212,17 +210,17 @@ def _validate_person_name_match(tokens1: list, tokens2: list, score: float, thre
         # Single-character last names (initials) are almost always false positives
         # when searching for specific people, so we reject them entirely
         if len(last1) == 1 or len(last2) == 1:
-            logger.debug(f"Rejecting match due to single-character last name: '{last1}' vs '{last2}' - initials not allowed")
+            logger.debug("Rejecting match due to single-character last name: '%s' vs '%s' - initials not allowed", last1, last2)
             return False
 
         # Even if first names match well, reject if last names are completely different
         if last_name_score < 40:  # Very different last names
-            logger.debug(f"Rejecting match due to very different last names: '{last1}' vs '{last2}'")
+            logger.debug("Rejecting match due to very different last names: '%s' vs '%s'", last1, last2)
             return False
 
         # If first names are also not very similar, reject
         if first_name_score < 80:
-            logger.debug(f"Rejecting match due to different first names (score: {first_name_score}) and last names (score: {last_name_score})")
+            logger.debug("Rejecting match due to different first names (score: %s) and last names (score: %s)", first_name_score, last_name_score)
             return False
 
     # Check initials as an additional safeguard
@@ -232,7 +230,7 @@ def _validate_person_name_match(tokens1: list, tokens2: list, score: float, thre
     if initials1 != initials2:
         # Different initials - be more strict
         if score < 85:  # Require higher score when initials don't match
-            logger.debug(f"Rejecting match due to different initials: '{initials1}' vs '{initials2}' with score {score}")
+            logger.debug("Rejecting match due to different initials: '%s' vs '%s' with score %s", initials1, initials2, score)
             return False
 
     return True
@@ -0,0 +1,176 @@
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from app.logger import get_logger, logs_dir
+
+# Pipeline stages that are timed, in pipeline order:
+#   driver_start         - starting a Chrome session (LinkedIn or Bing)
+#   login                - LinkedIn login, including waiting for a manual login
+#   bing_serp            - loading one Bing results page (HTTP or browser)
+#   brave_api            - one Brave Search API request
+#   linkedin_navigation  - loading a profile (or its experience subpage) up to a usable DOM
+#   experience_discovery - waiting for the experience list to render
+#   parsing              - extracting the positions from the page
+#   matching             - matching the positions against the company
+#   csv_save             - writing the contacts CSV
+#   contact              - one contact from start to finish
+STAGES = (
+    'driver_start', 'login', 'bing_serp', 'brave_api', 'linkedin_navigation',
+    'experience_discovery', 'parsing', 'matching', 'csv_save', 'contact'
+)
+
+PERCENTILES = (50, 95, 99)
+
+_lock = threading.Lock()
+_timings = {}
+_events = []
+_contacts = 0
+_started = time.time()
+
+
+def record_timing(stage, seconds):
+    """Add one duration (seconds) to a stage's histogram"""
+    with _lock:
+        _timings.setdefault(stage, []).append(seconds)
+
+
+@contextmanager
+def timed(stage):
+    """Time the body of a with block as one sample of stage (also when it raises)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(stage, time.perf_counter() - started)
+
+
+def record_event(kind, **details):
+    """Note a run event, e.g. record_event('rate_limit', service='bing', reason='captcha')"""
+    with _lock:
+        _events.append({'time': datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), 'kind': kind, **details})
+
+
+def record_contact(seconds):
+    """Count one finished contact and time it as the 'contact' stage"""
+    global _contacts
+    with _lock:
+        _contacts += 1
+        _timings.setdefault('contact', []).append(seconds)
+
+
+def reset_metrics():
+    """Clear every timing and event and restart the run clock (called at the start of each run)"""
+    global _contacts, _started
+    with _lock:
+        _timings.clear()
+        _events.clear()
+        _contacts = 0
+        _started = time.time()
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def stage_stats(values):
+    """Summarize one stage's durations: count, total, mean, max and p50/p95/p99"""
+    values = sorted(values)
+    stats = {
+        'count': len(values),
+        'total': sum(values),
+        'mean': sum(values) / len(values) if values else 0.0,
+        'max': values[-1] if values else 0.0
+    }
+    for p in PERCENTILES:
+        stats[f'p{p}'] = percentile(values, p)
+    return stats
+
+
+def metrics_summary():
+    """
+    Return the run's metrics so far.
+
+    Returns:
+        dict: 'started', 'elapsed' (seconds), 'contacts', 'contacts_per_hour',
+            'stages' (stage -> stage_stats, in STAGES order) and 'events'
+    """
+    with _lock:
+        timings = {stage: list(values) for stage, values in _timings.items()}
+        events = list(_events)
+        contacts = _contacts
+        started = _started
+    elapsed = time.time() - started
+    order = [stage for stage in STAGES if stage in timings] + sorted(set(timings) - set(STAGES))
+    return {
+        'started': datetime.fromtimestamp(started).strftime("%Y-%m-%dT%H:%M:%S"),
+        'elapsed': elapsed,
+        'contacts': contacts,
+        'contacts_per_hour': contacts * 3600 / elapsed if elapsed > 0 else 0.0,
+        'stages': {stage: stage_stats(timings[stage]) for stage in order},
+        'events': events
+    }
+
+
+def format_metrics(summary, stages=None, limit=None):
+    """
+    Format a summary as one line, e.g.
+    '42.0 contacts/hour - linkedin_navigation p50 2.10s p95 4.80s, bing_serp p50 0.40s p95 0.90s'
+
+    Args:
+        summary: metrics_summary output
+        stages: Stages to include (default: every stage with samples, most total time first)
+        limit: Show at most this many stages
+    """
+    timings = summary['stages']
+    if stages is None:
+        stages = sorted(timings, key=lambda stage: timings[stage]['total'], reverse=True)
+    stages = [stage for stage in stages if stage in timings and stage != 'contact'][:limit]
+    parts = [f"{stage} p50 {timings[stage]['p50']:.2f}s p95 {timings[stage]['p95']:.2f}s" for stage in stages]
+    return f"{summary['contacts_per_hour']:.1f} contacts/hour" + (" - " + ", ".join(parts) if parts else "")
+
+
+def write_run_summary(summary, path=None):
+    """
+    Write a run summary as JSON.
+
+    Args:
+        summary: metrics_summary output, plus anything else to keep (cache and rate limiter stats)
+        path: File to write (default: logs/run_summary_<timestamp>.json)
+
+    Returns:
+        str: The path written, or None if it could not be written
+    """
+    if path is None:
+        path = os.path.join(logs_dir, f"run_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, default=str)
+    except OSError as e:
+        get_logger().warning("Could not write run summary to %s: %s", path, e)
+        return None
+    return path
+
+
+if __name__ == "__main__":
+    import random
+
+    reset_metrics()
+    for _ in range(200):
+        record_timing('linkedin_navigation', random.uniform(1.5, 4.0))
+        record_timing('bing_serp', random.uniform(0.2, 1.0))
+        with timed('matching'):
+            sum(range(1000))
+        record_contact(random.uniform(4, 9))
+    record_event('rate_limit', service='linkedin', reason='HTTP 429')
+    summary = metrics_summary()
+    print(format_metrics(summary))
+    print(json.dumps(summary['stages']['linkedin_navigation'], indent=2))
+    assert percentile([1, 2, 3, 4], 50) == 2 and percentile([1, 2, 3, 4], 99) == 4
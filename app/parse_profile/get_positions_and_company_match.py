@@ -3,6 +3,8 @@
 # sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from typing import Any, Dict, Literal
+from app.logger import get_logger
+from app.metrics import timed
 from app.matching import analyze_positions_for_company_match
 from app.parse_profile.scrape_experience import get_all_positions
 
@@ -13,10 +15,12 @@ def scrape_positions_and_match_company(
     target_company,
     threshold=75,
     verbose=False,
-    timeout=15
+    timeout=15,
+    force_refresh=False
 ) -> Dict[Literal['all_positions', 'company_match'], Any]:
     """
     Extract current and all positions from LinkedIn profile URL and check for comprehensive company match.
+    Positions come from the profile cache when available unless force_refresh is True.
     Returns a dictionary with the following keys:
         {
             'all_positions': list[dict],
@@ -28,11 +32,11 @@ def scrape_positions_and_match_company(
         }
     """
     # Get both current and all positions in a single pass
-    all_positions = get_all_positions(driver, profile_url, verbose=verbose, timeout=timeout)
+    all_positions = get_all_positions(driver, profile_url, verbose=verbose, timeout=timeout, force_refresh=force_refresh)
 
     # if not current_positions and not all_positions:
     if not all_positions or len(all_positions) == 0 or not all_positions[0].get("company"):
-        print(f"get_positions_and_company_match: No positions found for {profile_url}")
+        get_logger().info("get_positions_and_company_match: No positions found for %s", profile_url)
         return {
             'all_positions': [],
             'company_match': {
@@ -43,11 +47,12 @@ def scrape_positions_and_match_company(
         }
 
     # Check for comprehensive company matches
-    match_result = analyze_positions_for_company_match(
-        target_company,
-        all_positions,
-        threshold
-    )
+    with timed('matching'):
+        match_result = analyze_positions_for_company_match(
+            target_company,
+            all_positions,
+            threshold
+        )
 
     return {
         'all_positions': all_positions,
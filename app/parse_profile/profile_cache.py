@@ -0,0 +1,35 @@
+import threading
+from urllib.parse import urlparse
+from app.cache import PersistentCache
+from app.config import get_env_float
+from app.profile_url import profile_key
+
+_profile_cache = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache():
+    """
+    Get the shared profile cache (profile URL -> extracted positions list).
+
+    The TTL is read from PROFILE_CACHE_TTL_DAYS (default 7 days; 0 disables the cache).
+    """
+    global _profile_cache
+    with _profile_cache_lock:
+        if _profile_cache is None:
+            ttl_days = get_env_float('PROFILE_CACHE_TTL_DAYS', 7)
+            _profile_cache = PersistentCache('profile_positions', ttl_seconds=ttl_days * 24 * 60 * 60)
+        return _profile_cache
+
+
+def profile_cache_key(profile_url):
+    """
+    Build the cache key for a profile URL: its canonical profile key, so every form
+    of the same profile URL shares one entry. Non-profile URLs fall back to host and
+    path, ignoring scheme, query string and trailing slash.
+    """
+    key = profile_key(profile_url)
+    if key is not None:
+        return key
+    parsed = urlparse(profile_url.strip())
+    return f"{parsed.netloc.lower()}{parsed.path.rstrip('/').lower()}"
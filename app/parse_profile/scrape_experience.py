@@ -12,81 +12,135 @@ from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 from app.driver_and_login import get_driver, login, cleanup_driver
 from app.logger import get_logger
+from app.parse_profile.profile_cache import get_profile_cache, profile_cache_key
+from app.deadline import Deadline
+from app.metrics import record_timing
+from app.parse_profile.wait_for_page_load import wait_for_experience_section, wait_for_script
+from app.rate_limiter import RateLimitWaitCancelled, record_success, wait_for_rate_limit
+from app.block_detection import BlockedError, check_linkedin_page
+from app.config import get_env_bool, get_env_str
+from app.profile_url import details_experience_url
+
+# Load the profile's details/experience/ subpage (every position, none of the rest of
+# the profile) before falling back to the full profile page
+EXPERIENCE_DETAILS_PAGE = get_env_bool('EXPERIENCE_DETAILS_PAGE', True)
+
+# Pages of a long details/experience/ list to load via its "Show more" button
+MAX_DETAILS_PAGES = 5
+
+# 'script' extracts the whole experience list with one execute_script call;
+# 'html' walks the section element by element (also the fallback for 'script')
+EXPERIENCE_EXTRACTION = get_env_str('EXPERIENCE_EXTRACTION', 'script')
+
+CURRENT_WORDS = ["present", "current", "now", "today"]
+DATE_WORDS = CURRENT_WORDS + ["month", "year", "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+
+# State of a details/experience/ page: 'ready' once positions are listed, 'empty' for
+# LinkedIn's empty state, 'redirected' if LinkedIn sent us elsewhere, otherwise null
+DETAILS_READY_SCRIPT = """
+if (!location.pathname.includes('/details/experience')) return 'redirected';
+const main = document.querySelector('main');
+if (!main) return null;
+if (main.querySelector('li.artdeco-list__item div.hoverable-link-text.t-bold, li.pvs-list__paged-list-item div.hoverable-link-text.t-bold')) return 'ready';
+if (main.querySelector('.artdeco-empty-state')) return 'empty';
+return null;
+"""
+
+# Clicks the "Show more results" button of a paged details list; returns the number of
+# items listed before the click, or -1 if there is no button
+DETAILS_SHOW_MORE_SCRIPT = """
+const button = document.querySelector('main button.scaffold-finite-scroll__load-button');
+if (!button || button.disabled) return -1;
+const count = document.querySelectorAll('main li.artdeco-list__item, main li.pvs-list__paged-list-item').length;
+button.click();
+return count;
+"""
+
+# True once more items are listed than arguments[0]
+DETAILS_MORE_LOADED_SCRIPT = "return document.querySelectorAll('main li.artdeco-list__item, main li.pvs-list__paged-list-item').length > arguments[0];"
+
+# Returns the section element that holds the #experience anchor, or null
+EXPERIENCE_SECTION_SCRIPT = "const anchor = document.querySelector('div#experience'); return anchor ? anchor.closest('section') : null;"
+
+# Returns the experience section's top-level items as plain data, or null when the
+# section is not on the page. Texts come from the aria-hidden spans, as in
+# extract_position_info(); grouped positions also carry their nested roles.
+# With arguments[0] true the list is read from a details/experience/ page instead.
+EXPERIENCE_SCRIPT = """
+const anchor = document.querySelector('div#experience');
+const section = arguments[0] ? document.querySelector('main') : anchor && anchor.closest('section');
+if (!section) return null;
+const visibleText = el => {
+    const span = el.querySelector('span[aria-hidden="true"]');
+    return span ? span.textContent.trim() : '';
+};
+const texts = (root, selector) => Array.from(root.querySelectorAll(selector), visibleText);
+const TITLE = 'div.hoverable-link-text.t-bold';
+const ITEM = 'li.artdeco-list__item, li.pvs-list__paged-list-item';
+return Array.from(section.querySelectorAll(ITEM))
+    .filter(li => !li.parentElement.closest(ITEM))
+    .map(li => {
+        const titles = texts(li, TITLE);
+        const roles = titles.length > 1
+            ? Array.from(li.querySelectorAll('li'))
+                .filter(role => role.querySelector(TITLE))
+                .map(role => ({titles: texts(role, TITLE), captions: texts(role, 'span.t-14.t-normal.t-black--light')}))
+            : [];
+        return {
+            titles: titles,
+            subtitles: texts(li, 'span.t-14.t-normal'),
+            captions: texts(li, 'span.t-14.t-normal.t-black--light'),
+            roles: roles
+        };
+    });
+"""
+
+
+def find_experience_section(driver, timeout=10, deadline=None):
+    """
+    Try multiple strategies to find the experience section.
 
+    Waits for the section with a polled readiness check (see wait_for_experience_section)
+    rather than fixed sleeps, so it returns as soon as the section is rendered.
 
-def find_experience_section(driver, timeout=10):
-    """
-    Try multiple strategies to find the experience section with enhanced waiting and retry logic.
+    Args:
+        driver: WebDriver on the profile page
+        timeout: Seconds for the first attempt; each retry allows a little more
+        deadline: Optional Deadline for the whole profile; attempts are capped at the
+            time it has left and skipped (no refresh either) once it has passed
     """
     logger = get_logger()
 
-    # Enhanced waiting strategy - wait for experience content to actually load
+    # Each attempt allows a little more time; the page is refreshed before the last one
     max_retries = 3
     base_wait_time = 5
 
     for attempt in range(max_retries):
+        if deadline is not None and deadline.expired():
+            logger.info("Profile deadline passed - not waiting for the experience section again")
+            break
         try:
-            logger.info(f"Attempt {attempt + 1}/{max_retries} to find experience section")
-
-            # Progressive waiting - increase wait time with each attempt
             current_timeout = timeout + (attempt * base_wait_time)
-            logger.info(f"Using timeout of {current_timeout} seconds for this attempt")
-
-            # Wait for basic page structure first
-            WebDriverWait(driver, current_timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "li.artdeco-list__item"))
-            )
-
-            # Additional wait for dynamic content to load
-            time.sleep(2 + attempt)  # Progressive delay: 2s, 3s, 4s
-
-            # Scroll down the page to ensure experience section is loaded and visible
-            logger.info("Scrolling down to load experience section...")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight*2/3);")
-            time.sleep(1)
-
-
-            artdeco_sections = driver.find_elements(By.CSS_SELECTOR, "section.artdeco-card")
-            logger.info(f"Found {len(artdeco_sections)} artdeco-card sections")
-
-            # Check each section individually
-            for i, section in enumerate(artdeco_sections):
-                try:
-                    # Get the HTML content of this specific section
-                    section_html = section.get_attribute('outerHTML')
-                    soup = BeautifulSoup(section_html, 'html.parser')
-
-                    exp_div = soup.find("div", id="experience", class_="pv-profile-card__anchor")
-                    if exp_div:
-                        logger.info(f"Found experience section on attempt {attempt + 1}")
-                        return [section]
-
-                except Exception as e:
-                    logger.debug(f"Error processing section {i}: {e}")
-                    continue
-
-            logger.warning(f"No artdeco-card section found with 'Experience' h2 on attempt {attempt + 1}")
+            if deadline is not None:
+                current_timeout = min(current_timeout, deadline.remaining())
+            logger.info("Attempt %s/%s to find experience section (timeout %ss)", attempt + 1, max_retries, current_timeout)
+
+            if wait_for_experience_section(driver, current_timeout):
+                section = driver.execute_script(EXPERIENCE_SECTION_SCRIPT)
+                if section is not None:
+                    logger.info("Found experience section on attempt %s", attempt + 1)
+                    return [section]
 
-            # If this isn't the last attempt, wait before retrying
-            if attempt < max_retries - 1:
-                logger.info(f"Waiting {base_wait_time} seconds before retry...")
-                time.sleep(base_wait_time)
+            logger.warning("No artdeco-card section found with 'Experience' h2 on attempt %s", attempt + 1)
 
-                # Try refreshing the page on the second attempt
-                if attempt == 1:
-                    logger.info("Refreshing page to reload dynamic content...")
-                    driver.refresh()
-                    time.sleep(3)  # Wait for page to reload
+            # Try refreshing the page before the last attempt
+            if attempt == max_retries - 2 and not (deadline is not None and deadline.expired()):
+                logger.info("Refreshing page to reload dynamic content...")
+                driver.refresh()
 
         except Exception as e:
-            logger.error(f"Error finding artdeco-card sections on attempt {attempt + 1}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(base_wait_time)
-                continue
+            logger.error("Error finding artdeco-card sections on attempt %s: %s", attempt + 1, e)
+            continue
 
     # Fallback: try finding by text content in any section
     try:
@@ -100,10 +154,10 @@ def find_experience_section(driver, timeout=10):
                     return [section]
             except Exception as e:
                 # Handle stale element reference
-                logger.debug(f"Stale section element at index {i}, skipping: {e}")
+                logger.debug("Stale section element at index %s, skipping: %s", i, e)
                 continue
     except Exception as e:
-        logger.error(f"Error searching by text content: {e}")
+        logger.error("Error searching by text content: %s", e)
 
     # Try alternative selectors for experience sections
     try:
@@ -121,45 +175,72 @@ def find_experience_section(driver, timeout=10):
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
-                    logger.debug(f"Found {len(elements)} elements with selector: {selector}")
+                    logger.debug("Found %s elements with selector: %s", len(elements), selector)
                     return elements
             except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
+                logger.debug("Selector %s failed: %s", selector, e)
                 continue
     except Exception as e:
-        logger.error(f"Error with alternative selectors: {e}")
+        logger.error("Error with alternative selectors: %s", e)
 
     # Last resort: try to find any content that might contain experience info
     try:
         logger.debug("Trying to find any content sections...")
         all_sections = driver.find_elements(By.CSS_SELECTOR, "section, .artdeco-card, .pvs-list")
         if all_sections:
-            logger.debug(f"Found {len(all_sections)} potential sections, returning first few")
+            logger.debug("Found %s potential sections, returning first few", len(all_sections))
             return all_sections[:3]  # Return first 3 sections as potential experience sections
     except Exception as e:
-        logger.error(f"Error in last resort search: {e}")
+        logger.error("Error in last resort search: %s", e)
 
     logger.error("No experience section found after all attempts")
     return []
 
 
-def extract_position_info(item) -> Dict[Literal['job_title', 'company', 'date_range', 'is_current'], Any]:
+def _visible_text(element):
+    """Text of an element's aria-hidden span (LinkedIn's visible copy), or ''"""
+    span = element.find('span', attrs={'aria-hidden': 'true'})
+    return span.get_text().strip() if span else ""
+
+
+def _meaningful(text):
+    """Filter out very short text"""
+    return text if text and len(text) > 2 else ""
+
+
+def parse_date_range(captions):
     """
-    Extract position information from a job item using BeautifulSoup.
-    Used by get_current_employer()
-    Returns a dictionary with the following keys:
-    - job_title (str)
-    - company (str)
-    - date_range (str)
-    - is_current (bool)
+    Find the date range among an experience item's caption texts.
+
+    Returns:
+        tuple: (date_range, is_current), e.g. ("jan 2020 - present", True), or ("", False)
+    """
+    for text in captions:
+        text = text.strip().lower()
+        if text and len(text) > 2:  # Filter out very short text
+            if any(word in text for word in DATE_WORDS):
+                # Additional validation: check if it looks like a date range
+                if any(char.isdigit() for char in text) or any(word in text for word in CURRENT_WORDS):
+                    return text.split("·")[0].strip(), any(word in text for word in CURRENT_WORDS)
+    return "", False
+
+
+def normalize_position(titles, subtitles, captions) -> Dict[Literal['job_title', 'company', 'date_range', 'is_current'], Any]:
+    """
+    Build a position dict from the visible texts of one experience item.
+
+    Args:
+        titles: Texts of the bold title divs (div.hoverable-link-text.t-bold)
+        subtitles: Texts of the span.t-14.t-normal spans
+        captions: Texts of the span.t-14.t-normal.t-black--light spans
 
     Position with multiple roles:
-    Company = 1st title
-    Dates = 1st t-14 t-normal t-black--light
+    Company = 1st title, job title = 2nd title
 
     Position with single role:
-    Company = 1st span t-14 t-normal
-    Dates = 1st t-14 t-normal t-black--light /// Also span pvs-entity__caption-wrapper
+    Job title = 1st title, company = 1st span t-14 t-normal
+
+    Dates = 1st caption that looks like a date range
     """
     logger = get_logger()
     position_info = {
@@ -169,74 +250,104 @@ def extract_position_info(item) -> Dict[Literal['job_title', 'company', 'date_ra
         "is_current": False
     }
 
+    # MULTI-ROLE POSITION
+    if len(titles) > 1:
+        logger.debug("Found multiple (%s) titles - this is a multi-role position.", len(titles))
+        position_info["company"] = _meaningful(titles[0])
+        position_info["job_title"] = _meaningful(titles[1])
+
+    # SINGLE ROLE POSITION
+    elif len(titles) == 1:
+        logger.debug("Found single title - this is a single-role position.")
+        position_info["job_title"] = _meaningful(titles[0])
+        if subtitles:
+            position_info["company"] = _meaningful(subtitles[0])
+
+    else:
+        logger.debug("No title found")
+
+    position_info["date_range"], position_info["is_current"] = parse_date_range(captions)
+    return position_info
+
+
+def extract_position_info(item) -> Dict[Literal['job_title', 'company', 'date_range', 'is_current'], Any]:
+    """
+    Extract position information from a job item using BeautifulSoup.
+    Used by get_current_employer() and the HTML fallback of get_all_positions()
+    Returns a dictionary with the following keys:
+    - job_title (str)
+    - company (str)
+    - date_range (str)
+    - is_current (bool)
+    """
+    logger = get_logger()
+
     try:
         # Get the HTML content of the item and parse with BeautifulSoup
         try:
             item_html = item.get_attribute('outerHTML')
         except Exception as e:
-            logger.warning(f"Stale element reference when getting HTML: {e}")
-            return position_info
+            logger.warning("Stale element reference when getting HTML: %s", e)
+            return normalize_position([], [], [])
 
         soup = BeautifulSoup(item_html, 'html.parser')
+        return normalize_position(
+            [_visible_text(div) for div in soup.select("div.hoverable-link-text.t-bold")],
+            [_visible_text(span) for span in soup.select("span.t-14.t-normal")],
+            [_visible_text(span) for span in soup.select("span.t-14.t-normal.t-black--light")]
+        )
 
-        title_divs = soup.select("div.hoverable-link-text.t-bold")
-
-        # MULTI-ROLE POSITION
-        if len(title_divs) > 1:
-
-            print(f"Found multiple ({len(title_divs)}) titles - this is a multi-role position.")
-            # FIND COMPANY
-            company_span = title_divs[0].find('span', attrs={'aria-hidden': 'true'})
-            if company_span:
-                company_text = company_span.get_text().strip()
-                if company_text and len(company_text) > 2:  # Filter out very short text
-                    position_info["company"] = company_text
-
-            title_span = title_divs[1].find('span', attrs={'aria-hidden': 'true'})
-            if title_span:
-                title_text = title_span.get_text().strip()
-                if title_text and len(title_text) > 2:  # Filter out very short text
-                    position_info["job_title"] = title_text
-
-        # SINGLE ROLE POSITION
-        elif len(title_divs) == 1:
-            print(f"Found single title - this is a single-role position.")
-            title_span = title_divs[0].find('span', attrs={'aria-hidden': 'true'})
-            if title_span:
-                title_text = title_span.get_text().strip()
-                if title_text and len(title_text) > 2:  # Filter out very short text
-                    position_info["job_title"] = title_text
-
-            company_spans = soup.select("span.t-14.t-normal")
-            company_span = company_spans[0].find('span', attrs={'aria-hidden': 'true'})
-            if company_span:
-                company_text = company_span.get_text().strip()
-                if company_text and len(company_text) > 2:  # Filter out very short text
-                    position_info["company"] = company_text
+    except Exception as e:
+        logger.error("Error extracting position info: %s", e)
+        return normalize_position([], [], [])
+
+
+def positions_from_experience_items(items) -> List[Dict[Literal['job_title', 'company', 'date_range', 'is_current'], Any]]:
+    """
+    Normalize the items returned by EXPERIENCE_SCRIPT into position dicts.
 
+    A grouped position (several roles at one company) becomes one position per role,
+    each carrying the group's company. Only positions with a company are returned.
+    """
+    positions = []
+    for item in items:
+        position_info = normalize_position(item['titles'], item['subtitles'], item['captions'])
+        if not position_info['company']:
+            continue
+
+        roles = item.get('roles') or []
+        if len(item['titles']) > 1 and roles:
+            for role in roles:
+                job_title = _meaningful(role['titles'][0]) if role['titles'] else ""
+                date_range, is_current = parse_date_range(role['captions'])
+                if not (job_title or date_range):
+                    continue
+                positions.append({
+                    "job_title": job_title,
+                    "company": position_info['company'],
+                    "date_range": date_range,
+                    "is_current": is_current
+                })
         else:
-            print("No title found")
-
-        # FIND DATES
-        date_divs = soup.select("span.t-14.t-normal.t-black--light")
-        for div in date_divs:
-            span = div.find('span', attrs={'aria-hidden': 'true'})
-            if span:
-                text = span.get_text().strip().lower()
-                if text and len(text) > 2:  # Filter out very short text
-                    if any(word in text for word in ["present", "current", "now", "today", "month", "year", "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]):
-                        # Additional validation: check if it looks like a date range
-                        if any(char.isdigit() for char in text) or any(word in text for word in ["present", "current", "now", "today"]):
-                            # date_range = text.split("·")[0].strip()
-                            position_info["date_range"] = date_range = text.split("·")[0].strip()
-                            if any(word in text for word in ["present", "current", "now", "today"]):
-                                position_info["is_current"] = True
-                            break
+            positions.append(position_info)
+    return positions
 
-    except Exception as e:
-        logger.error(f"Error extracting position info: {e}")
 
-    return position_info
+def extract_positions_with_script(driver, details_page=False):
+    """
+    Extract every experience entry with a single execute_script call.
+
+    Args:
+        driver: Driver showing a profile page, or its details/experience/ page if details_page is True
+
+    Returns:
+        list[dict]: Position dicts (see positions_from_experience_items), or None if
+            the experience section is not on the page
+    """
+    items = driver.execute_script(EXPERIENCE_SCRIPT, details_page)
+    if items is None:
+        return None
+    return positions_from_experience_items(items)
 
 
 def get_current_employer(
@@ -257,7 +368,7 @@ def get_current_employer(
     current_positions = []
 
     try:
-        logger.info(f"Navigating to profile: {profile_url}")
+        logger.info("Navigating to profile: %s", profile_url)
         driver.get(profile_url)
 
         # Wait for page to load
@@ -283,11 +394,11 @@ def get_current_employer(
         if not experience_sections:
             logger.warning("No experience sections found")
             return []
-        logger.debug(f"Found {len(experience_sections)} experience sections")
+        logger.debug("Found %s experience sections", len(experience_sections))
 
         # Process each experience section
         for section_idx, section in enumerate(experience_sections):
-            logger.debug(f"Processing experience section {section_idx + 1}")
+            logger.debug("Processing experience section %s", section_idx + 1)
 
             # Try different selectors for experience items
             item_selectors = [
@@ -301,7 +412,7 @@ def get_current_employer(
                 try:
                     items = section.find_elements(By.CSS_SELECTOR, selector)
                     if items:
-                        logger.info(f"Found {len(items)} experience items with selector: {selector}")
+                        logger.info("Found %s experience items with selector: %s", len(items), selector)
 
                         # Process each item immediately to avoid stale element issues
                         for item_idx, item in enumerate(items):
@@ -309,11 +420,11 @@ def get_current_employer(
                                 # Get the HTML content immediately to avoid stale element issues
                                 position_info = extract_position_info(item)
 
-                                logger.info(f"Item {item_idx + 1}:")
-                                logger.info(f"  Title: {position_info['job_title']}")
-                                logger.info(f"  Company: {position_info['company']}")
-                                logger.info(f"  Date: {position_info['date_range']}")
-                                logger.info(f"  Current: {position_info['is_current']}")
+                                logger.info(
+                                    "Item %s:\n  Title: %s\n  Company: %s\n  Date: %s\n  Current: %s",
+                                    item_idx + 1, position_info['job_title'], position_info['company'],
+                                    position_info['date_range'], position_info['is_current']
+                                )
 
                                 # Add positions that are either:
                                 # 1. Current positions with dates (is_current = True)
@@ -322,12 +433,12 @@ def get_current_employer(
                                    (position_info['company'] and not position_info['date_range'] and (position_info['job_title'] or position_info['company'])):
                                     current_positions.append(position_info)
                                     if position_info['is_current']:
-                                        logger.info(f"  -> Added to current positions (with dates)")
+                                        logger.info("  -> Added to current positions (with dates)")
                                     else:
-                                        logger.info(f"  -> Added to current positions (no dates)")
+                                        logger.info("  -> Added to current positions (no dates)")
 
                             except Exception as e:
-                                logger.error(f"Error processing item {item_idx + 1}: {e}")
+                                logger.error("Error processing item %s: %s", item_idx + 1, e)
                                 continue
 
                             # Small delay to prevent overwhelming the page
@@ -337,15 +448,15 @@ def get_current_employer(
                         break
 
                 except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
+                    logger.debug("Selector %s failed: %s", selector, e)
                     continue
 
             # If we found and processed items in this section, we can move to the next section
             if current_positions:
-                logger.debug(f"Found current positions in section {section_idx + 1}, moving to next section")
+                logger.debug("Found current positions in section %s, moving to next section", section_idx + 1)
                 continue
 
-        logger.info(f"Total current positions found: {len(current_positions)}")
+        logger.info("Total current positions found: %s", len(current_positions))
         return current_positions
 
     except TimeoutException:
@@ -353,18 +464,93 @@ def get_current_employer(
         return []
 
     except Exception as e:
-        logger.error(f"Error in get_current_employer: {e}")
+        logger.error("Error in get_current_employer: %s", e)
         return []
 
 
+def get_positions_from_details_page(driver, profile_url, timeout=15):
+    """
+    Read positions from the profile's details/experience/ subpage.
+
+    The subpage lists every position without the rest of the profile, so there is no
+    section search or scrolling; longer lists are paged in with their "Show more" button.
+
+    Returns:
+        list[dict]: Position dicts, or None if the subpage could not be used
+    """
+    logger = get_logger()
+    details_url = details_experience_url(profile_url)
+    if details_url is None:
+        return None
+
+    logger.info("Navigating to experience details: %s", details_url)
+    wait_for_rate_limit('linkedin')
+    started = time.perf_counter()
+    deadline = Deadline(timeout)
+    driver.get(details_url)
+    check_linkedin_page(driver)
+    loaded = time.perf_counter()
+    record_timing('linkedin_navigation', loaded - started)
+
+    state = wait_for_script(driver, DETAILS_READY_SCRIPT, deadline.remaining())
+    if state is None:
+        check_linkedin_page(driver)
+        logger.info("Experience details page did not list any positions in time")
+        return None
+    record_success('linkedin')
+    if state != 'ready':
+        logger.info("Experience details page not usable (%s)", state)
+        return None
+
+    for _ in range(MAX_DETAILS_PAGES - 1):
+        count_before = driver.execute_script(DETAILS_SHOW_MORE_SCRIPT)
+        if count_before < 0:
+            break
+        if not wait_for_script(driver, DETAILS_MORE_LOADED_SCRIPT, deadline.remaining(), count_before):
+            break
+    ready = time.perf_counter()
+    record_timing('experience_discovery', ready - loaded)
+
+    all_positions = extract_positions_with_script(driver, details_page=True)
+    if all_positions:
+        _log_parse_time(logger, details_url, "details page", started, loaded, ready)
+    return all_positions
+
+
+def _log_parse_time(logger, profile_url, extraction_mode, started, loaded, ready):
+    """Report how long one profile took from navigation to extracted positions"""
+    finished = time.perf_counter()
+    record_timing('parsing', finished - ready)
+    logger.info(
+        f"Parsed {profile_url} in {finished - started:.2f}s "
+        f"(load {loaded - started:.2f}s, experience ready {ready - loaded:.2f}s, "
+        f"{extraction_mode} extraction {finished - ready:.2f}s)"
+    )
+
+
 def get_all_positions(
     driver,
     profile_url,
     verbose=False,
-    timeout=15
+    timeout=15,
+    force_refresh=False,
+    extraction_mode=None,
+    use_details_page=None
 ) -> Dict[Literal['current_positions', 'all_positions'], Any]:
     """
     Extract both current and all positions from LinkedIn profile URL in a single pass with retry logic.
+
+    Positions are cached per profile URL (see profile_cache.py), so a profile that comes
+    up again as a candidate is not reloaded. Pass force_refresh=True to ignore the cache
+    and scrape the profile again.
+
+    extraction_mode is 'script' (one execute_script call returns the whole experience
+    list) or 'html' (element-by-element parsing); it defaults to EXPERIENCE_EXTRACTION.
+    The script mode falls back to HTML parsing if it finds no experience section.
+
+    With use_details_page (default EXPERIENCE_DETAILS_PAGE) the profile's
+    details/experience/ subpage is read first; the full profile page is only loaded
+    if that subpage yields no positions.
     Returns a dictionary with the following keys:
         {
             'current_positions': list[dict],  # Current positions (existing behavior)
@@ -380,6 +566,30 @@ def get_all_positions(
         }
     """
     logger = get_logger()
+    extraction_mode = extraction_mode or EXPERIENCE_EXTRACTION
+    if use_details_page is None:
+        use_details_page = EXPERIENCE_DETAILS_PAGE
+
+    profile_cache = get_profile_cache()
+    cache_key = profile_cache_key(profile_url)
+    if not force_refresh:
+        cached_positions = profile_cache.get(cache_key)
+        if cached_positions is not None:
+            logger.info("Profile cache hit for %s (%s positions)", profile_url, len(cached_positions))
+            return cached_positions
+
+    if use_details_page:
+        try:
+            all_positions = get_positions_from_details_page(driver, profile_url, timeout)
+        except (BlockedError, RateLimitWaitCancelled):
+            raise
+        except Exception as e:
+            logger.warning("Error reading experience details page: %s", e)
+            all_positions = None
+        if all_positions:
+            profile_cache.set(cache_key, all_positions)
+            return all_positions
+        logger.info("Falling back to the full profile page")
 
     # Retry logic for data extraction
     max_extraction_retries = 2
@@ -390,41 +600,65 @@ def get_all_positions(
 
         try:
             if extraction_attempt > 0:
-                logger.info(f"Data extraction attempt {extraction_attempt + 1}/{max_extraction_retries}")
+                logger.info("Data extraction attempt %s/%s", extraction_attempt + 1, max_extraction_retries)
                 # Wait a bit before retry
                 time.sleep(3)
 
-            logger.info(f"Navigating to profile: {profile_url}")
+            logger.info("Navigating to profile: %s", profile_url)
+            wait_for_rate_limit('linkedin')
+            started = time.perf_counter()
+            # One deadline for the page and its experience list
+            deadline = Deadline(timeout * 2)
             driver.get(profile_url)
 
+            # Stop early (and slow down) if LinkedIn answered with an authwall, checkpoint or 429
+            check_linkedin_page(driver)
+
             # Wait for page to load
+            main_loaded = True
             try:
-                WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "main"))
-                )
+                deadline.wait(driver, EC.presence_of_element_located((By.TAG_NAME, "main")), timeout=timeout)
             except TimeoutException:
-                WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-
-            WebDriverWait(driver, timeout * 2).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.artdeco-list__item"))
-            )
+                main_loaded = False
+                deadline.wait(driver, EC.presence_of_element_located((By.TAG_NAME, "body")))
+                check_linkedin_page(driver)
+            record_success('linkedin')
+            loaded = time.perf_counter()
+            record_timing('linkedin_navigation', loaded - started)
+
+            # Returns as soon as the experience list is rendered, scrolling only if it is missing
+            experience_ready = wait_for_experience_section(driver, deadline.remaining())
+            ready = time.perf_counter()
+            record_timing('experience_discovery', ready - loaded)
 
             logger.debug("Page loaded successfully, looking for experience section...")
 
-            experience_sections = find_experience_section(driver, timeout)
+            if extraction_mode == 'script' and experience_ready:
+                all_positions = extract_positions_with_script(driver)
+                if all_positions:
+                    _log_parse_time(logger, profile_url, "script", started, loaded, ready)
+                    profile_cache.set(cache_key, all_positions)
+                    return all_positions
+                logger.info("Script extraction found no positions, falling back to HTML parsing")
+                all_positions = []
+
+            if not experience_ready and main_loaded and driver.execute_script(EXPERIENCE_SECTION_SCRIPT) is None:
+                # The profile rendered without an experience section; waiting again will not add one
+                logger.info("No experience section on %s", profile_url)
+                return []
+
+            experience_sections = find_experience_section(driver, timeout, deadline)
             if not experience_sections:
                 logger.warning("No experience sections found")
                 if extraction_attempt < max_extraction_retries - 1:
                     logger.info("Retrying data extraction...")
                     continue
                 return []
-            logger.debug(f"Found {len(experience_sections)} experience sections")
+            logger.debug("Found %s experience sections", len(experience_sections))
 
             # Process each experience section
             for section_idx, section in enumerate(experience_sections):
-                logger.debug(f"Processing experience section {section_idx + 1}")
+                logger.debug("Processing experience section %s", section_idx + 1)
 
                 # Try different selectors for experience items
                 item_selectors = [
@@ -438,7 +672,7 @@ def get_all_positions(
                     try:
                         items = section.find_elements(By.CSS_SELECTOR, selector)
                         if items:
-                            logger.info(f"Found {len(items)} experience items with selector: {selector}")
+                            logger.info("Found %s experience items with selector: %s", len(items), selector)
 
                             # Process each item immediately to avoid stale element issues
                             for item_idx, item in enumerate(items):
@@ -446,11 +680,11 @@ def get_all_positions(
                                     # Get the HTML content immediately to avoid stale element issues
                                     position_info = extract_position_info(item)
 
-                                    logger.info(f"Item {item_idx + 1}:")
-                                    logger.info(f"  Title: {position_info['job_title']}")
-                                    logger.info(f"  Company: {position_info['company']}")
-                                    logger.info(f"  Date: {position_info['date_range']}")
-                                    logger.info(f"  Current: {position_info['is_current']}")
+                                    logger.info(
+                                        "Item %s:\n  Title: %s\n  Company: %s\n  Date: %s\n  Current: %s",
+                                        item_idx + 1, position_info['job_title'], position_info['company'],
+                                        position_info['date_range'], position_info['is_current']
+                                    )
 
                                     # Add to all_positions if it has company info
                                     if position_info['company']:
@@ -459,12 +693,12 @@ def get_all_positions(
                                         # Add to current_positions if it meets the current criteria
                                         if position_info['is_current'] or (item_idx == 0 and not position_info['date_range']):
                                             current_positions.append(position_info)
-                                            logger.info(f"  -> Added to current positions")
+                                            logger.info("  -> Added to current positions")
                                         else:
-                                            logger.info(f"  -> Added to all positions")
+                                            logger.info("  -> Added to all positions")
 
                                 except Exception as e:
-                                    logger.error(f"Error processing item {item_idx + 1}: {e}")
+                                    logger.error("Error processing item %s: %s", item_idx + 1, e)
                                     continue
 
                                 # Small delay to prevent overwhelming the page
@@ -474,23 +708,30 @@ def get_all_positions(
                             break
 
                     except Exception as e:
-                        logger.debug(f"Selector {selector} failed: {e}")
+                        logger.debug("Selector %s failed: %s", selector, e)
                         continue
 
-            logger.info(f"Total current positions found: {len(current_positions)}")
-            logger.info(f"Total all positions found: {len(all_positions)}")
+            logger.info("Total current positions found: %s", len(current_positions))
+            logger.info("Total all positions found: %s", len(all_positions))
 
             # Content validation - check if we got meaningful data
             if all_positions and any(pos['company'] for pos in all_positions):
                 logger.info("Successfully extracted position data with company information")
+                _log_parse_time(logger, profile_url, "html", started, loaded, ready)
+                profile_cache.set(cache_key, all_positions)
                 return all_positions
             elif extraction_attempt < max_extraction_retries - 1:
-                logger.warning(f"No meaningful position data extracted on attempt {extraction_attempt + 1}, retrying...")
+                logger.warning("No meaningful position data extracted on attempt %s, retrying...", extraction_attempt + 1)
                 continue
             else:
                 logger.warning("No meaningful position data extracted after all attempts")
                 return []
 
+        except (BlockedError, RateLimitWaitCancelled):
+            # Retrying a blocked page only digs deeper; let the caller record the block.
+            # A cancelled wait means processing is stopping
+            raise
+
         except TimeoutException:
             logger.error(f"Timeout waiting for page to load on attempt {extraction_attempt + 1}")
             if extraction_attempt < max_extraction_retries - 1:
@@ -509,7 +750,7 @@ def get_all_positions(
 
 
 if __name__ == "__main__":
-    driver = get_driver(headless=True, keep_open=False)
+    driver = get_driver(headless=True, keep_open=False, role='linkedin')
     login(driver)
     profile_url = "https://www.linkedin.com/in/abhi-p-11004211/"
     result = get_all_positions(driver, profile_url)
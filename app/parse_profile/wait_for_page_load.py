@@ -3,14 +3,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from app.logger import get_logger
 
 
 def wait_for_page_load(driver, timeout=10, selectors=[".artdeco-card"]):
     """
     Wait for the page to be fully loaded using multiple strategies
     """
+    logger = get_logger()
     try:
-        print(f"Waiting up to {timeout} seconds for page to load...")
+        logger.debug("Waiting up to %s seconds for page to load...", timeout)
 
         # Wait for basic page structure - try multiple approaches
         try:
@@ -24,18 +26,18 @@ def wait_for_page_load(driver, timeout=10, selectors=[".artdeco-card"]):
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
             except TimeoutException:
-                print("Page failed to load basic structure")
+                logger.warning("Page failed to load basic structure")
                 return False
 
 
         element_found = False
         for selector in selectors:
             try:
-                print(f"Waiting up to 5 seconds for profile element: {selector}")
+                logger.debug("Waiting up to 5 seconds for profile element: %s", selector)
                 WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                 )
-                print(f"Found element with selector: {selector}")
+                logger.debug("Found element with selector: %s", selector)
                 element_found = True
                 break
             except TimeoutException:
@@ -43,39 +45,97 @@ def wait_for_page_load(driver, timeout=10, selectors=[".artdeco-card"]):
 
         # If no specific selectors work, check if page has loaded any content
         if not element_found:
-            print("No specific profile elements found, checking for any content...")
+            logger.debug("No specific profile elements found, checking for any content...")
             try:
                 # Wait for any content to be present
                 WebDriverWait(driver, 10).until(
                     lambda d: len(d.find_elements(By.TAG_NAME, "div")) > 10
                 )
-                print("Page has loaded with content, proceeding...")
+                logger.debug("Page has loaded with content, proceeding...")
                 element_found = True
             except TimeoutException:
-                print("Page appears to be empty or not loading properly")
+                logger.warning("Page appears to be empty or not loading properly")
                 return False
 
         # Additional wait for Experience section to load
-        print("Waiting for Experience section to load...")
+        logger.debug("Waiting for Experience section to load...")
         try:
             # Wait for experience-related elements to appear
             WebDriverWait(driver, 10).until(
                 lambda d: len(d.find_elements(By.CSS_SELECTOR, "li.artdeco-list__item")) > 0
             )
-            print("Experience section elements found")
+            logger.debug("Experience section elements found")
         except TimeoutException:
-            print("Warning: Experience section elements not found within timeout")
+            logger.warning("Experience section elements not found within timeout")
             # Don't fail here, just log the warning
 
         # Additional wait for dynamic content to fully load
-        print("Waiting 2 seconds for dynamic content to fully load...")
+        logger.debug("Waiting 2 seconds for dynamic content to fully load...")
         time.sleep(2)
 
         return element_found
 
     except TimeoutException:
-        print("Page failed to load within timeout period")
+        logger.warning("Page failed to load within timeout period")
         return False
     except Exception as e:
-        print(f"Unexpected error during page load wait: {e}")
+        logger.error("Unexpected error during page load wait: %s", e)
         return False
+
+
+# True once the #experience anchor and at least one list item of its section exist
+EXPERIENCE_READY_SCRIPT = """
+const anchor = document.querySelector('div#experience');
+const section = anchor && anchor.closest('section');
+return Boolean(section && section.querySelector('li.artdeco-list__item'));
+"""
+
+# Fractions of the page height to scroll to, one step at a time, while lazy content is missing
+SCROLL_STEPS = [1 / 3, 1 / 2, 2 / 3, 1]
+
+
+def wait_for_experience_section(driver, timeout=10, scroll_after=1.0, poll_frequency=0.1):
+    """
+    Wait until the experience section and its list items are in the DOM.
+
+    Polls a JS predicate and returns as soon as it holds, instead of sleeping for a
+    fixed time. Only when the section is still missing after scroll_after seconds
+    does it scroll one step further down, so lazily loaded content gets rendered.
+
+    Returns:
+        bool: True if the section is ready, False if timeout passed first
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    next_scroll = started + scroll_after
+    scroll_steps = list(SCROLL_STEPS)
+
+    while True:
+        if driver.execute_script(EXPERIENCE_READY_SCRIPT):
+            return True
+
+        now = time.monotonic()
+        if now >= deadline:
+            return False
+        if scroll_steps and now >= next_scroll:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight * arguments[0]);", scroll_steps.pop(0))
+            next_scroll = now + scroll_after
+        time.sleep(min(poll_frequency, max(0.0, deadline - now)))
+
+
+def wait_for_script(driver, script, timeout=10, *args, poll_frequency=0.1):
+    """
+    Poll a JS predicate until it returns a truthy value.
+
+    Returns:
+        The first truthy value the script returned, or None if timeout passed first
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = driver.execute_script(script, *args)
+        if result:
+            return result
+        now = time.monotonic()
+        if now >= deadline:
+            return None
+        time.sleep(min(poll_frequency, deadline - now))
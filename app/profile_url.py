@@ -0,0 +1,180 @@
+import base64
+import binascii
+import re
+from urllib.parse import urlparse, parse_qs, unquote, quote
+
+
+def is_bing_redirect(url):
+    """True if url is a Bing click-tracking redirect (bing.com/ck/a?...&u=...)"""
+    parsed = urlparse(url)
+    return 'bing.com' in parsed.netloc and ('/ck/' in parsed.path or 'u=' in parsed.query)
+
+
+# Query parameters that carry the target of a Bing redirect, in order of preference
+BING_TARGET_PARAMS = ('u', 'url', 'r', 'redirect')
+
+# Bing marks a base64url-encoded target with this prefix (u=a1aHR0cHM6Ly9...)
+BING_BASE64_PREFIX = "a1"
+
+# Enough rounds for a target that was percent-encoded at every hop of a redirect chain
+MAX_UNQUOTE_ROUNDS = 5
+
+URL_SCHEME = re.compile(r"^(https?:)?//", re.IGNORECASE)
+BASE64_PAYLOAD = re.compile(r"^[A-Za-z0-9+/_-]+=*$")
+
+
+def _is_url(value):
+    return bool(URL_SCHEME.match(value)) and bool(urlparse(value).netloc)
+
+
+def _unquote_nested(value):
+    """Undo (possibly repeated) percent-encoding of a target, stopping once it reads as a URL"""
+    for _ in range(MAX_UNQUOTE_ROUNDS):
+        if URL_SCHEME.match(value) or '%' not in value:
+            break
+        value = unquote(value)
+    return value
+
+
+def _decode_base64_url(payload):
+    """
+    Decode a base64 target in either alphabet, with or without '=' padding.
+
+    parse_qs turns an unescaped '+' into a space, so spaces are read back as '+'.
+    """
+    payload = payload.replace(' ', '+').rstrip('=')
+    payload = payload.replace('+', '-').replace('/', '_')
+    payload += '=' * (-len(payload) % 4)
+    decoded = base64.urlsafe_b64decode(payload).decode('utf-8')
+    return _unquote_nested(decoded.strip())
+
+
+def decode_bing_redirect_target(value):
+    """
+    Decode the value of a Bing redirect's target parameter.
+
+    Handles plain and nested percent-encoded URLs, and base64 targets (with or without
+    the 'a1' prefix, standard or URL-safe alphabet, padded or not).
+
+    Returns:
+        str: The target URL
+
+    Raises:
+        ValueError: If the value is neither a URL nor a base64-encoded URL
+    """
+    value = _unquote_nested(value)
+    if _is_url(value):
+        return value
+
+    payload = value[len(BING_BASE64_PREFIX):] if value.startswith(BING_BASE64_PREFIX) else value
+    if BASE64_PAYLOAD.match(payload.replace(' ', '+')):
+        try:
+            decoded = _decode_base64_url(payload)
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid base64 target '{value[:40]}': {e}") from e
+        if _is_url(decoded):
+            return decoded
+    raise ValueError(f"Not a URL or base64-encoded URL: '{value[:40]}'")
+
+
+def decode_bing_redirect(bing_url):
+    """
+    Decode the target URL carried in a Bing redirect's query parameters.
+
+    Returns:
+        str | None: The decoded URL, or None if the redirect carries no target parameter
+
+    Raises:
+        ValueError: If a target parameter is present but cannot be decoded
+    """
+    query_params = parse_qs(urlparse(bing_url).query)
+
+    for param_name in BING_TARGET_PARAMS:
+        if param_name in query_params:
+            try:
+                return decode_bing_redirect_target(query_params[param_name][0])
+            except ValueError as e:
+                raise ValueError(f"Error decoding URL from parameter '{param_name}': {e}") from e
+
+    return None
+
+
+def profile_key(url):
+    """
+    Return the canonical key for a LinkedIn profile URL: the lower-cased,
+    percent-decoded /in/ slug. Returns None if url is not a LinkedIn profile URL.
+
+    Locale subdomains (uk.linkedin.com), missing schemes, trailing slashes, query
+    strings, fragments, language suffixes (/en, /de) and Bing redirects all map to
+    the same key.
+    """
+    if not url or not isinstance(url, str):
+        return None
+    url = url.strip()
+
+    if is_bing_redirect(url):
+        try:
+            url = decode_bing_redirect(url)
+        except ValueError:
+            return None
+        if not url:
+            return None
+
+    if '://' not in url:
+        url = 'https://' + url.lstrip('/')
+
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().split(':')[0]
+    if host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+        return None
+
+    path_parts = [part for part in unquote(parsed.path).split('/') if part]
+    if len(path_parts) < 2 or path_parts[0].lower() != 'in':
+        return None
+
+    return path_parts[1].lower()
+
+
+def canonical_profile_url(url):
+    """
+    Return the canonical form https://www.linkedin.com/in/<slug>/ of a LinkedIn
+    profile URL, or None if url is not a LinkedIn profile URL.
+    """
+    key = profile_key(url)
+    if key is None:
+        return None
+    return f"https://www.linkedin.com/in/{quote(key, safe='-_.~')}/"
+
+
+def details_experience_url(url):
+    """
+    Return the profile's experience subpage https://www.linkedin.com/in/<slug>/details/experience/,
+    or None if url is not a LinkedIn profile URL.
+    """
+    canonical_url = canonical_profile_url(url)
+    if canonical_url is None:
+        return None
+    return canonical_url + "details/experience/"
+
+
+def dedupe_profile_urls(urls, seen_keys=None):
+    """
+    Canonicalize profile URLs and drop duplicates, keeping the first occurrence.
+
+    Args:
+        urls: Candidate profile URLs in any form
+        seen_keys: Optional set of profile keys to skip (e.g. already checked for this contact)
+
+    Returns:
+        list[str]: Canonical profile URLs in their original order
+    """
+    seen = set(seen_keys or ())
+    unique_urls = []
+    for url in urls:
+        key = profile_key(url)
+        if key is None or key in seen:
+            continue
+        seen.add(key)
+        unique_urls.append(canonical_profile_url(url))
+    return unique_urls
+
@@ -0,0 +1,266 @@
+import threading
+import time
+from app.config import get_env_float
+from app.logger import get_logger
+from app.metrics import record_event
+
+# Default budgets per outbound service: (requests per minute, burst)
+# Override with RATE_LIMIT_<SERVICE>_RPM / RATE_LIMIT_<SERVICE>_BURST in .env
+DEFAULT_RATE_LIMITS = {
+    'linkedin': (10, 3),   # LinkedIn profile page loads
+    'bing': (20, 3),       # Bing results pages
+    'brave': (60, 1),      # Brave Search API calls (free plan: 1 query/second)
+    'google': (20, 1),     # Google searches
+}
+
+# Adaptive (AIMD) throttling: a detected block (captcha, authwall, HTTP 429) multiplies
+# the rate by DECREASE_FACTOR, at most once per BLOCK_COOLDOWN_SECONDS; every healthy
+# response adds INCREASE_FRACTION of the configured rate back, up to the configured rate
+DECREASE_FACTOR = 0.5
+INCREASE_FRACTION = 0.02
+MIN_REQUESTS_PER_MINUTE = 1.0
+BLOCK_COOLDOWN_SECONDS = 30
+
+
+class RateLimitWaitCancelled(Exception):
+    """Raised instead of making a request when processing stopped while it waited for its turn"""
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by every thread that talks to one service.
+
+    Tokens refill continuously at requests_per_minute / 60 per second, up to burst
+    tokens. Each request takes one token and waits only as long as needed for the
+    next one, so idle time (e.g. a run of cache hits) is banked as burst capacity
+    instead of being slept away.
+
+    The configured rate is a ceiling: record_block() cuts the current rate
+    multiplicatively when the service starts blocking, and record_success() raises it
+    again additively while responses stay healthy.
+    """
+
+    def __init__(self, name, requests_per_minute, burst=1):
+        self.name = name
+        self._lock = threading.Lock()
+        self.max_requests_per_minute = float(requests_per_minute)
+        self.requests_per_minute = self.max_requests_per_minute
+        self.burst = max(1.0, float(burst))
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._last_decrease = None
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.blocks = 0
+        self.last_block_reason = None
+
+    @property
+    def rate_per_second(self):
+        return self.requests_per_minute / 60.0
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+
+    def set_rate(self, requests_per_minute, burst=None):
+        """Change the configured budget; tokens already banked are kept (up to the new burst)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.max_requests_per_minute = float(requests_per_minute)
+            self.requests_per_minute = self.max_requests_per_minute
+            if burst is not None:
+                self.burst = max(1.0, float(burst))
+            self._tokens = min(self._tokens, self.burst)
+
+    def acquire(self, stop_flag=None):
+        """
+        Block until a request may be made.
+
+        Args:
+            stop_flag: Optional threading.Event; waiting ends early when it is set
+
+        Returns:
+            bool: True if a token was taken, False if stop_flag was set while waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired += 1
+                    self.total_wait += waited
+                    return True
+                if self.rate_per_second <= 0:
+                    wait_time = 1.0
+                else:
+                    wait_time = (1 - self._tokens) / self.rate_per_second
+
+            if stop_flag is not None:
+                if stop_flag.wait(wait_time):
+                    return False
+            else:
+                time.sleep(wait_time)
+            waited += wait_time
+
+    def record_block(self, reason):
+        """
+        Report a block page or HTTP 429: stop spending banked tokens and cut the rate.
+
+        Blocks reported by other threads within BLOCK_COOLDOWN_SECONDS of the last cut
+        are counted but do not cut the rate again.
+
+        Returns:
+            bool: True if the rate was cut
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self.blocks += 1
+            self.last_block_reason = reason
+            record_event('rate_limit', service=self.name, reason=reason)
+            if self._last_decrease is not None and now - self._last_decrease < BLOCK_COOLDOWN_SECONDS:
+                return False
+            self._last_decrease = now
+            self.requests_per_minute = max(
+                min(MIN_REQUESTS_PER_MINUTE, self.max_requests_per_minute),
+                self.requests_per_minute * DECREASE_FACTOR
+            )
+            new_rate = self.requests_per_minute
+
+        get_logger().warning(f"{self.name}: block detected ({reason}) - rate cut to {new_rate:.1f} requests/minute")
+        return True
+
+    def record_success(self):
+        """Report a healthy response: raise the rate a step back towards the configured rate"""
+        with self._lock:
+            if self.requests_per_minute >= self.max_requests_per_minute:
+                return
+            self._refill(time.monotonic())
+            self.requests_per_minute = min(
+                self.max_requests_per_minute,
+                self.requests_per_minute + self.max_requests_per_minute * INCREASE_FRACTION
+            )
+
+    def reset_stats(self):
+        """Reset the request, wait and block counters (called at the start of each run)"""
+        with self._lock:
+            self.acquired = 0
+            self.total_wait = 0.0
+            self.blocks = 0
+            self.last_block_reason = None
+
+    def stats(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'requests_per_minute': self.requests_per_minute,
+                'max_requests_per_minute': self.max_requests_per_minute,
+                'burst': self.burst,
+                'acquired': self.acquired,
+                'total_wait': self.total_wait,
+                'blocks': self.blocks,
+                'last_block_reason': self.last_block_reason
+            }
+
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+# Set while processing is stopping: every wait_for_rate_limit() returns at once, even
+# one that would otherwise wait a minute on a rate halved after a block
+_waits_cancelled = threading.Event()
+
+
+def configured_rate_limit(name):
+    """Return a service's (requests per minute, burst) from .env, or its default budget"""
+    default_rpm, default_burst = DEFAULT_RATE_LIMITS.get(name, (60, 1))
+    rpm = get_env_float(f'RATE_LIMIT_{name.upper()}_RPM', default_rpm)
+    burst = get_env_float(f'RATE_LIMIT_{name.upper()}_BURST', default_burst)
+    return rpm, burst
+
+
+def get_rate_limiter(name):
+    """
+    Get the shared rate limiter for a service ('linkedin', 'bing', 'brave', 'google').
+    """
+    with _rate_limiters_lock:
+        if name not in _rate_limiters:
+            _rate_limiters[name] = TokenBucket(name, *configured_rate_limit(name))
+        return _rate_limiters[name]
+
+
+def configure_rate_limits(rate_limits):
+    """
+    Override service budgets for this run.
+
+    Args:
+        rate_limits: dict of service name -> (requests_per_minute, burst) or requests_per_minute
+    """
+    logger = get_logger()
+    for name, limit in (rate_limits or {}).items():
+        if isinstance(limit, (tuple, list)):
+            rpm, burst = limit
+        else:
+            rpm, burst = limit, None
+        get_rate_limiter(name).set_rate(rpm, burst)
+        logger.info(f"Rate limit for {name}: {rpm} requests/minute" + (f", burst {burst}" if burst else ""))
+
+
+def wait_for_rate_limit(name):
+    """
+    Take one request from a service's budget, waiting if necessary.
+
+    Raises:
+        RateLimitWaitCancelled: If cancel_rate_limit_waits() was called before or while waiting
+    """
+    if _waits_cancelled.is_set() or not get_rate_limiter(name).acquire(_waits_cancelled):
+        raise RateLimitWaitCancelled(f"Stopped while waiting for the {name} rate limit")
+    return True
+
+
+def cancel_rate_limit_waits():
+    """End every wait for a request slot, in any thread (called when processing stops)"""
+    _waits_cancelled.set()
+
+
+def allow_rate_limit_waits():
+    """Let requests wait for their turn again (called at the start and end of each run)"""
+    _waits_cancelled.clear()
+
+
+def record_block(name, reason):
+    """Slow a service down after it answered with a block page or HTTP 429"""
+    return get_rate_limiter(name).record_block(reason)
+
+
+def record_success(name):
+    """Let a service speed back up after a healthy response"""
+    get_rate_limiter(name).record_success()
+
+
+def rate_limit_stats():
+    """Return stats for every rate limiter used so far, keyed by service name"""
+    with _rate_limiters_lock:
+        limiters = list(_rate_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+def reset_rate_limit_stats():
+    """Reset the counters of every rate limiter used so far"""
+    with _rate_limiters_lock:
+        limiters = list(_rate_limiters.values())
+    for limiter in limiters:
+        limiter.reset_stats()
+
+
+def format_rate_limits(stats=None):
+    """Format the current rates as e.g. 'linkedin 5.0/10 per minute, bing 20.0/20 per minute'"""
+    stats = rate_limit_stats() if stats is None else stats
+    return ", ".join(
+        f"{name} {s['requests_per_minute']:.1f}/{s['max_requests_per_minute']:g} per minute"
+        for name, s in stats.items()
+    )
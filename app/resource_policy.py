@@ -0,0 +1,125 @@
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from app.config import get_env_str
+from app.logger import get_logger
+
+# URL patterns per resource category, in the wildcard syntax of the DevTools
+# Network.setBlockedURLs command ('*' matches any run of characters)
+RESOURCE_PATTERNS = {
+    'images': [
+        "*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.gif?*",
+        "*.webp", "*.webp?*", "*.avif", "*.avif?*", "*.svg", "*.svg?*", "*.ico", "*.ico?*",
+        "*media.licdn.com/dms/image/*",   # LinkedIn photos and logos (no file extension)
+        "*static.licdn.com/aero-v1/sc/h/*.svg*",
+        "*bing.com/th?*", "*bing.com/th/id/*", "*bing.net/th?*",  # Bing thumbnails
+    ],
+    'media': [
+        "*.mp4", "*.mp4?*", "*.webm", "*.webm?*", "*.m3u8", "*.m3u8?*", "*.mp3", "*.mp3?*",
+        "*.ogg", "*.ogg?*", "*.mov", "*.mov?*",
+        "*dms.licdn.com/playlist/*",      # LinkedIn video
+    ],
+    'fonts': [
+        "*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.ttf?*", "*.otf", "*.otf?*",
+        "*.eot", "*.eot?*",
+    ],
+    'analytics': [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*px.ads.linkedin.com*", "*linkedin.com/li/track*", "*linkedin.com/li/tscp*",
+        "*snap.licdn.com/li.lms-analytics*", "*bat.bing.com*", "*clarity.ms*",
+        "*facebook.net*", "*hotjar.com*", "*scorecardresearch.com*",
+    ],
+}
+
+# Categories blocked per driver role; override with RESOURCE_BLOCKING_<ROLE> in .env
+# (a comma separated list of categories, or 'none')
+DEFAULT_POLICIES = {
+    'linkedin': ('images', 'media', 'fonts', 'analytics'),
+    'bing': ('images', 'media', 'fonts', 'analytics'),
+}
+
+
+def get_policy(role):
+    """Return the resource categories blocked for a driver role ('linkedin', 'bing')"""
+    if role is None:
+        return ()
+    value = get_env_str(f'RESOURCE_BLOCKING_{role.upper()}')
+    if value is None:
+        return DEFAULT_POLICIES.get(role, ())
+    if value.lower() == 'none':
+        return ()
+    return tuple(category.strip().lower() for category in value.split(',') if category.strip())
+
+
+def blocked_url_patterns(categories, extra_patterns=None):
+    """Collect the URL patterns for a list of resource categories"""
+    logger = get_logger()
+    patterns = []
+    for category in categories:
+        if category not in RESOURCE_PATTERNS:
+            logger.warning(f"Unknown resource category '{category}' - expected one of {', '.join(RESOURCE_PATTERNS)}")
+            continue
+        patterns.extend(RESOURCE_PATTERNS[category])
+    patterns.extend(extra_patterns or [])
+    return patterns
+
+
+@lru_cache(maxsize=None)
+def _pattern_regex(pattern):
+    # Only '*' is a wildcard; everything else (including '?') matches literally
+    return re.compile(".*".join(re.escape(part) for part in pattern.split("*")), re.DOTALL)
+
+
+def url_is_blocked(url, patterns):
+    """Check a URL against blocked URL patterns the way Chrome matches them"""
+    return any(_pattern_regex(pattern).fullmatch(url) for pattern in patterns)
+
+
+def _set_blocked_urls(driver, patterns):
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def apply_resource_policy(driver, role, extra_patterns=None):
+    """
+    Block the resource categories configured for a driver role.
+
+    Uses the DevTools Protocol, so blocked requests are cancelled before they leave
+    the browser. The patterns are remembered on the driver so they can be suspended
+    and restored (see resource_policy_suspended).
+
+    Args:
+        driver: A Chrome WebDriver
+        role: Driver role ('linkedin', 'bing') or None for no blocking
+        extra_patterns: Optional additional URL patterns to block
+
+    Returns:
+        list[str]: The URL patterns now blocked
+    """
+    logger = get_logger()
+    categories = get_policy(role)
+    patterns = blocked_url_patterns(categories, extra_patterns)
+    driver.blocked_url_patterns = patterns
+    if not patterns:
+        return patterns
+    try:
+        _set_blocked_urls(driver, patterns)
+        logger.info(f"Blocking {', '.join(categories) or 'custom'} requests for {role} driver ({len(patterns)} URL patterns)")
+    except Exception as e:
+        # Not fatal: the driver still works, it just downloads everything
+        logger.warning(f"Could not apply resource policy for {role} driver: {e}")
+    return patterns
+
+
+@contextmanager
+def resource_policy_suspended(driver):
+    """Temporarily load everything, e.g. while a person logs in and solves a CAPTCHA"""
+    patterns = getattr(driver, 'blocked_url_patterns', None)
+    if patterns:
+        _set_blocked_urls(driver, [])
+    try:
+        yield
+    finally:
+        if patterns:
+            _set_blocked_urls(driver, patterns)
+
@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QLabel, QLineEdit, QPushButton, QTextEdit,
     QProgressBar, QFileDialog, QMessageBox, QGroupBox, QFrame,
-    QSpinBox, QDoubleSpinBox, QCheckBox, QScrollArea, QSizePolicy
+    QSpinBox, QDoubleSpinBox, QCheckBox, QComboBox, QScrollArea, QSizePolicy
 )
 from PySide6.QtCore import Qt, QThread, Signal, QTimer
 from PySide6.QtGui import QFont, QTextCursor
@@ -20,6 +20,11 @@ import pandas as pd
 
 # Import the main processing functions
 from app.main import process_contacts_batch
+from app.rate_limiter import configured_rate_limit, format_rate_limits
+from app.metrics import format_metrics
+from app.journal import journal_path_for
+from app.checkpoint import write_csv_atomic
+from app.find_profile_urls.serp_evidence import SNIPPET_TRUST_LEVELS, get_snippet_trust
 from app.logger import get_logger
 
 
@@ -30,6 +35,7 @@ class MessageProcessor(QThread):
     log_signal = Signal(str)
     success_signal = Signal(str)
     error_signal = Signal(str)
+    status_signal = Signal(object)
     finished_signal = Signal()
 
     def __init__(self, message_queue):
@@ -49,6 +55,8 @@ class MessageProcessor(QThread):
                     self.success_signal.emit(data)
                 elif message_type == "error":
                     self.error_signal.emit(data)
+                elif message_type == "status":
+                    self.status_signal.emit(data)
                 elif message_type == "finished":
                     self.finished_signal.emit()
 
@@ -93,6 +101,7 @@ class LinkedInScraperGUI(QMainWindow):
         self.message_processor.log_signal.connect(self.append_log)
         self.message_processor.success_signal.connect(self.show_success)
         self.message_processor.error_signal.connect(self.show_error)
+        self.message_processor.status_signal.connect(self.show_status)
         self.message_processor.finished_signal.connect(self.finish_processing)
         self.message_processor.start()
 
@@ -207,10 +216,10 @@ class LinkedInScraperGUI(QMainWindow):
         # Delay
         delay_label = QLabel("Delay (seconds):")
         self.delay_spin = QSpinBox()
-        self.delay_spin.setMinimum(1)
+        self.delay_spin.setMinimum(0)
         self.delay_spin.setMaximum(300)
-        self.delay_spin.setValue(5)
-        delay_help = QLabel("(between batches)")
+        self.delay_spin.setValue(0)
+        delay_help = QLabel("(optional extra pause between batches)")
         advanced_layout.addWidget(delay_label, 3, 0)
         advanced_layout.addWidget(self.delay_spin, 3, 1)
         advanced_layout.addWidget(delay_help, 3, 2)
@@ -270,6 +279,66 @@ class LinkedInScraperGUI(QMainWindow):
         self.keep_linkedin_open_checkbox.setToolTip("Keep LinkedIn browser window visible (even if already logged in)")
         advanced_layout.addWidget(self.keep_linkedin_open_checkbox, 9, 0, 1, 3)
 
+        # Parallel Workers
+        workers_label = QLabel("Parallel Workers:")
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setMinimum(1)
+        self.workers_spin.setMaximum(8)
+        self.workers_spin.setValue(1)
+        workers_help = QLabel("(browser sessions sharing saved cookies)")
+        advanced_layout.addWidget(workers_label, 10, 0)
+        advanced_layout.addWidget(self.workers_spin, 10, 1)
+        advanced_layout.addWidget(workers_help, 10, 2)
+
+        # Search Ahead (pipeline depth)
+        pipeline_depth_label = QLabel("Search Ahead (contacts):")
+        self.pipeline_depth_spin = QSpinBox()
+        self.pipeline_depth_spin.setMinimum(0)
+        self.pipeline_depth_spin.setMaximum(10)
+        self.pipeline_depth_spin.setValue(2)
+        pipeline_depth_help = QLabel("(Bing searches queued ahead of LinkedIn checks, 0 = off)")
+        advanced_layout.addWidget(pipeline_depth_label, 11, 0)
+        advanced_layout.addWidget(self.pipeline_depth_spin, 11, 1)
+        advanced_layout.addWidget(pipeline_depth_help, 11, 2)
+
+        # Refresh Cached Profiles
+        self.refresh_profiles_checkbox = QCheckBox("Refresh Cached Profiles")
+        self.refresh_profiles_checkbox.setToolTip("Reload every candidate profile from LinkedIn instead of using cached positions")
+        advanced_layout.addWidget(self.refresh_profiles_checkbox, 12, 0, 1, 3)
+
+        # Search Brave alongside Bing
+        self.speculative_brave_checkbox = QCheckBox("Search Brave Alongside Bing")
+        self.speculative_brave_checkbox.setToolTip("Query the Brave API at the same time as Bing instead of only after Bing fails (uses more Brave API quota)")
+        advanced_layout.addWidget(self.speculative_brave_checkbox, 13, 0, 1, 3)
+
+        # LinkedIn rate limit
+        linkedin_rpm_label = QLabel("LinkedIn Profiles/Minute:")
+        # Starts at RATE_LIMIT_LINKEDIN_RPM (or the default budget)
+        self.linkedin_rpm_default, _ = configured_rate_limit('linkedin')
+        self.linkedin_rpm_spin = QSpinBox()
+        self.linkedin_rpm_spin.setMinimum(1)
+        self.linkedin_rpm_spin.setMaximum(max(120, round(self.linkedin_rpm_default)))
+        self.linkedin_rpm_spin.setValue(round(self.linkedin_rpm_default))
+        linkedin_rpm_help = QLabel("(shared by all workers)")
+        advanced_layout.addWidget(linkedin_rpm_label, 14, 0)
+        advanced_layout.addWidget(self.linkedin_rpm_spin, 14, 1)
+        advanced_layout.addWidget(linkedin_rpm_help, 14, 2)
+
+        # Trust search snippets
+        snippet_trust_label = QLabel("Trust Search Snippets:")
+        self.snippet_trust_combo = QComboBox()
+        self.snippet_trust_combo.addItems(list(SNIPPET_TRUST_LEVELS))
+        self.snippet_trust_combo.setCurrentText(get_snippet_trust())
+        self.snippet_trust_combo.setToolTip(
+            "off: open candidates in search order\n"
+            "order: open candidates whose search snippet names the company first\n"
+            "accept: also accept a snippet naming the company as current employer without opening the profile"
+        )
+        snippet_trust_help = QLabel("(use search snippets to skip profile visits)")
+        advanced_layout.addWidget(snippet_trust_label, 15, 0)
+        advanced_layout.addWidget(self.snippet_trust_combo, 15, 1)
+        advanced_layout.addWidget(snippet_trust_help, 15, 2)
+
         # Advanced toggle button
         self.advanced_toggle_btn = QPushButton("Show Advanced Options")
         self.advanced_toggle_btn.clicked.connect(self.toggle_advanced)
@@ -300,6 +369,16 @@ class LinkedInScraperGUI(QMainWindow):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         progress_layout.addWidget(self.progress_bar)
 
+        # Live request rates (cut automatically when a service starts blocking)
+        self.rate_status_label = QLabel("")
+        self.rate_status_label.setWordWrap(True)
+        progress_layout.addWidget(self.rate_status_label)
+
+        # Live throughput and the slowest stages
+        self.metrics_status_label = QLabel("")
+        self.metrics_status_label.setWordWrap(True)
+        progress_layout.addWidget(self.metrics_status_label)
+
         self.progress_text = QTextEdit()
         self.progress_text.setMaximumHeight(150)
         self.progress_text.setReadOnly(True)
@@ -672,6 +751,8 @@ class LinkedInScraperGUI(QMainWindow):
         # Show progress frame
         self.progress_group.show()
         self.progress_bar.setRange(0, 0)  # Start indeterminate progress
+        self.rate_status_label.setText("")
+        self.metrics_status_label.setText("")
 
         # Start processing in separate thread
         self.processing_thread = threading.Thread(target=self.process_contacts)
@@ -726,6 +807,12 @@ class LinkedInScraperGUI(QMainWindow):
             self.thread_safe_log(f"  LinkedIn Timeout: {self.linkedin_timeout_spin.value()} seconds")
             self.thread_safe_log(f"  LinkedIn Match Threshold: {self.linkedin_threshold_spin.value()}%")
             self.thread_safe_log(f"  Keep LinkedIn Browser Open: {self.keep_linkedin_open_checkbox.isChecked()}")
+            self.thread_safe_log(f"  Parallel Workers: {self.workers_spin.value()}")
+            self.thread_safe_log(f"  Search Ahead: {self.pipeline_depth_spin.value()} contacts")
+            self.thread_safe_log(f"  Refresh Cached Profiles: {self.refresh_profiles_checkbox.isChecked()}")
+            self.thread_safe_log(f"  Search Brave Alongside Bing: {self.speculative_brave_checkbox.isChecked()}")
+            self.thread_safe_log(f"  LinkedIn Profiles/Minute: {self.linkedin_rpm_spin.value()}")
+            self.thread_safe_log(f"  Trust Search Snippets: {self.snippet_trust_combo.currentText()}")
 
             self.thread_safe_log(f"Processing {len(working_df)} contacts")
             self.logger.info(f"Processing {len(working_df)} contacts")
@@ -736,18 +823,26 @@ class LinkedInScraperGUI(QMainWindow):
             self.thread_safe_log("=" * 50)
             self.logger.info("=" * 50)
 
-            # Define save callback
+            # Define save callback, called at each checkpoint and when the run ends
+            # (raises on failure so the results journal is kept)
             def save_progress(df):
                 try:
-                    df.to_csv(output_file, index=False, encoding='utf-8')
+                    write_csv_atomic(df, output_file)
                     self.thread_safe_log(f"Progress saved to: {output_file}")
                     self.logger.info(f"Progress saved to: {output_file}")
                 except Exception as e:
                     self.thread_safe_log(f"Error saving progress: {e}")
                     self.logger.error(f"Error saving progress: {e}")
+                    raise
+
+            # Only a rate changed here overrides RATE_LIMIT_LINKEDIN_RPM; an unchanged box
+            # keeps the configured rate (and undoes an override from an earlier run)
+            linkedin_rpm = self.linkedin_rpm_spin.value()
+            if linkedin_rpm == round(self.linkedin_rpm_default):
+                linkedin_rpm = self.linkedin_rpm_default
 
             # Call the processing function with callbacks
-            processed_df = process_contacts_batch(
+            process_contacts_batch(
                 working_df,
                 batch_size=self.batch_size_spin.value(),
                 delay_between_batches=self.delay_spin.value(),
@@ -759,16 +854,17 @@ class LinkedInScraperGUI(QMainWindow):
                 search_threshold=self.search_threshold_spin.value(),
                 linkedin_timeout=self.linkedin_timeout_spin.value(),
                 linkedin_threshold=self.linkedin_threshold_spin.value(),
-                keep_linkedin_open=self.keep_linkedin_open_checkbox.isChecked()
+                keep_linkedin_open=self.keep_linkedin_open_checkbox.isChecked(),
+                num_workers=self.workers_spin.value(),
+                pipeline_depth=self.pipeline_depth_spin.value(),
+                refresh_profiles=self.refresh_profiles_checkbox.isChecked(),
+                speculative_brave=self.speculative_brave_checkbox.isChecked(),
+                snippet_trust=self.snippet_trust_combo.currentText(),
+                rate_limits={'linkedin': linkedin_rpm},
+                status_callback=self.thread_safe_status,
+                journal_path=journal_path_for(output_file)
             )
 
-            # Save the final results
-            try:
-                processed_df.to_csv(output_file, index=False, encoding='utf-8')
-            except Exception as e:
-                self.thread_safe_log(f"Error saving final results: {e}")
-                self.logger.error(f"Error saving final results: {e}")
-
             self.thread_safe_log("=" * 50)
             self.logger.info("=" * 50)
             self.thread_safe_log(f"Processing completed!")
@@ -813,6 +909,13 @@ class LinkedInScraperGUI(QMainWindow):
         except Exception as e:
             self.logger.error(f"Error queuing error message: {e}")
 
+    def thread_safe_status(self, status):
+        """Thread-safe live status update"""
+        try:
+            self.message_queue.put(("status", status))
+        except Exception as e:
+            self.logger.error(f"Error queuing status message: {e}")
+
     def thread_safe_finish(self):
         """Thread-safe finish signal"""
         try:
@@ -828,6 +931,13 @@ class LinkedInScraperGUI(QMainWindow):
         cursor.movePosition(QTextCursor.End)
         self.progress_text.setTextCursor(cursor)
 
+    def show_status(self, status):
+        """Show live run status (called from main thread)"""
+        if 'rate_limits' in status:
+            self.rate_status_label.setText(f"Request rates: {format_rate_limits(status['rate_limits'])}")
+        if 'metrics' in status:
+            self.metrics_status_label.setText(f"Throughput: {format_metrics(status['metrics'], limit=3)}")
+
     def show_success(self, message):
         """Show success message (called from main thread)"""
         QMessageBox.information(self, "Success", message)
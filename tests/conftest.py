@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+# Run from anywhere: the app package lives in the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.cache import PersistentCache
+
+
+@pytest.fixture
+def tmp_cache(tmp_path):
+    """A one-hour PersistentCache in a temporary directory"""
+    cache = PersistentCache('test', ttl_seconds=3600, path=str(tmp_path / "test.sqlite3"))
+    yield cache
+    cache.close()
@@ -0,0 +1,42 @@
+import pytest
+
+from app.find_profile_urls import bing_search
+from app.find_profile_urls.bing_search import BingSearch
+
+REDIRECT = "https://www.bing.com/ck/a?!&&p=3f1c0e9b&u=a1unresolvable"
+RESULTS = [
+    {'title': "Jane Doe - Engineer - Acme | LinkedIn", 'url': REDIRECT, 'snippet': ""},
+    {'title': "Jane Doe - Engineer - Acme | LinkedIn", 'url': "https://www.linkedin.com/in/jane-doe", 'snippet': ""},
+]
+
+
+@pytest.fixture
+def bing(tmp_cache, monkeypatch):
+    monkeypatch.setattr(bing_search, 'get_search_cache', lambda: tmp_cache)
+    bing = BingSearch(backend='http')
+    bing.result_items = RESULTS
+    monkeypatch.setattr(bing, '_fetch_serp_http', lambda url: bing.result_items)
+    return bing
+
+
+def test_results_with_an_unresolved_redirect_are_not_cached(bing, tmp_cache, monkeypatch):
+    monkeypatch.setattr(bing, 'extract_real_url_from_bing_redirect', lambda url: "")
+    results = bing.search_validated("Jane Doe", "Acme")
+    assert [url for url, *_ in results] == ["https://www.linkedin.com/in/jane-doe"]
+    bing.search_validated("Jane Doe", "Acme")
+    assert tmp_cache.stats()['hits'] == 0
+
+
+def test_empty_results_are_not_cached(bing, tmp_cache):
+    bing.result_items = []
+    assert bing.search_validated("Jane Doe", "Acme") == []
+    bing.search_validated("Jane Doe", "Acme")
+    assert tmp_cache.stats()['hits'] == 0
+
+
+def test_complete_results_are_cached(bing, tmp_cache, monkeypatch):
+    monkeypatch.setattr(bing, 'extract_real_url_from_bing_redirect', lambda url: "https://www.linkedin.com/in/jane-doe-2")
+    results = bing.search_validated("Jane Doe", "Acme")
+    assert len(results) == 2
+    assert bing.search_validated("Jane Doe", "Acme") == results
+    assert tmp_cache.stats()['hits'] == 1
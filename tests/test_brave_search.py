@@ -0,0 +1,189 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from app import rate_limiter
+from app.block_detection import BlockedError
+from app.find_profile_urls import brave_search
+from app.find_profile_urls.brave_search import BraveClient, BraveSearch, brave_search_many, parse_rate_limit_headers
+
+QUOTA_HEADERS = {
+    "X-RateLimit-Limit": "20, 15000",
+    "X-RateLimit-Policy": "20;w=1, 15000;w=2592000",
+    "X-RateLimit-Remaining": "19, 14000",
+    "X-RateLimit-Reset": "1, 1419704",
+}
+
+
+class StandInAPI:
+    """A local stand-in for the Brave API; the query decides how it answers"""
+
+    def __init__(self):
+        self.attempts = {}
+        self.quota_headers = dict(QUOTA_HEADERS)
+        self._lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)["q"][0]
+                with api._lock:
+                    api.attempts[query] = api.attempts.get(query, 0) + 1
+                    attempt = api.attempts[query]
+                if query == "slow" and attempt == 1:
+                    time.sleep(1.5)
+                if query == "throttled" and attempt == 1:
+                    self.reply(429, {}, {"Retry-After": "0"})
+                elif query.startswith("always-throttled"):
+                    self.reply(429, {}, {"Retry-After": "0"})
+                elif query == "flaky" and attempt <= 2:
+                    self.reply(503, {})
+                elif query == "broken":
+                    self.reply(500, {})
+                else:
+                    self.reply(200, {
+                        "query": {"original": query},
+                        "web": {"results": [{
+                            "title": "Jane Doe - Engineer - Acme | LinkedIn",
+                            "url": f"https://www.linkedin.com/in/{query}",
+                            "description": "Engineer at <strong>Acme</strong>",
+                            "profile": {"name": "LinkedIn", "url": f"https://www.linkedin.com/in/{query}"},
+                        }]}
+                    })
+
+            def reply(self, status, payload, headers=None):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in {**api.quota_headers, **(headers or {})}.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except BrokenPipeError:
+                    pass  # the client timed out first
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/search"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def api(monkeypatch):
+    # A fresh, fast Brave rate limiter and short backoffs for every test
+    monkeypatch.setitem(rate_limiter._rate_limiters, 'brave', rate_limiter.TokenBucket('brave', 6000, 10))
+    monkeypatch.setattr(brave_search, 'BACKOFF_BASE_SECONDS', 0.01)
+    stand_in = StandInAPI()
+    yield stand_in
+    stand_in.server.shutdown()
+    stand_in.server.server_close()
+
+
+@pytest.fixture
+def client(api, monkeypatch):
+    client = BraveClient(api_key="test", base_url=api.url, read_timeout=1, max_retries=2, max_concurrency=4)
+    monkeypatch.setattr(brave_search, '_brave_client', client)
+    return client
+
+
+def test_parse_rate_limit_headers():
+    assert parse_rate_limit_headers(QUOTA_HEADERS) == [
+        {'limit': 20, 'remaining': 19, 'reset': 1, 'window': 1},
+        {'limit': 15000, 'remaining': 14000, 'reset': 1419704, 'window': 2592000},
+    ]
+    assert parse_rate_limit_headers({}) == []
+
+
+def test_quota_headers_are_tracked_and_lower_the_rate_limit(client):
+    assert client.search({"q": "jane-doe"})["query"]["original"] == "jane-doe"
+    assert client.quota_stats()[1] == {'limit': 15000, 'remaining': 14000, 'reset': 1419704, 'window': 2592000}
+    # Lowered to the plan's 20 queries/second
+    assert rate_limiter.get_rate_limiter('brave').max_requests_per_minute == 1200
+
+
+def test_exhausted_quota_fails_fast(api, client):
+    api.quota_headers["X-RateLimit-Remaining"] = "19, 0"
+    client.search({"q": "last-query"})
+    with pytest.raises(BlockedError, match="quota exhausted"):
+        client.search({"q": "next-query"})
+    assert "next-query" not in api.attempts
+
+
+def test_429_and_5xx_are_retried(api, client):
+    assert client.search({"q": "throttled"})
+    assert api.attempts["throttled"] == 2
+    assert client.search({"q": "flaky"})
+    assert api.attempts["flaky"] == 3
+
+
+def test_read_timeout_is_retried(api, client):
+    assert client.search({"q": "slow"})
+    assert api.attempts["slow"] == 2
+
+
+def test_http_error_raised_after_retries(api, client):
+    with pytest.raises(requests.HTTPError):
+        client.search({"q": "broken"})
+    assert api.attempts["broken"] == 3
+
+
+def test_persistent_429_raises_blocked_error(api, client):
+    with pytest.raises(BlockedError):
+        client.search({"q": "always-throttled"})
+    assert api.attempts["always-throttled"] == 3
+
+
+def test_run_brave_search_propagates_blocked_error(client, tmp_cache, monkeypatch):
+    monkeypatch.setattr(brave_search, 'get_search_cache', lambda: tmp_cache)
+    original_search = client.search
+    monkeypatch.setattr(client, 'search', lambda params: original_search({**params, "q": "always-throttled"}))
+    with pytest.raises(BlockedError):
+        BraveSearch().run_brave_search("Jane Doe", "Acme")
+
+
+def test_run_brave_search_validates_and_caches(client, tmp_cache, monkeypatch):
+    monkeypatch.setattr(brave_search, 'get_search_cache', lambda: tmp_cache)
+    results = BraveSearch().run_brave_search("Jane Doe", "Acme")
+    assert [(title, description) for _, title, _, description in results] == [("Jane Doe - Engineer - Acme", "Engineer at Acme")]
+    assert BraveSearch().run_brave_search("Jane Doe", "Acme") == results
+    assert tmp_cache.stats()['hits'] == 1
+
+
+def test_search_many_keeps_order_and_isolates_failures(client):
+    queries = [f"person-{i}" for i in range(12)] + ["broken"]
+    batch = brave_search_many(queries)
+    assert [results[0]["url"] for results in batch[:-1]] == [f"https://www.linkedin.com/in/{q}" for q in queries[:-1]]
+    assert batch[-1] == []
+
+
+def test_empty_results_are_not_cached(api, client, tmp_cache, monkeypatch):
+    monkeypatch.setattr(brave_search, 'get_search_cache', lambda: tmp_cache)
+    original_search = client.search
+    monkeypatch.setattr(client, 'search', lambda params: {**original_search(params), "web": {"results": []}})
+    assert BraveSearch().run_brave_search("Jane Doe", "Acme") == []
+    assert BraveSearch().run_brave_search("Jane Doe", "Acme") == []
+    assert tmp_cache.stats()['hits'] == 0
+    assert sum(api.attempts.values()) == 2
+
+
+def test_quota_without_policy_header_goes_by_position(api, client):
+    del api.quota_headers["X-RateLimit-Policy"]
+    # The per-second window is used up: that is the rate limiter's business, not a block
+    api.quota_headers["X-RateLimit-Remaining"] = "0, 14000"
+    client.search({"q": "first-query"})
+    assert client.search({"q": "next-query"})
+    assert rate_limiter.get_rate_limiter('brave').max_requests_per_minute == 1200
+
+    api.quota_headers["X-RateLimit-Remaining"] = "19, 0"
+    client.search({"q": "last-query"})
+    with pytest.raises(BlockedError, match="quota exhausted"):
+        client.search({"q": "blocked-query"})
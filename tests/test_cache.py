@@ -0,0 +1,46 @@
+import time
+
+from app.cache import PersistentCache
+
+
+def test_fresh_entry_is_served(tmp_cache):
+    tmp_cache.set("key", ["a", 1])
+    assert tmp_cache.get("key") == ["a", 1]
+    assert tmp_cache.contains("key")
+    assert tmp_cache.stats()['hits'] == 1
+
+
+def test_expired_entry_is_a_miss(tmp_cache, monkeypatch):
+    tmp_cache.set("key", "value")
+    later = time.time() + tmp_cache.ttl_seconds + 1
+    monkeypatch.setattr(time, 'time', lambda: later)
+    assert tmp_cache.get("key", "default") == "default"
+    assert not tmp_cache.contains("key")
+    assert tmp_cache.stats()['misses'] == 1
+
+
+def test_entries_survive_a_restart(tmp_cache):
+    tmp_cache.set("key", {"positions": 2})
+    reopened = PersistentCache('test', ttl_seconds=tmp_cache.ttl_seconds, path=tmp_cache.path)
+    try:
+        assert reopened.get("key") == {"positions": 2}
+    finally:
+        reopened.close()
+
+
+def test_purge_expired(tmp_cache, monkeypatch):
+    tmp_cache.set("old", 1)
+    later = time.time() + tmp_cache.ttl_seconds + 1
+    monkeypatch.setattr(time, 'time', lambda: later)
+    tmp_cache.set("new", 2)
+    assert tmp_cache.purge_expired() == 1
+    assert tmp_cache.get("new") == 2
+
+
+def test_zero_ttl_disables_the_cache(tmp_path):
+    cache = PersistentCache('disabled', ttl_seconds=0, path=str(tmp_path / "disabled.sqlite3"))
+    try:
+        cache.set("key", "value")
+        assert cache.get("key") is None
+    finally:
+        cache.close()
@@ -0,0 +1,134 @@
+import os
+import stat
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from app.checkpoint import Checkpointer, write_csv_atomic
+
+
+def temp_files(directory):
+    return [name for name in os.listdir(directory) if name.endswith('.tmp')]
+
+
+def contacts(count):
+    return pd.DataFrame({'Name': [f"Contact {i}" for i in range(count)], 'Valid': pd.Series([None] * count, dtype=object)})
+
+
+class RecordingSave:
+    """A save callback that records how many results each write held"""
+
+    def __init__(self, path, delay=0.0):
+        self.path = path
+        self.delay = delay
+        self.writes = []
+
+    def __call__(self, df):
+        time.sleep(self.delay)
+        write_csv_atomic(df, self.path)
+        self.writes.append(int(df['Valid'].notna().sum()))
+
+
+def finish_contacts(checkpointer, df, count, start=0, pause=0.0):
+    for i in range(start, start + count):
+        with checkpointer.df_lock:
+            df.at[i, 'Valid'] = True
+        checkpointer.contact_done()
+        time.sleep(pause)
+
+
+def test_write_replaces_the_file(tmp_path):
+    path = tmp_path / "contacts.csv"
+    write_csv_atomic(pd.DataFrame({'Name': ["old"]}), path)
+    os.chmod(path, 0o644)
+    write_csv_atomic(pd.DataFrame({'Name': ["new", "rows"]}), path)
+    assert list(pd.read_csv(path)['Name']) == ["new", "rows"]
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert not temp_files(tmp_path)
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / "contacts.csv"
+    write_csv_atomic(pd.DataFrame({'Name': ["old"]}), path)
+
+    class FailingFrame:
+        def to_csv(self, f, index=False):
+            f.write("Name\nhalf a fi")
+            raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        write_csv_atomic(FailingFrame(), path)
+    assert list(pd.read_csv(path)['Name']) == ["old"]
+    assert not temp_files(tmp_path)
+
+
+def test_checkpoints_requested_during_a_write_are_coalesced(tmp_path):
+    df = contacts(100)
+    save = RecordingSave(tmp_path / "contacts.csv", delay=0.2)
+    checkpointer = Checkpointer(df, threading.Lock(), save, every_contacts=5, every_seconds=0, on_stop=True)
+    # 20 triggers fire during 0.5s of contacts, but each write takes 0.2s
+    finish_contacts(checkpointer, df, 100, pause=0.005)
+    checkpointer.finish()
+    assert len(save.writes) < 20
+    assert checkpointer.coalesced > 0
+    assert save.writes[-1] == 100 and save.writes.count(100) == 1
+    assert pd.read_csv(save.path)['Valid'].all()
+    assert not temp_files(tmp_path)
+
+
+def test_every_contacts_trigger(tmp_path):
+    df = contacts(10)
+    save = RecordingSave(tmp_path / "contacts.csv")
+    checkpointer = Checkpointer(df, threading.Lock(), save, every_contacts=3, every_seconds=0, on_stop=False)
+    finish_contacts(checkpointer, df, 2)
+    time.sleep(0.1)
+    assert checkpointer.writes == 0
+    finish_contacts(checkpointer, df, 1, start=2)
+    checkpointer.close()
+    assert save.writes == [3]
+
+
+def test_every_seconds_trigger(tmp_path):
+    df = contacts(10)
+    save = RecordingSave(tmp_path / "contacts.csv")
+    checkpointer = Checkpointer(df, threading.Lock(), save, every_contacts=0, every_seconds=0.1, on_stop=False)
+    finish_contacts(checkpointer, df, 2)
+    checkpointer.tick()
+    assert checkpointer.writes == 0
+    time.sleep(0.15)
+    checkpointer.tick()
+    checkpointer.close()
+    assert save.writes == [2]
+
+    # Nothing new finished: the timer alone does not write
+    checkpointer = Checkpointer(df, threading.Lock(), save, every_contacts=0, every_seconds=0.1, on_stop=False)
+    time.sleep(0.15)
+    checkpointer.tick()
+    checkpointer.close()
+    assert save.writes == [2]
+
+
+def test_close_flushes_a_queued_checkpoint(tmp_path):
+    df = contacts(10)
+    save = RecordingSave(tmp_path / "contacts.csv", delay=0.2)
+    checkpointer = Checkpointer(df, threading.Lock(), save, every_contacts=0, every_seconds=0, on_stop=True)
+    finish_contacts(checkpointer, df, 4)
+    checkpointer.stop_requested()
+    checkpointer.close()
+    assert save.writes == [4]
+    # The checkpoint already holds every result, so finish() does not write them again
+    checkpointer.finish()
+    assert save.writes == [4]
+
+
+def test_finish_writes_results_since_the_last_checkpoint(tmp_path):
+    df = contacts(10)
+    save = RecordingSave(tmp_path / "contacts.csv")
+    checkpointer = Checkpointer(df, threading.Lock(), save, every_contacts=0, every_seconds=0, on_stop=False)
+    finish_contacts(checkpointer, df, 3)
+    checkpointer.write()
+    finish_contacts(checkpointer, df, 1, start=3)
+    checkpointer.finish()
+    assert save.writes == [3, 4]
@@ -0,0 +1,112 @@
+import io
+
+import pandas as pd
+import pytest
+
+from app import journal as journal_module
+from app.journal import ResultsJournal, journal_path_for, materialize
+
+CSV = """First Name,Last Name,Account Name,Valid,Note
+Jane,Doe,Acme,,
+John,Roe,Initech,,
+Jim,Poe,Globex,,
+"""
+
+
+def contacts():
+    contacts_df = pd.read_csv(io.StringIO(CSV))
+    for column in ('Valid', 'Note'):
+        contacts_df[column] = contacts_df[column].astype('object')
+    return contacts_df
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = ResultsJournal(str(tmp_path / "contacts.csv.journal.jsonl"))
+    yield journal
+    journal.close()
+
+
+def test_replay_applies_results(journal):
+    journal.append(0, "Jane Doe", "Acme", {'Valid': False, 'Note': "Historical match found"}, 1.5)
+    journal.append(0, "Jane Doe", "Acme", {'Valid': True, 'Note': '', 'Profile URL': "https://www.linkedin.com/in/jane-doe"})
+    journal.append(2, "Jim Poe", "Globex", {'Valid': False}, 0.8)
+    contacts_df = contacts()
+    assert journal.replay(contacts_df) == (3, 0)
+    # Later records win, and a column the CSV does not have yet is added
+    assert contacts_df.at[0, 'Valid'] is True
+    assert contacts_df.at[0, 'Profile URL'] == "https://www.linkedin.com/in/jane-doe"
+    assert contacts_df.at[2, 'Valid'] is False
+    assert pd.isna(contacts_df.at[1, 'Valid'])
+
+
+def test_records_of_other_contacts_are_not_applied(journal):
+    journal.append(1, "John Roe", "Acme", {'Valid': True})         # same row, other company
+    journal.append(2, "Jane Doe", "Globex", {'Valid': True})       # same row, other name
+    journal.append(7, "Jane Doe", "Acme", {'Valid': True})         # no such row
+    journal.append(0, "Jane Doe", "Acme", {'Valid': True})
+    contacts_df = contacts()
+    assert journal.replay(contacts_df) == (1, 3)
+    assert list(contacts_df['Valid'].map(repr)) == ["True", "nan", "nan"]
+
+
+def test_truncated_last_line_is_skipped(journal):
+    journal.append(0, "Jane Doe", "Acme", {'Valid': True})
+    journal.append(1, "John Roe", "Initech", {'Valid': False})
+    journal.close()
+    with open(journal.path, 'rb+') as f:
+        f.truncate(len(f.read()) - 10)
+    assert [record['name'] for record in journal.records()] == ["Jane Doe"]
+    contacts_df = contacts()
+    assert journal.replay(contacts_df) == (1, 0)
+    assert pd.isna(contacts_df.at[1, 'Valid'])
+
+
+def test_clear_deletes_the_journal(journal):
+    journal.append(0, "Jane Doe", "Acme", {'Valid': True})
+    journal.clear()
+    assert list(journal.records()) == []
+    # The next append starts a new journal
+    journal.append(1, "John Roe", "Initech", {'Valid': False})
+    assert [record['key'] for record in journal.records()] == [1]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "contacts.csv"
+    path.write_text(CSV, encoding='utf-8')
+    return str(path)
+
+
+def test_materialize_saves_then_clears(csv_path):
+    journal = ResultsJournal(journal_path_for(csv_path))
+    journal.append(1, "John Roe", "Initech", {'Valid': True, 'Note': ''})
+    journal.close()
+    assert materialize(csv_path) == 1
+    assert list(pd.read_csv(csv_path)['Valid'].map(repr)) == ["nan", "True", "nan"]
+    assert list(journal.records()) == []
+
+
+def test_materialize_keeps_the_journal_for_unmatched_records(csv_path):
+    journal = ResultsJournal(journal_path_for(csv_path))
+    journal.append(1, "John Roe", "Initech", {'Valid': True})
+    journal.append(5, "Ann Other", "Acme", {'Valid': False})
+    journal.close()
+    assert materialize(csv_path) == 1
+    assert pd.read_csv(csv_path).at[1, 'Valid'] == True  # noqa: E712
+    assert [record['key'] for record in journal.records()] == [1, 5]
+
+
+def test_journal_is_kept_when_the_save_fails(csv_path, monkeypatch):
+    journal = ResultsJournal(journal_path_for(csv_path))
+    journal.append(1, "John Roe", "Initech", {'Valid': True})
+    journal.close()
+
+    def failing_write(df, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(journal_module, 'write_csv_atomic', failing_write)
+    with pytest.raises(OSError):
+        materialize(csv_path)
+    assert pd.read_csv(csv_path)['Valid'].isna().all()
+    assert [record['key'] for record in journal.records()] == [1]
@@ -0,0 +1,33 @@
+import io
+
+import pandas as pd
+
+from app.main import pending_contact_rows
+
+CSV = """First Name,Last Name,Account Name,Valid,Note
+Jane,Doe,Acme,True,
+John,Doe,Acme,,Profile not found
+Jim,Doe,Acme,False,No company match found in any profile
+Jake,Doe,Acme,,
+"""
+
+
+def test_pending_rows_of_a_csv():
+    contacts_df = pd.read_csv(io.StringIO(CSV))
+    assert list(pending_contact_rows(contacts_df)) == [3]
+
+
+def test_nothing_done_yet():
+    contacts_df = pd.read_csv(io.StringIO(CSV.replace("True", "").replace("False", "").replace("Profile not found", "")))
+    assert list(pending_contact_rows(contacts_df)) == [0, 1, 2, 3]
+
+
+def test_all_bool_column():
+    contacts_df = pd.DataFrame({'Valid': [True, False], 'Note': ["", ""]})
+    assert list(pending_contact_rows(contacts_df)) == []
+
+
+def test_numbers_in_an_object_column_are_not_results():
+    # True == 1, so a stray 1/0 must not be mistaken for a result
+    contacts_df = pd.DataFrame({'Valid': pd.Series([True, 1, 0, 1.0, "True", None, False], dtype=object)})
+    assert list(pending_contact_rows(contacts_df)) == [1, 2, 3, 4, 5]
@@ -0,0 +1,54 @@
+import pytest
+
+from app.profile_url import canonical_profile_url, decode_bing_redirect, profile_key
+
+CK = "https://www.bing.com/ck/a?!&&p=3f1c0e9b&ptn=3&ver=2&hsh=4&fclid=1e2d&u="
+JANE = "https://www.linkedin.com/in/jane-doe-1a2b3c"
+ANA = "https://www.linkedin.com/in/ana-p?trk=abc>"
+JURGEN = "https://uk.linkedin.com/in/j%C3%BCrgen-m%C3%BCller-9a"
+
+# The Bing redirect formats seen in results pages: (redirect URL, expected target)
+REDIRECTS = [
+    # a1 prefix, padded and unpadded
+    (CK + "a1aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2phbmUtZG9lLTFhMmIzYw==&ntb=1", JANE),
+    (CK + "a1aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2phbmUtZG9lLTFhMmIzYw&ntb=1", JANE),
+    # padding percent-encoded once and twice
+    (CK + "a1aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2phbmUtZG9lLTFhMmIzYw%3D%3D&ntb=1", JANE),
+    (CK + "a1aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2phbmUtZG9lLTFhMmIzYw%253D%253D&ntb=1", JANE),
+    # URL-safe alphabet, standard alphabet with '+' escaped, and with '+' left bare (read back as a space)
+    (CK + "a1aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2FuYS1wP3Ryaz1hYmM-&ntb=1", ANA),
+    (CK + "a1aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2FuYS1wP3Ryaz1hYmM%2B&ntb=1", ANA),
+    (CK + "a1aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2FuYS1wP3Ryaz1hYmM+&ntb=1", ANA),
+    # base64 without the a1 prefix
+    (CK + "aHR0cHM6Ly93d3cubGlua2VkaW4uY29tL2luL2phbmUtZG9lLTFhMmIzYw&ntb=1", JANE),
+    # The target's own percent-encoding survives
+    (CK + "a1aHR0cHM6Ly91ay5saW5rZWRpbi5jb20vaW4vaiVDMyVCQ3JnZW4tbSVDMyVCQ2xsZXItOWE&ntb=1", JURGEN),
+    # Plain and nested percent-encoded targets
+    ("https://www.bing.com/ck/a?u=https%3A%2F%2Fwww.linkedin.com%2Fin%2Fjane-doe-1a2b3c", JANE),
+    ("https://www.bing.com/ck/a?u=https%253A%252F%252Fwww.linkedin.com%252Fin%252Fjane-doe-1a2b3c", JANE),
+    ("https://www.bing.com/ck/a?url=https%25253A%25252F%25252Fwww.linkedin.com%25252Fin%25252Fjane-doe-1a2b3c", JANE),
+    # No target parameter
+    ("https://www.bing.com/ck/a?!&&p=3f1c0e9b&ptn=3", None),
+]
+
+UNDECODABLE = [
+    CK + "a1!!not-base64!!",
+    CK + "a1bm90IGEgdXJs",  # base64 for 'not a url'
+    CK + "a1aHR0cHM6Ly9",   # truncated payload
+]
+
+
+@pytest.mark.parametrize("redirect_url, expected", REDIRECTS)
+def test_decode_bing_redirect(redirect_url, expected):
+    assert decode_bing_redirect(redirect_url) == expected
+
+
+@pytest.mark.parametrize("redirect_url", UNDECODABLE)
+def test_undecodable_redirect_raises(redirect_url):
+    with pytest.raises(ValueError):
+        decode_bing_redirect(redirect_url)
+
+
+def test_profile_key_and_canonical_url_of_redirects():
+    assert profile_key(REDIRECTS[0][0]) == "jane-doe-1a2b3c"
+    assert canonical_profile_url(REDIRECTS[8][0]) == "https://www.linkedin.com/in/j%C3%BCrgen-m%C3%BCller-9a/"
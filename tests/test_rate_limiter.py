@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+from app import rate_limiter
+from app.rate_limiter import RateLimitWaitCancelled, TokenBucket, wait_for_rate_limit
+
+
+@pytest.fixture
+def slow_bucket(monkeypatch):
+    # One request a minute with the only token already spent: the next wait is a minute long
+    bucket = TokenBucket('test', 1, 1)
+    bucket.acquire()
+    monkeypatch.setitem(rate_limiter._rate_limiters, 'test', bucket)
+    yield bucket
+    rate_limiter.allow_rate_limit_waits()
+
+
+def test_cancel_ends_a_long_wait(slow_bucket):
+    errors = []
+
+    def wait():
+        try:
+            wait_for_rate_limit('test')
+        except RateLimitWaitCancelled as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait)
+    started = time.monotonic()
+    waiter.start()
+    time.sleep(0.2)
+    rate_limiter.cancel_rate_limit_waits()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
+    assert time.monotonic() - started < 5
+    assert len(errors) == 1
+    assert slow_bucket.acquired == 1
+
+
+def test_no_request_is_made_once_cancelled(slow_bucket):
+    slow_bucket.set_rate(6000, 10)
+    rate_limiter.cancel_rate_limit_waits()
+    with pytest.raises(RateLimitWaitCancelled):
+        wait_for_rate_limit('test')
+    rate_limiter.allow_rate_limit_waits()
+    assert wait_for_rate_limit('test')
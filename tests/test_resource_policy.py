@@ -0,0 +1,134 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.driver_and_login import cleanup_driver, get_driver
+from app.resource_policy import RESOURCE_PATTERNS, blocked_url_patterns, get_policy, url_is_blocked
+
+BLOCKED = {
+    'images': ["https://example.com/photo.jpg", "https://example.com/logo.svg?v=2",
+               "https://media.licdn.com/dms/image/v2/D4E03AQ/profile-displayphoto",
+               "https://www.bing.com/th?id=OIP.abc&w=80"],
+    'media': ["https://example.com/clip.mp4", "https://dms.licdn.com/playlist/vid/abc/mp4-720p"],
+    'fonts': ["https://static.licdn.com/sc/h/font.woff2", "https://example.com/font.ttf?v=1"],
+    'analytics': ["https://www.googletagmanager.com/gtm.js?id=GTM-1", "https://px.ads.linkedin.com/collect",
+                  "https://bat.bing.com/bat.js"],
+}
+
+ALLOWED = [
+    "https://www.linkedin.com/in/jane-doe/",
+    "https://static.licdn.com/sc/h/app.js",
+    "https://www.bing.com/search?q=jane+doe",
+    "https://example.com/apng",  # '?' and '.' match literally
+]
+
+
+def example_urls(pattern):
+    """A URL for each way a pattern can match: its wildcards filled in"""
+    return [pattern.replace("*", filler) for filler in ("", "https://example.com/a/")]
+
+
+@pytest.mark.parametrize("category, pattern", [
+    (category, pattern) for category, patterns in RESOURCE_PATTERNS.items() for pattern in patterns
+])
+def test_every_pattern_blocks_its_urls(category, pattern):
+    patterns = blocked_url_patterns([category])
+    for url in example_urls(pattern):
+        assert url_is_blocked(url, patterns)
+
+
+@pytest.mark.parametrize("category", RESOURCE_PATTERNS)
+def test_category_blocks_its_resources(category):
+    patterns = blocked_url_patterns([category])
+    for url in BLOCKED[category]:
+        assert url_is_blocked(url, patterns), url
+    for other, urls in BLOCKED.items():
+        if other != category:
+            assert not any(url_is_blocked(url, patterns) for url in urls)
+
+
+def test_pages_and_scripts_are_allowed():
+    patterns = blocked_url_patterns(get_policy('linkedin'))
+    for url in ALLOWED:
+        assert not url_is_blocked(url, patterns), url
+
+
+def test_policy_from_env(monkeypatch):
+    monkeypatch.delenv('RESOURCE_BLOCKING_LINKEDIN', raising=False)
+    assert get_policy('linkedin') == ('images', 'media', 'fonts', 'analytics')
+    assert get_policy(None) == ()
+    monkeypatch.setenv('RESOURCE_BLOCKING_LINKEDIN', "Images, fonts")
+    assert get_policy('linkedin') == ('images', 'fonts')
+    monkeypatch.setenv('RESOURCE_BLOCKING_LINKEDIN', "none")
+    assert get_policy('linkedin') == ()
+
+
+def test_unknown_category_is_ignored():
+    assert blocked_url_patterns(['images', 'popups'], ["*ads*"]) == RESOURCE_PATTERNS['images'] + ["*ads*"]
+
+
+PAGE = """<html><head>
+<style>@font-face { font-family: f; src: url(/font.woff2); } body { font-family: f; }</style>
+<script src="/www.googletagmanager.com/gtm.js"></script>
+<script src="/app.js"></script>
+</head><body>text
+<img src="/photo.jpg"><img src="/media.licdn.com/dms/image/v2/abc">
+<video src="/clip.mp4" autoplay muted></video>
+</body></html>"""
+
+RESOURCES = {"/app.js", "/font.woff2", "/www.googletagmanager.com/gtm.js", "/photo.jpg",
+             "/media.licdn.com/dms/image/v2/abc", "/clip.mp4"}
+
+
+@pytest.fixture
+def stand_in_page():
+    """A local page that records every request made for it and its resources"""
+    requested = []
+
+    class RecordingHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            content_type = "text/html" if self.path == "/" else "application/octet-stream"
+            body = PAGE.encode() if self.path == "/" else b"x"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requested
+    server.shutdown()
+    server.server_close()
+
+
+def requests_for_page(role, base_url, requested):
+    requested.clear()
+    try:
+        driver = get_driver(headless=True, role=role)
+    except Exception as e:
+        pytest.skip(f"Chrome/chromedriver not available: {e}")
+    try:
+        driver.get(base_url + "/")
+        time.sleep(1)  # let late requests (fonts, video) arrive at the stand-in
+    finally:
+        cleanup_driver(driver, f"{role} driver")
+    return set(requested) - {"/"}
+
+
+def test_chrome_skips_blocked_requests(stand_in_page, monkeypatch):
+    monkeypatch.delenv('RESOURCE_BLOCKING_LINKEDIN', raising=False)
+    base_url, requested = stand_in_page
+    patterns = blocked_url_patterns(get_policy('linkedin'))
+    expected = {path for path in RESOURCES if not url_is_blocked(base_url + path, patterns)}
+    assert expected == {"/app.js"}
+
+    assert requests_for_page('linkedin', base_url, requested) == expected
+    # Without a role nothing is blocked (the font and video may not be requested by headless Chrome)
+    assert {"/app.js", "/photo.jpg"} <= requests_for_page(None, base_url, requested)
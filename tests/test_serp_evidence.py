@@ -0,0 +1,39 @@
+import pytest
+
+from app.find_profile_urls.serp_evidence import accepts_without_visit, company_phrases, score_snippet_evidence
+
+
+@pytest.mark.parametrize("snippet", [
+    "Former engineer at Acme Corp",
+    "Sales lead · previously at Acme Corp",
+    "Ex-CTO @ Acme Corp",
+    "Was a consultant at Acme Corp until 2020",
+])
+def test_past_employer_is_not_current(snippet):
+    evidence = score_snippet_evidence("Jane Doe - Engineer", snippet, "Acme Corp")
+    assert evidence['is_match'] and not evidence['is_current']
+    assert not accepts_without_visit(evidence, trust='accept')
+
+
+@pytest.mark.parametrize("snippet", [
+    "Engineer at Acme Corp",
+    "Ex-CTO @ Globex. Now at Acme Corp",
+    "Engineer at Acme Corp · Washington",
+])
+def test_current_employer(snippet):
+    evidence = score_snippet_evidence("Jane Doe - Engineer", snippet, "Acme Corp")
+    assert evidence['is_match'] and evidence['is_current']
+    assert accepts_without_visit(evidence, trust='accept')
+
+
+def test_title_company_segment():
+    # 'Name - Headline - Company': the last segment is the current company, the headline is not a company
+    assert company_phrases("Jane Doe - Senior Engineer - Acme Corp", "") == [("Acme Corp", True)]
+    # 'Name - X' may be a headline or a company: evidence for ordering, not current
+    assert company_phrases("Jane Doe - Acme Corp", "") == [("Acme Corp", False)]
+
+
+def test_previous_list_is_split():
+    phrases = company_phrases("John Doe - Sales", "Current: Globex; Previous: Acme Corporation, Initech.")
+    assert ("Globex", True) in phrases
+    assert ("Acme Corporation", False) in phrases and ("Initech", False) in phrases